@@ -0,0 +1,77 @@
+# backend/benchmarks/_data.py
+
+"""
+Synthetic, deterministic event data shared by the benchmarks.
+"""
+import random
+from typing import Any, Dict, List
+
+from backend.models.event import NormalizedEvent
+
+_WORDS = "jazz comedy live night tour festival orchestra band acoustic theatre show special".split()
+
+
+def make_events(n: int, seed: int = 7) -> List[NormalizedEvent]:
+    rng = random.Random(seed)
+    events = []
+    for i in range(n):
+        day = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        low = rng.choice([0, 15, 25, 49.5, 80, 120])
+        events.append(NormalizedEvent(
+            id=f"seatgeek:{i}",
+            title=" ".join(rng.choices(_WORDS, k=4)).title(),
+            description="<p>" + " ".join(rng.choices(_WORDS, k=120)) + "</p>",
+            location="New York, NY",
+            venue_name=f"Venue {i % 300}",
+            venue_address=f"{rng.randint(1, 999)} Broadway",
+            venue_full_address=f"{rng.randint(1, 999)} Broadway, New York, NY 100{rng.randint(10, 99)}",
+            venue_type="Concert",
+            price=f"${low}–${low + 40}",
+            price_min=low,
+            price_max=low + 40,
+            ticket_url=f"https://seatgeek.com/e/{i}",
+            source="SeatGeek",
+            date=day,
+            start_date=day,
+            start_time="7:30 PM",
+            start_datetime=f"{day}T19:30:00",
+            latitude=40.6 + rng.random() * 0.3,
+            longitude=-74.1 + rng.random() * 0.3,
+            category="Music",
+            venue_phone="212-555-0100",
+            accepted_payment="Visa, Mastercard, Amex and cash at the box office only.",
+            parking_detail="Several garages within two blocks; street parking is limited.",
+        ))
+    return events
+
+
+def make_ticketmaster_payload(n: int, seed: int = 7) -> Dict[str, Any]:
+    """
+    A Ticketmaster Discovery-shaped response with `n` events.
+    """
+    rng = random.Random(seed)
+    events = []
+    for i in range(n):
+        day = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        low = rng.choice([0, 15, 25, 49.5, 80, 120])
+        events.append({
+            "id": f"TM{i:06d}",
+            "name": " ".join(rng.choices(_WORDS, k=4)).title(),
+            "url": f"https://ticketmaster.com/e/{i}",
+            "info": "<p>" + " ".join(rng.choices(_WORDS, k=120)) + " &amp; more</p>",
+            "pleaseNote": "No refunds. " * 5,
+            "priceRanges": [{"min": low, "max": low + 40}],
+            "dates": {"start": {"localDate": day, "localTime": "19:30:00"}},
+            "classifications": [{"segment": {"name": "Music"}, "genre": {"name": "Jazz"}}],
+            "_embedded": {"venues": [{
+                "name": f"Venue {i % 300}",
+                "address": {"line1": f"{rng.randint(1, 999)} Broadway"},
+                "city": {"name": "New York"},
+                "state": {"stateCode": "NY"},
+                "postalCode": "10019",
+                "location": {"latitude": str(40.6 + rng.random() * 0.3), "longitude": str(-74.1 + rng.random() * 0.3)},
+                "boxOfficeInfo": {"phoneNumberDetail": "212-555-0100", "acceptedPaymentDetail": "Visa, Mastercard"},
+                "parkingDetail": "Garages nearby.",
+            }]},
+        })
+    return {"_embedded": {"events": events}, "page": {"size": n, "totalElements": n, "number": 0}}
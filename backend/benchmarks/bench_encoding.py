@@ -0,0 +1,55 @@
+# backend/benchmarks/bench_encoding.py
+
+"""
+Encode time vs. wire size for /events/all bodies at 1k and 10k events.
+
+    python -m backend.benchmarks.bench_encoding
+"""
+import gzip
+import time
+from typing import Callable, List, Tuple
+
+from backend.benchmarks._data import make_events
+from backend.utils.encoding import JSON, MSGPACK, _HAS_BROTLI, _HAS_MSGPACK, _optional, serialize
+from backend.utils.event_utils import ALL_FIELDS, SUMMARY_FIELDS, project_event
+
+REPEAT = 5
+
+
+def _best(fn: Callable[[], bytes]) -> Tuple[float, bytes]:
+    best, out = float("inf"), b""
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def _variants(payload) -> List[Tuple[str, Callable[[], bytes]]]:
+    out = [("json", lambda: serialize(payload, JSON))]
+    for level in (1, 6, 9):
+        out.append((f"json+gzip{level}", lambda level=level: gzip.compress(serialize(payload, JSON), level)))
+    if _HAS_BROTLI:
+        for quality in (1, 4, 9):
+            out.append((f"json+br{quality}", lambda q=quality: _optional("brotli").compress(serialize(payload, JSON), quality=q)))
+    if _HAS_MSGPACK:
+        out.append(("msgpack", lambda: serialize(payload, MSGPACK)))
+        out.append(("msgpack+gzip6", lambda: gzip.compress(serialize(payload, MSGPACK), 6)))
+    return out
+
+
+def main() -> None:
+    print(f"{'events':>7} {'view':<8} {'format':<15} {'encode ms':>10} {'bytes':>11} {'vs json':>8}")
+    for n in (1_000, 10_000):
+        events = make_events(n)
+        for view, fields in (("summary", SUMMARY_FIELDS), ("full", ALL_FIELDS)):
+            payload = [project_event(e, fields) for e in events]
+            baseline = None
+            for name, fn in _variants(payload):
+                seconds, body = _best(fn)
+                baseline = baseline or len(body)
+                print(f"{n:>7} {view:<8} {name:<15} {seconds * 1000:>10.2f} {len(body):>11,} {len(body) / baseline:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# backend/benchmarks/bench_loop_lag.py
+
+"""
+Latency of small requests while upstream pages are being normalized
+concurrently, with normalization forced inline on the loop (the old
+behavior), into a thread or into the process pool, or left to the executor's
+policy ("auto"), which picks by the raw bytes each refresh has normalized.
+
+Two loads: many real-sized pages (Ticketmaster's 10-20 events per refresh,
+fanned out over keywords and sources) and a few bulk payloads of thousands
+of events. Every refresh goes through fingerprint.Refresh with a fresh index,
+so nothing is reused and each item is normalized.
+
+Probe "requests" (a short sleep plus projecting a handful of events) are due
+every PROBE_EVERY seconds on a fixed schedule; a probe's latency is how much
+later than due + PROBE_SLEEP it finished, so probes the loop couldn't even
+start on time count too. Each loader waits UPSTREAM_WAIT between pages, as
+if fetching the next one.
+
+    python -m backend.benchmarks.bench_loop_lag
+"""
+import asyncio
+import os
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+from backend.benchmarks._data import make_events, make_ticketmaster_payload
+from backend.loaders.ticketmaster_loader import _normalize_or_skip, _upstream_id
+from backend.utils import executor, fingerprint
+from backend.utils.event_utils import SUMMARY_FIELDS, project_event
+from backend.utils.fingerprint import FingerprintIndex
+
+# (name, events per page, concurrent loaders)
+LOADS: List[Tuple[str, int, int]] = [("pages", 20, 32), ("bulk", 5_000, 2)]
+DURATION = 5.0      # seconds per mode
+PROBE_EVERY = 0.01  # seconds between probe requests
+PROBE_SLEEP = 0.005
+UPSTREAM_WAIT = 0.05
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _run(page: int, loaders: int, mode: Optional[str]) -> Dict[str, float]:
+    items = make_ticketmaster_payload(page)["_embedded"]["events"]
+    small = make_events(20)
+    stop = time.perf_counter() + DURATION
+    normalized = 0
+    latencies: List[float] = []
+    fingerprint.choose_mode = (lambda work: mode) if mode else executor.choose_mode
+
+    async def loader() -> None:
+        nonlocal normalized
+        while time.perf_counter() < stop:
+            await asyncio.sleep(UPSTREAM_WAIT)
+            out, _ = await FingerprintIndex("bench").refresh("scope", items, _upstream_id, _normalize_or_skip)
+            normalized += len(out)
+
+    async def probe(due: float) -> None:
+        await asyncio.sleep(max(0.0, due + PROBE_SLEEP - time.perf_counter()))
+        [project_event(e, SUMMARY_FIELDS) for e in small]
+        latencies.append(time.perf_counter() - due - PROBE_SLEEP)
+
+    async def probes() -> None:
+        tasks = []
+        due = time.perf_counter()
+        while due < stop:
+            tasks.append(asyncio.create_task(probe(due)))
+            due += PROBE_EVERY
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        await asyncio.gather(*tasks)
+
+    started = time.perf_counter()
+    await asyncio.gather(probes(), *(loader() for _ in range(loaders)))
+    elapsed = time.perf_counter() - started
+    return {
+        "p50": statistics.median(latencies),
+        "p99": _percentile(latencies, 0.99),
+        "max": max(latencies),
+        "items_per_s": normalized / elapsed,
+    }
+
+
+async def main() -> None:
+    # Warm the pool so worker start-up isn't billed to the first process run
+    warm = make_ticketmaster_payload(100)["_embedded"]["events"]
+    await executor.normalize_items(_normalize_or_skip, warm, "process")
+
+    print(f"{os.cpu_count()} CPUs, {executor._pool_size()} pool workers; probe every {PROBE_EVERY * 1000:.0f} ms")
+    print(f"{'load':<22} {'mode':<8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'items/s':>9}")
+    for name, page, loaders in LOADS:
+        label = f"{name} ({loaders}×{page})"
+        for mode in ("inline", "thread", "process", None):
+            r = await _run(page, loaders, mode)
+            print(
+                f"{label:<22} {mode or 'auto':<8} {r['p50'] * 1000:>8.1f} {r['p99'] * 1000:>8.1f} "
+                f"{r['max'] * 1000:>8.1f} {r['items_per_s']:>9,.0f}"
+            )
+    fingerprint.choose_mode = executor.choose_mode
+    executor.shutdown_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+# backend/benchmarks/bench_startup.py
+
+"""
+Cold start and warm restart: `import backend.main` time, and time from process
+spawn to the first ready / first served /events/all response, with and without
+a warm-state snapshot on disk.
+
+    python -m backend.benchmarks.bench_startup
+"""
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from backend.benchmarks._data import make_events
+
+RUNS = 5
+CITY = "new york"
+
+_IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import backend.main; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def import_time() -> float:
+    samples = []
+    for _ in range(RUNS):
+        out = subprocess.run([sys.executable, "-c", _IMPORT_SNIPPET], capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout.strip()))
+    return statistics.median(samples)
+
+
+async def write_snapshot(path: str, n: int) -> None:
+    """
+    A snapshot as a worker serving `n` New York events would leave behind.
+    """
+    from backend.utils import env, planner, warm_state
+
+    await env._geocode_cache.set(CITY, (40.7128, -74.0060))
+    events = make_events(n)
+    await planner.index_events(events)
+    for source in planner.SOURCES:
+        await planner._event_cache.set(f"{source}|{CITY}|", [e for e in events if e.source == source])
+    warm_state.save(path)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def time_to_first_response(state_path: str, path: str) -> float:
+    port = _free_port()
+    env = {**os.environ, "WARM_STATE_PATH": state_path}
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    # One client for all polls: building one per poll costs enough CPU to skew the timing
+    client = httpx.Client(timeout=5)
+    try:
+        while True:
+            try:
+                if client.get(f"http://127.0.0.1:{port}{path}").status_code == 200:
+                    return time.perf_counter() - start
+            except httpx.TransportError:
+                pass
+            if proc.poll() is not None:
+                raise RuntimeError("uvicorn exited during startup")
+            time.sleep(0.01)
+    finally:
+        client.close()
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> None:
+    print(f"import backend.main           {import_time() * 1000:8.1f} ms (median of {RUNS})")
+    with tempfile.TemporaryDirectory() as tmp:
+        missing = os.path.join(tmp, "none.pkl")
+        print(f"cold  spawn → /ready          {time_to_first_response(missing, '/ready') * 1000:8.1f} ms")
+        for n in (1_000, 10_000):
+            snap = os.path.join(tmp, f"warm_{n}.pkl")
+            asyncio.run(write_snapshot(snap, n))
+            size_kb = os.path.getsize(snap) / 1024
+            ready = time_to_first_response(snap, "/ready")
+            served = time_to_first_response(snap, f"/events/all?city={CITY}&limit=50")
+            print(f"warm  spawn → /ready          {ready * 1000:8.1f} ms ({n:,} events, {size_kb:,.0f} KiB snapshot)")
+            print(f"warm  spawn → /events/all 200 {served * 1000:8.1f} ms ({n:,} events)")
+
+
+if __name__ == "__main__":
+    main()
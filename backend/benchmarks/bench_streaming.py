@@ -0,0 +1,69 @@
+# backend/benchmarks/bench_streaming.py
+
+"""
+Peak memory and time to normalize a Ticketmaster-shaped body: buffered
+(join the body, json.loads, then normalize) vs. streamed (ItemParser over
+the chunks, normalizing each item as it completes).
+
+    python -m backend.benchmarks.bench_streaming
+"""
+import json
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from backend.benchmarks._data import make_ticketmaster_payload
+from backend.loaders.ticketmaster_loader import normalize_ticketmaster_item
+from backend.models.event import NormalizedEvent
+from backend.utils.jsonstream import ItemParser
+
+CHUNK = 64 * 1024  # roughly what httpx hands back per read
+
+
+def buffered(chunks: List[bytes]) -> List[NormalizedEvent]:
+    data = json.loads(b"".join(chunks))
+    return [normalize_ticketmaster_item(e) for e in data["_embedded"]["events"]]
+
+
+def streamed(chunks: List[bytes]) -> List[NormalizedEvent]:
+    parser = ItemParser("_embedded.events[]")
+    out = []
+    for chunk in chunks:
+        out.extend(normalize_ticketmaster_item(e) for e in parser.feed(chunk))
+    parser.close()
+    return out
+
+
+def _measure(fn: Callable[[List[bytes]], List[NormalizedEvent]], chunks: List[bytes]) -> Tuple[int, int, float]:
+    """
+    (peak bytes, bytes still held by the result, seconds). Timed in a separate
+    untraced run, since tracemalloc slows allocation-heavy code unevenly.
+    """
+    start = time.perf_counter()
+    fn(chunks)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = fn(chunks)
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak, held, seconds
+
+
+def main() -> None:
+    print(f"{'events':>7} {'body MB':>8} {'mode':<9} {'peak MB':>8} {'result MB':>10} {'overhead MB':>12} {'ms':>8}")
+    for n in (1_000, 10_000, 50_000):
+        body = json.dumps(make_ticketmaster_payload(n)).encode()
+        chunks = [body[i:i + CHUNK] for i in range(0, len(body), CHUNK)]
+        del body
+        for name, fn in (("buffered", buffered), ("streamed", streamed)):
+            peak, held, seconds = _measure(fn, chunks)
+            print(
+                f"{n:>7} {sum(map(len, chunks)) / 1e6:>8.1f} {name:<9} {peak / 1e6:>8.1f} "
+                f"{held / 1e6:>10.1f} {(peak - held) / 1e6:>12.1f} {seconds * 1000:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
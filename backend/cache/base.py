@@ -0,0 +1,186 @@
+# backend/cache/base.py
+
+"""
+Cache backend interface shared by the in-process, SQLite and Redis backends.
+
+Keys are strings scoped by a namespace ("events", "geocodes", ...); values are
+any picklable object. `get_or_fetch` coalesces concurrent fetches inside one
+process and, through the backend's lock, across worker processes, so only one
+worker refreshes a given key while the others wait for its result.
+"""
+import asyncio
+import pickle
+import secrets
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from backend.config.settings import CACHE_LOCK_TTL, CACHE_LOCK_WAIT
+from backend.utils.loggy import get_logger
+
+logger = get_logger("cache")
+
+_POLL_INTERVAL = 0.05  # seconds between checks while another worker refreshes
+_COMPRESS_MIN_BYTES = 1024
+
+
+# ─── VALUE ENCODING ─────────────────────────────────────────────────────────────
+def encode_value(value: Any) -> bytes:
+    """
+    Pickle, zlib-compressed once it is big enough to be worth it. The first
+    byte tags which.
+    """
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(data) >= _COMPRESS_MIN_BYTES:
+        return b"z" + zlib.compress(data, 1)
+    return b"p" + data
+
+
+def decode_value(blob: bytes) -> Any:
+    tag, data = blob[:1], blob[1:]
+    if tag == b"z":
+        data = zlib.decompress(data)
+    return pickle.loads(data)
+
+
+# ─── BACKEND ────────────────────────────────────────────────────────────────────
+class CacheBackend(ABC):
+    """
+    A namespaced key/value cache with per-entry TTLs and advisory locks.
+    `get` returns None on a miss, so None itself is never cached.
+    """
+
+    def __init__(self, namespace: str, ttl: float):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        for key, value in items.items():
+            await self.set(key, value, ttl)
+
+    @abstractmethod
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        """
+        Try to take the refresh lock for `key`; returns a token, or None if
+        another holder has it.
+        """
+
+    @abstractmethod
+    async def release_lock(self, key: str, token: str) -> None:
+        ...
+
+    @staticmethod
+    def new_token() -> str:
+        return secrets.token_hex(8)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        cache_empty: bool = False,
+        on_stored: Optional[Callable[[Any], None]] = None,
+    ) -> Any:
+        """
+        Return the cached value for `key`, or fetch and cache it. Falsy results
+        are only cached when `cache_empty` is set. `on_stored(value)` is called
+        when this call fetched a value and cached it.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The caller that was fetching went away; take over the fetch
+                return await self.get_or_fetch(key, fetch, ttl, cache_empty, on_stored)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._fetch_locked(key, fetch, ttl, cache_empty, on_stored)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved, so an unawaited future doesn't warn
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float],
+        on_stored: Optional[Callable[[Any], None]],
+    ) -> None:
+        # A failed write must not cost the caller the value it just fetched
+        try:
+            await self.set(key, value, ttl)
+        except Exception as e:
+            logger.warning("Cache write failed for %s: %s", self._key(key), e)
+            return
+        if on_stored is not None:
+            on_stored(value)
+
+    async def _fetch_locked(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float],
+        cache_empty: bool,
+        on_stored: Optional[Callable[[Any], None]],
+    ) -> Any:
+        deadline = time.monotonic() + CACHE_LOCK_WAIT
+        while True:
+            token = await self.acquire_lock(key, CACHE_LOCK_TTL)
+            if token:
+                try:
+                    # Another worker may have filled it while we waited
+                    value = await self.get(key)
+                    if value is None:
+                        value = await fetch()
+                        if value or cache_empty:
+                            await self._store(key, value, ttl, on_stored)
+                    return value
+                finally:
+                    try:
+                        await self.release_lock(key, token)
+                    except Exception as e:
+                        # It expires after CACHE_LOCK_TTL anyway
+                        logger.warning("Could not release cache lock for %s: %s", self._key(key), e)
+
+            await asyncio.sleep(_POLL_INTERVAL)
+            value = await self.get(key)
+            if value is not None:
+                return value
+            if time.monotonic() > deadline:
+                # The holder is stuck or slow; don't let this request hang on it
+                return await fetch()
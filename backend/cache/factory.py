@@ -0,0 +1,56 @@
+# backend/cache/factory.py
+
+"""
+Builds namespaced caches on the backend selected by CACHE_BACKEND. All
+namespaces in a process share one SQLite connection or Redis connection.
+"""
+from typing import Dict
+
+from backend.cache.base import CacheBackend
+from backend.cache.memory import MemoryBackend
+from backend.config.settings import CACHE_BACKEND, CACHE_REDIS_URL, CACHE_SQLITE_PATH
+from backend.utils.warm_state import register_cache
+
+_stores: Dict[str, object] = {}
+
+
+def _store(kind: str):
+    store = _stores.get(kind)
+    if store is None:
+        if kind == "sqlite":
+            from backend.cache.sqlite import SQLiteStore
+            store = SQLiteStore(CACHE_SQLITE_PATH)
+        else:
+            from backend.cache.redis import RedisConnection
+            store = RedisConnection(CACHE_REDIS_URL)
+        _stores[kind] = store
+    return store
+
+
+def make_cache(namespace: str, ttl: float, maxsize: int = 1024, backend: str = CACHE_BACKEND) -> CacheBackend:
+    """
+    A cache for `namespace`. In-process caches are registered for warm-state
+    snapshots; the shared backends persist on their own. `maxsize` only bounds
+    the in-process backend.
+    """
+    if backend == "sqlite":
+        from backend.cache.sqlite import SQLiteBackend
+        cache: CacheBackend = SQLiteBackend(_store("sqlite"), namespace, ttl)
+    elif backend == "redis":
+        from backend.cache.redis import RedisBackend
+        cache = RedisBackend(_store("redis"), namespace, ttl)
+    elif backend == "memory":
+        cache = MemoryBackend(namespace, ttl, maxsize)
+        register_cache(namespace, cache.cache)
+    else:
+        raise ValueError(f"Unsupported CACHE_BACKEND: {backend!r}")
+    return cache
+
+
+async def close_caches() -> None:
+    for kind, store in _stores.items():
+        if kind == "redis":
+            await store.close()
+        else:
+            store.close()
+    _stores.clear()
@@ -0,0 +1,41 @@
+# backend/cache/memory.py
+
+"""
+Per-process backend on top of TTLCache. Each worker keeps its own copy, which
+is restored from the warm-state snapshot at boot; reads wait for that restore.
+"""
+from typing import Any, Dict, Optional
+
+from backend.cache.base import CacheBackend
+from backend.utils.cache import TTLCache
+from backend.utils.warm_state import wait_loaded
+
+
+class MemoryBackend(CacheBackend):
+    def __init__(self, namespace: str, ttl: float, maxsize: int = 1024):
+        super().__init__(namespace, ttl)
+        self.cache = TTLCache(ttl=ttl, maxsize=maxsize)
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    async def get(self, key: str) -> Optional[Any]:
+        await wait_loaded()
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.cache.set(key, value, ttl)
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        for key, value in items.items():
+            self.cache.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+    # In-flight coalescing already gives one fetch per key in this process
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        return self.new_token()
+
+    async def release_lock(self, key: str, token: str) -> None:
+        pass
@@ -0,0 +1,169 @@
+# backend/cache/redis.py
+
+"""
+Optional backend for anything that speaks the Redis protocol (RESP2): Redis,
+KeyDB, Dragonfly, or a local stand-in in development. Only GET, SET (with PX
+and NX), DEL, EVAL (to release locks) and SELECT are used, so no client
+library is required.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from backend.cache.base import CacheBackend, decode_value, encode_value
+
+
+# Delete the lock only if it still holds our token, in one atomic step
+_RELEASE_LOCK = (
+    "if redis.call('GET', KEYS[1]) == ARGV[1] then "
+    "return redis.call('DEL', KEYS[1]) else return 0 end"
+)
+
+
+class RedisError(Exception):
+    pass
+
+
+class RedisConnection:
+    """
+    A single lazily (re)connected RESP2 connection; commands are serialized
+    by a lock, which is plenty for a handful of cache calls per request.
+
+    Replies are matched to commands only by order, so a roundtrip that is cut
+    short (cancelled, an error reply, a dropped socket) drops the connection:
+    unread replies would otherwise be taken as answers to the next command.
+    """
+
+    def __init__(self, url: str):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int((parsed.path or "/0").lstrip("/") or 0)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _encode(args: List[Any]) -> bytes:
+        out = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode()
+            out.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(out)
+
+    async def _read_reply(self) -> Any:
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Redis connection closed")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RedisError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(rest)
+            if count < 0:
+                return None
+            return [await self._read_reply() for _ in range(count)]
+        raise RedisError(f"Unexpected reply: {line!r}")
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        if self.password:
+            await self._roundtrip(["AUTH", self.password])
+        if self.db:
+            await self._roundtrip(["SELECT", self.db])
+
+    async def _roundtrip(self, args: List[Any]) -> Any:
+        self._writer.write(self._encode(args))
+        await self._writer.drain()
+        return await self._read_reply()
+
+    async def execute(self, *args: Any) -> Any:
+        async with self._lock:
+            for attempt in (1, 2):
+                try:
+                    if self._writer is None:
+                        await self._connect()
+                    return await self._roundtrip(list(args))
+                except (ConnectionError, OSError, asyncio.IncompleteReadError):
+                    self._abort()
+                    if attempt == 2:
+                        raise
+                except BaseException:
+                    self._abort()
+                    raise
+
+    async def execute_many(self, commands: List[List[Any]]) -> List[Any]:
+        """
+        Pipeline several commands in one write; replies come back in order.
+        """
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    await self._connect()
+                self._writer.write(b"".join(self._encode(args) for args in commands))
+                await self._writer.drain()
+                return [await self._read_reply() for _ in commands]
+            except BaseException:
+                self._abort()
+                raise
+
+    def _abort(self) -> None:
+        if self._writer is not None:
+            self._writer.transport.abort()
+        self._reader = self._writer = None
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                try:
+                    await self._writer.wait_closed()
+                except (ConnectionError, OSError):
+                    pass
+            self._reader = self._writer = None
+
+
+class RedisBackend(CacheBackend):
+    def __init__(self, conn: RedisConnection, namespace: str, ttl: float):
+        super().__init__(namespace, ttl)
+        self.conn = conn
+
+    async def get(self, key: str) -> Optional[Any]:
+        blob = await self.conn.execute("GET", self._key(key))
+        return decode_value(blob) if blob is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ms = max(1, int((self.ttl if ttl is None else ttl) * 1000))
+        await self.conn.execute("SET", self._key(key), encode_value(value), "PX", ms)
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        if not items:
+            return
+        ms = max(1, int((self.ttl if ttl is None else ttl) * 1000))
+        await self.conn.execute_many(
+            [["SET", self._key(k), encode_value(v), "PX", ms] for k, v in items.items()]
+        )
+
+    async def delete(self, key: str) -> None:
+        await self.conn.execute("DEL", self._key(key))
+
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        token = self.new_token()
+        reply = await self.conn.execute("SET", f"lock:{self._key(key)}", token, "NX", "PX", max(1, int(ttl * 1000)))
+        return token if reply == "OK" else None
+
+    async def release_lock(self, key: str, token: str) -> None:
+        # If our lock expired and another worker took it, leave theirs alone
+        await self.conn.execute("EVAL", _RELEASE_LOCK, 1, f"lock:{self._key(key)}", token)
@@ -0,0 +1,140 @@
+# backend/cache/sqlite.py
+
+"""
+Host-wide backend: one SQLite database in WAL mode shared by every worker
+process on the box. Readers never block the writer, values are stored in the
+compact pickle/zlib encoding from backend.cache.base, and refresh locks are
+rows with an expiry, so a crashed holder can't wedge a key.
+
+sqlite3 calls block, so each one runs in a worker thread.
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from backend.cache.base import CacheBackend, decode_value, encode_value
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key     TEXT PRIMARY KEY,
+    value   BLOB NOT NULL,
+    expires REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS locks (
+    key     TEXT PRIMARY KEY,
+    token   TEXT NOT NULL,
+    expires REAL NOT NULL
+);
+"""
+
+_PURGE_EVERY = 500  # writes between sweeps of expired rows
+
+
+class SQLiteStore:
+    """
+    One connection per process, serialized by a lock; shared by all namespaces.
+    Expiry uses wall-clock time since it is compared across processes.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    @contextmanager
+    def _transaction(self, begin: str = "BEGIN") -> Iterator[None]:
+        """
+        Run the block in a transaction; the caller holds self._lock. On any
+        failure (e.g. "database is locked") roll back, or the connection stays
+        inside the transaction and every later BEGIN fails.
+        """
+        self._conn.execute(begin)
+        try:
+            yield
+            self._conn.execute("COMMIT")
+        except BaseException:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            raise
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_many(self, rows: Dict[str, bytes], ttl: float) -> None:
+        expires = time.time() + ttl
+        with self._lock, self._transaction():
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                [(k, v, expires) for k, v in rows.items()],
+            )
+            self._writes += len(rows)
+            if self._writes >= _PURGE_EVERY:
+                self._writes = 0
+                self._conn.execute("DELETE FROM cache WHERE expires <= ?", (time.time(),))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def acquire_lock(self, key: str, token: str, ttl: float) -> bool:
+        now = time.time()
+        with self._lock, self._transaction("BEGIN IMMEDIATE"):
+            self._conn.execute("DELETE FROM locks WHERE key = ? AND expires <= ?", (key, now))
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO locks (key, token, expires) VALUES (?, ?, ?)", (key, token, now + ttl)
+            )
+        return cur.rowcount == 1
+
+    def release_lock(self, key: str, token: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM locks WHERE key = ? AND token = ?", (key, token))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SQLiteBackend(CacheBackend):
+    def __init__(self, store: SQLiteStore, namespace: str, ttl: float):
+        super().__init__(namespace, ttl)
+        self.store = store
+
+    def _get(self, key: str) -> Optional[Any]:
+        blob = self.store.get(self._key(key))
+        return decode_value(blob) if blob is not None else None
+
+    def _set_many(self, items: Dict[str, Any], ttl: float) -> None:
+        self.store.set_many({self._key(k): encode_value(v) for k, v in items.items()}, ttl)
+
+    # Decoding and encoding run in the thread too: big event lists are slow to pickle
+    async def get(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self.set_many({key: value}, ttl)
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        await asyncio.to_thread(self._set_many, items, self.ttl if ttl is None else ttl)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self.store.delete, self._key(key))
+
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        token = self.new_token()
+        acquired = await asyncio.to_thread(self.store.acquire_lock, self._key(key), token, ttl)
+        return token if acquired else None
+
+    async def release_lock(self, key: str, token: str) -> None:
+        await asyncio.to_thread(self.store.release_lock, self._key(key), token)
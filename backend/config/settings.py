@@ -3,9 +3,16 @@
 import os
 from dotenv import load_dotenv
 
-# Load .env from project root
+# Load .env from project root — the only place configuration is read; every
+# other module imports its settings from here.
 load_dotenv()
 
+# Relative paths below are taken from the backend directory, not the CWD
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _backend_path(value: str) -> str:
+    return os.path.join(BACKEND_DIR, value) if value else value
+
 # ─────── SeatGeek ───────
 SEATGEEK_API_URL       = os.getenv("SEATGEEK_API_URL", "https://api.seatgeek.com/2/events")
 SEATGEEK_CLIENT_ID     = os.getenv("SEATGEEK_CLIENT_ID")
@@ -32,3 +39,65 @@ RIDB_API_KEY = os.getenv("RIDB_API_KEY")
 # ─────── Yelp ───────
 YELP_API_URL = os.getenv("YELP_API_URL", "https://api.yelp.com/v3/events")
 YELP_API_KEY = os.getenv("YELP_API_KEY")
+
+# ─────── Caching ───────
+EVENT_CACHE_TTL   = float(os.getenv("EVENT_CACHE_TTL", "300"))      # seconds per (source, city, keyword)
+GEOCODE_CACHE_TTL = float(os.getenv("GEOCODE_CACHE_TTL", "86400"))  # seconds per city
+
+# ─────── Interest planning ───────
+MAX_INTEREST_KEYWORDS = int(os.getenv("MAX_INTEREST_KEYWORDS", "5"))  # cap on fan-out per search
+
+# ─────── Pagination ───────
+SNAPSHOT_TTL  = float(os.getenv("SNAPSHOT_TTL", "600"))  # seconds a paginated result set stays addressable
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "500"))
+
+# ─────── Response encoding ───────
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))     # smaller bodies go out uncompressed
+OFFLOAD_MIN_ITEMS  = int(os.getenv("OFFLOAD_MIN_ITEMS", "1000"))      # longer lists are serialized in a thread
+OFFLOAD_MIN_BYTES  = int(os.getenv("OFFLOAD_MIN_BYTES", "262144"))    # bigger bodies are compressed in a thread
+GZIP_LEVEL         = int(os.getenv("GZIP_LEVEL", "6"))                # 1 (fast) … 9 (small)
+BROTLI_QUALITY     = int(os.getenv("BROTLI_QUALITY", "4"))            # 0 (fast) … 11 (small)
+
+# ─────── Upstream revalidation ───────
+UPSTREAM_VALIDATOR_TTL = float(os.getenv("UPSTREAM_VALIDATOR_TTL", "3600"))  # seconds ETag/Last-Modified are kept
+
+# ─────── Warm restarts ───────
+# In-memory caches are written here on shutdown and reloaded at boot; empty disables.
+# Only a file in a directory writable by this user alone is ever loaded.
+WARM_STATE_PATH = _backend_path(os.getenv("WARM_STATE_PATH", ".cache/warm_state.pkl"))
+
+# ─────── Shared cache ───────
+# "memory" (per process), "sqlite" (shared by all workers on this host) or "redis"
+CACHE_BACKEND     = os.getenv("CACHE_BACKEND", "memory").strip().lower()
+CACHE_SQLITE_PATH = _backend_path(os.getenv("CACHE_SQLITE_PATH", ".cache/shared_cache.db"))
+CACHE_REDIS_URL   = os.getenv("CACHE_REDIS_URL", "redis://127.0.0.1:6379/0")
+CACHE_LOCK_TTL    = float(os.getenv("CACHE_LOCK_TTL", "30"))   # seconds a refresh lock is held at most
+CACHE_LOCK_WAIT   = float(os.getenv("CACHE_LOCK_WAIT", "15"))  # seconds to wait on another worker's refresh
+
+# ─────── Upstream fan-out ───────
+UPSTREAM_CONCURRENCY = int(os.getenv("UPSTREAM_CONCURRENCY", "16"))  # loader calls in flight per process
+MAX_BATCH_QUERIES    = int(os.getenv("MAX_BATCH_QUERIES", "500"))
+GEOCODE_INTERVAL     = float(os.getenv("GEOCODE_INTERVAL", "1"))     # seconds between Nominatim lookups per process
+
+# ─────── Logging ───────
+LOG_LEVEL        = os.getenv("LOG_LEVEL", "INFO").strip().upper()
+LOG_FORMAT       = os.getenv("LOG_FORMAT", "text").strip().lower()  # "text" or "json" (one object per line)
+LOG_QUEUE_SIZE   = int(os.getenv("LOG_QUEUE_SIZE", "10000"))        # records awaiting the writer; more are dropped
+LOG_RATE_BURST   = int(os.getenv("LOG_RATE_BURST", "20"))           # records per message key before limiting
+LOG_RATE_PER_SEC = float(os.getenv("LOG_RATE_PER_SEC", "1"))        # sustained records per message key
+LOG_SAMPLE_EVERY = int(os.getenv("LOG_SAMPLE_EVERY", "100"))        # over the limit, keep 1 in N (0: keep none)
+
+# ─────── Live subscriptions ───────
+SUBSCRIPTION_REFRESH   = float(os.getenv("SUBSCRIPTION_REFRESH", "60"))   # fallback seconds between re-runs of a shared search
+SUBSCRIPTION_HEARTBEAT = float(os.getenv("SUBSCRIPTION_HEARTBEAT", "15")) # seconds between keep-alive comments
+
+# ─────── Normalization offload ───────
+# Sizes are raw upstream JSON per refresh; one SeatGeek/Ticketmaster event is ~2-5 KB
+NORMALIZE_THREAD_BYTES   = int(os.getenv("NORMALIZE_THREAD_BYTES", "16384"))     # below this, normalize inline as items arrive
+NORMALIZE_PROCESS_BYTES  = int(os.getenv("NORMALIZE_PROCESS_BYTES", "4194304"))  # from here on, use the process pool
+NORMALIZE_DISPATCH_BYTES = int(os.getenv("NORMALIZE_DISPATCH_BYTES", "262144"))  # offloaded items gathered per dispatch
+NORMALIZE_PROCESSES      = int(os.getenv("NORMALIZE_PROCESSES", "0"))            # process pool size; 0 = min(4, CPUs)
+
+# ─────── Event-loop lag ───────
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL", "0.1"))   # seconds between probes
+LOOP_LAG_WARN     = float(os.getenv("LOOP_LAG_WARN", "0.25"))      # log when one probe is late by this much
@@ -1,17 +1,137 @@
 # backend/loaders/seatgeek_loader.py
 
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 from datetime import datetime
-import re
 
 from backend.config.settings import (
     SEATGEEK_API_URL,
     SEATGEEK_CLIENT_ID,
     SEATGEEK_CLIENT_SECRET,
+    UPSTREAM_VALIDATOR_TTL,
 )
 from backend.models.event import NormalizedEvent
-from backend.utils.http import async_get
+from backend.utils.cache import TTLCache
+from backend.utils.http import async_get_stream, request_key
 from backend.utils.env import get_coordinates_for_city
+from backend.utils.fingerprint import FingerprintIndex
+from backend.utils.loggy import get_logger
+
+logger = get_logger("loaders.seatgeek")
+
+# request key → normalized events, reused when SeatGeek answers 304 Not Modified
+_normalized_cache = TTLCache(ttl=UPSTREAM_VALIDATOR_TTL, maxsize=1024)
+# SeatGeek id → fingerprint of the raw item and the event it normalized to
+_fingerprints = FingerprintIndex("SeatGeek")
+
+
+def normalize_seatgeek_item(item: Dict[str, Any]) -> NormalizedEvent:
+    """
+    Turn one raw SeatGeek event into a NormalizedEvent. Raises on malformed
+    items; see _normalize_or_skip.
+    """
+    # — Price formatting —
+    stats = item.get("stats", {})
+    low = stats.get("lowest_price")
+    high = stats.get("highest_price")
+    if low is not None and high is not None:
+        if low == 0 and high == 0:
+            price_str = "Free"
+        elif low == high:
+            price_str = f"${low}"
+        else:
+            price_str = f"${low}–${high}"
+    elif low is not None:
+        price_str = "Free" if low == 0 else f"Starting at ${low}"
+    else:
+        price_str = "Varies by seating/ticket tier"
+
+    # — Date & Time —
+    iso_ts = item.get("datetime_local") or item.get("datetime_utc") or ""
+    date_part = ""
+    time_part = ""
+    if iso_ts:
+        try:
+            dt = datetime.fromisoformat(iso_ts)
+            date_part = dt.strftime("%Y-%m-%d")
+            raw_time = dt.strftime("%-I:%M %p")
+            # Hide placeholder midnight
+            time_part = "" if raw_time == "12:00 AM" else raw_time
+        except ValueError:
+            parts = iso_ts.split("T", 1)
+            date_part = parts[0]
+            time_part = parts[1] if len(parts) > 1 else ""
+
+    # — Venue details —
+    venue         = item.get("venue", {}) or {}
+    loc_name      = venue.get("display_location", "")
+    # exact venue name
+    venue_name    = venue.get("name") or None
+    # street + extended address
+    street        = venue.get("address")           or None
+    extended      = venue.get("extended_address")  or None
+    if street and extended:
+        full_address = f"{street}, {extended}"
+    else:
+        full_address = extended or street
+    # event type from SeatGeek (e.g. “theater”)
+    venue_type    = item.get("type") or None
+    # —— NEW: pull primary category (first taxonomy) ——
+    taxos = item.get("taxonomies") or []
+    category = None
+    if taxos and isinstance(taxos, list):
+        # taxonomies[].name
+        category = taxos[0].get("name")
+
+    # coords
+    lat_v         = venue.get("location", {}).get("lat")
+    lon_v         = venue.get("location", {}).get("lon")    
+
+    # —— NEW: pull parking info if any passes exist ——
+    parkingDetail = None
+    for p in venue.get("passes", []) or []:
+        if p.get("pass_type") == "PARKING":
+            parkingDetail = p.get("name")
+            break
+
+
+    # — Description — HTML is stripped lazily, when a view includes it
+    description = (item.get("description") or "").strip() or "No description available."
+
+    return NormalizedEvent(
+        id                  = f"seatgeek:{item['id']}" if item.get("id") is not None else None,
+        title               = item.get("title", "No Title"),
+        description         = description,
+        location            = loc_name,
+        venue_name          = venue_name,
+        venue_address       = street,
+        venue_full_address  = full_address,
+        venue_type          = venue_type,
+        category            = category,
+        parking_detail      = parkingDetail,
+        price=price_str,
+        price_min=low,
+        price_max=high,
+        date=date_part,
+        start_date=date_part,
+        start_time=time_part,
+        start_datetime=iso_ts,
+        ticket_url=item.get("url", "") or "",
+        source="SeatGeek",
+        latitude       = lat_v,
+        longitude      = lon_v,
+    )
+
+
+def _normalize_or_skip(item: Dict[str, Any]) -> Optional[NormalizedEvent]:
+    try:
+        return normalize_seatgeek_item(item)
+    except Exception as err:
+        logger.warning("Skipping malformed SeatGeek event %s: %s", item.get("id"), err)
+        return None
+
+
+def _upstream_id(item: Dict[str, Any]) -> Optional[str]:
+    return str(item["id"]) if item.get("id") is not None else None
 
 
 async def fetch_seatgeek_events(
@@ -25,14 +145,16 @@ async def fetch_seatgeek_events(
       - price to a string (empty if unavailable)
       - date in YYYY-MM-DD
       - start_time in h:mm AM/PM (empty if unavailable)
-      - strips HTML from descriptions
+      - keeps raw descriptions (HTML is stripped on output by clean_description)
       - deduplicates events within SeatGeek results
+      - only re-normalizes items whose raw JSON changed since the last refresh
+      - streams the response, normalizing events as they arrive
     Returns [] on any failure.
     """
     # 1) Geocode the city
     coords = await get_coordinates_for_city(location)
     if not coords:
-        print(f"⚠️ SeatGeek: could not geocode '{location}'")
+        logger.warning("SeatGeek: could not geocode %r", location)
         return []
     lat, lon = coords
 
@@ -51,126 +173,38 @@ async def fetch_seatgeek_events(
         "per_page": per_page,
     }
 
-    # 3) Fetch with retries
-    try:
-        data = await async_get(SEATGEEK_API_URL, params=params)
-        if not isinstance(data, dict):
-            print("⚠️ SeatGeek: unexpected response structure")
-            return []
-    except Exception as e:
-        print(f"⚠️ SeatGeek API error: {e}")
-        return []
-
-
-    events_raw = data.get("events", [])
+    # 3) Stream the events, normalizing new or changed ones in batches (off
+    #    the loop when large) as they arrive; revalidate only when there is a
+    #    previous result to reuse
+    key = request_key(SEATGEEK_API_URL, params)
+    cached = _normalized_cache.get(key)
     normalized: List[NormalizedEvent] = []
     seen_keys = set()
 
-    for item in events_raw:
-        try:
-            # — Price formatting —
-            stats = item.get("stats", {})
-            low = stats.get("lowest_price")
-            high = stats.get("highest_price")
-            if low is not None and high is not None:
-                if low == 0 and high == 0:
-                    price_str = "Free"
-                elif low == high:
-                    price_str = f"${low}"
-                else:
-                    price_str = f"${low}–${high}"
-            elif low is not None:
-                price_str = "Free" if low == 0 else f"Starting at ${low}"
-            else:
-                price_str = "Varies by seating/ticket tier"
-
-            # — Date & Time —
-            iso_ts = item.get("datetime_local") or item.get("datetime_utc") or ""
-            date_part = ""
-            time_part = ""
-            if iso_ts:
-                try:
-                    dt = datetime.fromisoformat(iso_ts)
-                    date_part = dt.strftime("%Y-%m-%d")
-                    raw_time = dt.strftime("%-I:%M %p")
-                    # Hide placeholder midnight
-                    time_part = "" if raw_time == "12:00 AM" else raw_time
-                except ValueError:
-                    parts = iso_ts.split("T", 1)
-                    date_part = parts[0]
-                    time_part = parts[1] if len(parts) > 1 else ""
-
-            # — Venue details —
-            venue         = item.get("venue", {}) or {}
-            loc_name      = venue.get("display_location", "")
-            # exact venue name
-            venue_name    = venue.get("name") or None
-            # street + extended address
-            street        = venue.get("address")           or None
-            extended      = venue.get("extended_address")  or None
-            if street and extended:
-                full_address = f"{street}, {extended}"
-            else:
-                full_address = extended or street
-            # event type from SeatGeek (e.g. “theater”)
-            venue_type    = item.get("type") or None
-            # —— NEW: pull primary category (first taxonomy) ——
-            taxos = item.get("taxonomies") or []
-            category = None
-            if taxos and isinstance(taxos, list):
-                # taxonomies[].name
-                category = taxos[0].get("name")
-
-            # coords
-            lat_v         = venue.get("location", {}).get("lat")
-            lon_v         = venue.get("location", {}).get("lon")    
-
-            # —— NEW: pull parking info if any passes exist ——
-            parkingDetail = None
-            for p in venue.get("passes", []) or []:
-                if p.get("pass_type") == "PARKING":
-                    parkingDetail = p.get("name")
-                    break
-
-
-            # — Description cleaning —
-            raw_desc = item.get("description") or ""
-            desc_clean = re.sub(r"<[^>]+>", "", raw_desc).strip()
-            description = desc_clean if desc_clean else "No description available."
-
-            # — Deduplication key —
+    def keep(events: List[NormalizedEvent]) -> None:
+        for event in events:
             dedupe_key = (
-                item.get("title", "").strip().lower(),
-                iso_ts,
-                loc_name.strip().lower()
+                event.title.strip().lower(),
+                event.start_datetime,
+                event.location.strip().lower(),
             )
-            if dedupe_key in seen_keys:
-                continue
-            seen_keys.add(dedupe_key)
-
-            normalized.append(NormalizedEvent(
-                title               = item.get("title", "No Title"),
-                description         = item.get("description") or "No description available.",
-                location            = loc_name,
-                venue_name          = venue_name,
-                venue_address       = street,
-                venue_full_address  = full_address,
-                venue_type          = venue_type,
-                category            = category,
-                parking_detail      = parkingDetail,
-                price=price_str,
-                date=date_part,
-                start_date=date_part,
-                start_time=time_part,
-                start_datetime=iso_ts,
-                ticket_url=item.get("url", "") or "",
-                source="SeatGeek",
-                latitude       = lat_v,
-                longitude      = lon_v,
-            ))
-        except Exception as err:
-            print(f"⚠️ Skipping malformed SeatGeek event: {err}")
-            continue
+            if dedupe_key not in seen_keys:
+                seen_keys.add(dedupe_key)
+                normalized.append(event)
 
+    try:
+        async with async_get_stream(
+            SEATGEEK_API_URL, "events[]", params=params, revalidate=cached is not None
+        ) as stream:
+            if not stream.modified:
+                return cached
+            refresh = _fingerprints.start(key, _upstream_id, _normalize_or_skip)
+            async for items in stream.batches():
+                keep(await refresh.feed(i for i in items if isinstance(i, dict)))
+            keep(await refresh.finish())
+    except Exception as e:
+        logger.error("SeatGeek API failure: %s", e)
+        return []
 
+    _normalized_cache.set(key, normalized)
     return normalized
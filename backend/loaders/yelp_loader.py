@@ -1,11 +1,7 @@
-import os
 import httpx
 from typing import List
+from backend.config.settings import YELP_API_KEY
 from backend.models.event import NormalizedEvent
-from dotenv import load_dotenv
-
-load_dotenv()
-YELP_API_KEY = os.getenv("YELP_API_KEY")
 
 HEADERS = {"Authorization": f"Bearer {YELP_API_KEY}"}
 
@@ -1,20 +1,40 @@
 # backend/main.py
 
-from dotenv import load_dotenv
 import asyncio
-from fastapi import FastAPI, HTTPException
-from typing import List
+import json
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Any, Dict, List, Optional, Tuple
 
+from backend.models.batch import BatchRequest
 from backend.models.event import NormalizedEvent
-from backend.loaders.seatgeek_loader import fetch_seatgeek_events
-from backend.loaders.ticketmaster_loader import fetch_ticketmaster_events
 from backend.utils.env import get_coordinates_for_city
-from backend.utils.event_utils import dedupe, event_matches, sort_events
+from backend.utils.event_utils import (
+    ALL_FIELDS, filter_events, parse_fields, project_event,
+    result_set_digest, sort_events,
+)
+from backend.utils.planner import fetch_for_interest, get_event
+from backend.utils.batch import run_batch
+from backend.utils.clusters import (
+    MAX_ZOOM as MAX_CLUSTER_ZOOM, get_clusters, in_bbox, parse_bbox,
+)
+from backend.utils.subscriptions import SearchSpec, close_subscriptions, subscribe
+from backend.utils.pagination import (
+    ResultSnapshot, decode_cursor, get_snapshot, next_page_cursor, paginate, save_snapshot,
+)
+from backend.config.settings import MAX_PAGE_SIZE
+from backend.utils.encoding import (
+    encode_response, etag_matches, make_etag, not_modified_response,
+)
+from backend.utils.metrics import metrics
+from backend.utils.executor import shutdown_pool
+from backend.utils.loop_monitor import monitor_loop_lag
 from fastapi.middleware.cors import CORSMiddleware
-from backend.utils.loggy import get_logger
+from backend.utils.loggy import RequestIdMiddleware, get_logger
+from backend.utils import warm_state
+from backend.cache.factory import close_caches
 
-# 0) Load your .env before anything else
-load_dotenv()
+# Configuration (.env) is loaded once, by backend.config.settings
 
 logger = get_logger("main")
 
@@ -28,78 +48,301 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "X-Unlocated-Count", "ETag", "X-Request-ID"],
 )
+app.add_middleware(RequestIdMiddleware)
+
+@app.on_event("startup")
+async def restore_warm_state() -> None:
+    # Serve immediately; /ready reports when the cache snapshot is back in memory
+    app.state.warm_up = warm_state.start_warm_up()
+    app.state.loop_monitor = asyncio.create_task(monitor_loop_lag())
 
-@app.get("/events/all", response_model=List[NormalizedEvent])
+@app.on_event("shutdown")
+async def save_warm_state() -> None:
+    app.state.loop_monitor.cancel()
+    close_subscriptions()
+    shutdown_pool()
+    warm_state.shutdown()
+    await close_caches()
+    from backend.utils.http import close_client  # deferred: httpx is slow to import
+    await close_client()
+
+@app.get("/ready")
+async def get_readiness():
+    """
+    200 once warm state (cached geocodes and result sets) is loaded, else 503.
+    """
+    status = warm_state.readiness()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+@app.get("/events/all", response_model=List[Dict[str, Any]])
 async def get_all_events(
+    request: Request,
     city: str,
     interest: str = "",
     min_price: float = 0,
     max_price: float = 1500,
     radius: float = 45,
     sort_by: str = "",
-    date: str = ""
+    date: str = "",
+    limit: Optional[int] = None,
+    cursor: str = "",
+    view: str = "summary",
+    fields: str = ""
 ):
-    # 1) Geocode once
-    coords = await get_coordinates_for_city(city)
-    if not coords:
-        raise HTTPException(400, "Unable to resolve city to coordinates")
-    lat, lon = coords
+    """
+    Search every source. Without `limit` the whole sorted list is returned.
+    With `limit`, one page is returned and, if more remain, an opaque
+    `X-Next-Cursor` header; pass it back as `cursor` (with the same `limit`)
+    to page through the same result snapshot without re-fetching.
+
+    Events are returned in the compact `summary` view unless `view=full` or an
+    explicit `fields=title,price,...` list is given; `/events/{id}` has the rest.
+    Bodies are JSON, or MessagePack with `Accept: application/msgpack`, and are
+    gzip/brotli-compressed per `Accept-Encoding`. Every 200 carries a strong
+    ETag; repeat it in `If-None-Match` to get a bodyless 304 when unchanged.
+    """
+    try:
+        selected = parse_fields(fields, view.strip().lower())
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    if limit is not None and not (1 <= limit <= MAX_PAGE_SIZE):
+        raise HTTPException(400, f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    # 0) Later pages come straight from the cached snapshot
+    if cursor:
+        try:
+            snapshot_id, offset = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(400, str(e))
+        snapshot = await get_snapshot(snapshot_id)
+        if snapshot is None:
+            raise HTTPException(410, "Cursor expired; restart the search")
+        return await _page_response(request, snapshot, snapshot_id, offset, limit or MAX_PAGE_SIZE, selected)
 
-    interest = interest.strip()
     sort_by = sort_by.strip().lower()
 
     # Sanitize sort_by
     if sort_by not in {"", "price", "title"}:
         raise HTTPException(400, f"Unsupported sort_by: {sort_by}")
 
+    # 1–5) Geocode, fetch, dedupe and filter
+    filtered = await _search(city, interest, min_price, max_price, radius, date)
+
+    # 6) Sort (datetime ascending unless sort_by says otherwise). A single page
+    #    is heap-selected; the rest stays in a snapshot for later cursors.
+    #    Identical result sets hash to the same digest, which doubles as the
+    #    snapshot id and the ETag basis.
+    digest = result_set_digest(filtered, sort_by)
+    if limit is None or len(filtered) <= limit:
+        headers = _page_headers(len(filtered), None) if limit is not None else {}
+        etag = make_etag(request, f"{digest}|{','.join(selected)}")
+        if etag_matches(request, etag):
+            return not_modified_response(etag, headers)
+        payload = [project_event(e, selected) for e in sort_events(filtered, sort_by)]
+        return await encode_response(request, payload, headers, etag=etag)
+
+    snapshot = await get_snapshot(digest)
+    if snapshot is None:
+        snapshot = ResultSnapshot(filtered, sort_by)
+        await save_snapshot(snapshot, digest)
+    return await _page_response(request, snapshot, digest, 0, limit, selected)
+
+async def _search(
+    city: str,
+    interest: str,
+    min_price: float,
+    max_price: float,
+    radius: float,
+    date: str,
+) -> List[NormalizedEvent]:
+    """
+    The filtered, deduplicated events for one search; shared by /events/all
+    and /events/clusters.
+    """
+    # 1) Geocode once
+    coords = await get_coordinates_for_city(city)
+    if not coords:
+        raise HTTPException(400, "Unable to resolve city to coordinates")
+
+    interest = interest.strip()
+
     # Ensure radius is within reasonable bounds
     if radius < 0 or radius > 1000:
         raise HTTPException(400, "Radius must be between 0 and 1000 miles")
 
-    # 2) Fetch from each source exactly once, passing the raw interest string
-    results = await asyncio.gather(
-        fetch_seatgeek_events(city, interest),
-        fetch_ticketmaster_events(city, interest),
-        return_exceptions=True
+    # 2–3) Split the interest into canonical keywords, fetch each (source, keyword)
+    #      pair concurrently (cached per pair), and flatten; failures are logged
+    combined: List[NormalizedEvent] = await fetch_for_interest(city, interest)
+
+    # 4–5) Deduplicate within each source, then apply the price, radius and date filters
+    filtered = filter_events(combined, coords, min_price, max_price, radius, date)
+    logger.info("→ TOTAL combined: %d, matching: %d", len(combined), len(filtered))
+    return filtered
+
+async def _page_response(
+    request: Request,
+    snapshot: ResultSnapshot,
+    snapshot_id: str,
+    offset: int,
+    limit: int,
+    selected: Tuple[str, ...],
+) -> Response:
+    etag = make_etag(request, f"{snapshot_id}|{offset}|{limit}|{','.join(selected)}")
+    if etag_matches(request, etag):
+        next_cursor = next_page_cursor(snapshot, snapshot_id, offset, limit)
+        return not_modified_response(etag, _page_headers(len(snapshot), next_cursor))
+    page, next_cursor = paginate(snapshot, snapshot_id, offset, limit)
+    payload = [project_event(e, selected) for e in page]
+    return await encode_response(request, payload, _page_headers(len(snapshot), next_cursor), etag=etag)
+
+def _page_headers(total: int, next_cursor: Optional[str]) -> Dict[str, str]:
+    headers = {"X-Total-Count": str(total)}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return headers
+
+@app.get("/events/clusters", response_model=List[Dict[str, Any]])
+async def get_event_clusters(
+    request: Request,
+    city: str,
+    zoom: int,
+    bbox: str = "",
+    interest: str = "",
+    min_price: float = 0,
+    max_price: float = 1500,
+    radius: float = 45,
+    date: str = "",
+):
+    """
+    Map clusters for the same search as /events/all: events are gridded into
+    cells at `zoom` (0–20), and only cells whose centroid lies in `bbox`
+    ("west,south,east,north", optional) are returned. Each cluster carries
+    its count, centroid, price range and a few sample ids for /events/{id}.
+    `X-Total-Count` is the number of matching events and `X-Unlocated-Count`
+    how many of them had no coordinates. The grid is cached per zoom, so
+    panning only re-filters it.
+    """
+    if not (0 <= zoom <= MAX_CLUSTER_ZOOM):
+        raise HTTPException(400, f"zoom must be between 0 and {MAX_CLUSTER_ZOOM}")
+    try:
+        box = parse_bbox(bbox)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    filtered = await _search(city, interest, min_price, max_price, radius, date)
+    digest = result_set_digest(filtered)
+    clusters, unlocated = await get_clusters(digest, filtered, zoom)
+    headers = {"X-Total-Count": str(len(filtered)), "X-Unlocated-Count": str(unlocated)}
+    etag = make_etag(request, f"{digest}|{zoom}|{box}")
+    if etag_matches(request, etag):
+        return not_modified_response(etag, headers)
+
+    if box is not None:
+        clusters = [c for c in clusters if in_bbox(c, box)]
+    return await encode_response(request, clusters, headers, etag=etag)
+
+@app.get("/events/subscribe")
+async def subscribe_events(
+    city: str,
+    interest: str = "",
+    min_price: float = 0,
+    max_price: float = 1500,
+    radius: float = 45,
+    date: str = "",
+    view: str = "summary",
+    fields: str = "",
+) -> StreamingResponse:
+    """
+    Keep a search open as a Server-Sent Events stream instead of re-polling
+    /events/all. The first `diff` event carries the whole result set under
+    "added"; later ones only what was added, changed (full projection) or
+    removed (ids) since, whenever the underlying source data changes.
+    Subscribers to the same search share one refresh.
+    """
+    try:
+        selected = parse_fields(fields, view.strip().lower())
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    coords = await get_coordinates_for_city(city)
+    if not coords:
+        raise HTTPException(400, "Unable to resolve city to coordinates")
+    if radius < 0 or radius > 1000:
+        raise HTTPException(400, "Radius must be between 0 and 1000 miles")
+
+    spec = SearchSpec(city, interest.strip(), min_price, max_price, radius, date)
+
+    async def events():
+        yield "retry: 5000\n\n"
+        async for diff in subscribe(spec, coords, selected):
+            if diff is None:
+                yield ": keep-alive\n\n"
+            else:
+                data = json.dumps(diff, ensure_ascii=False, separators=(",", ":"))
+                yield f"event: diff\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
-    # 3) Flatten + log any loader failures
-    combined: List[NormalizedEvent] = []
-    for r in results:
-        if isinstance(r, Exception):
-            logger.warning("API error: %s", r)
-        else:
-            combined.extend(r)
-
-    # 4) Deduplicate by title+date+location (cross‑source) or by event_id if you added that
-    deduped = dedupe(combined)
-    logger.info("→ TOTAL combined:   %d", len(combined))
-    logger.info("→ TOTAL deduplicated: %d", len(deduped))
-
-    # 5) Apply client‑side filters: interest, price, radius, date
-    filtered = [
-        e for e in deduped
-        if event_matches(e, coords, min_price, max_price, radius, date)
-    ]
-
-    # 6) If no explicit sort requested, sort by start_datetime ascending:
-    if not sort_by:
-        filtered.sort(key=lambda e: e.start_datetime or "")
-    return sort_events(filtered, sort_by)
-
-@app.get("/events/seatgeek", response_model=List[NormalizedEvent])
+@app.post("/events/batch")
+async def post_events_batch(batch: BatchRequest) -> StreamingResponse:
+    """
+    Run many (city, interest, filters) searches in one call. Cities are
+    geocoded once and each (source, city, keyword) is fetched once for the
+    whole batch. Streams NDJSON, one line per query as it completes:
+    {"index", "city", "interest", "total", "events"} or {"index", "error"}.
+    """
+    async def lines():
+        async for answer in run_batch(batch.queries):
+            yield json.dumps(answer, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@app.get("/metrics")
+async def get_metrics() -> Dict[str, Any]:
+    """
+    In-process counters and timing summaries for this worker.
+    """
+    return metrics.snapshot()
+
+@app.get("/events/seatgeek", response_model=List[Dict[str, Any]])
 async def get_seatgeek_events(city: str, interest: str = ""):
-    return await fetch_seatgeek_events(city, interest)
+    from backend.loaders.seatgeek_loader import fetch_seatgeek_events
+    events = await fetch_seatgeek_events(city, interest)
+    return [project_event(e, ALL_FIELDS) for e in events]
 
 
-@app.get("/events/ticketmaster", response_model=List[NormalizedEvent])
+@app.get("/events/ticketmaster", response_model=List[Dict[str, Any]])
 async def get_ticketmaster_events(
     city: str,
     interest: str = "",
     size: int = 20
-) -> List[NormalizedEvent]:
+) -> List[Dict[str, Any]]:
     """
     Fetch Ticketmaster events by city + keyword (interest).
     """
-    return await fetch_ticketmaster_events(city, interest, size)
\ No newline at end of file
+    from backend.loaders.ticketmaster_loader import fetch_ticketmaster_events
+    events = await fetch_ticketmaster_events(city, interest, size)
+    return [project_event(e, ALL_FIELDS) for e in events]
+
+
+# Declared last so the fixed /events/<source> routes above take precedence.
+@app.get("/events/{event_id}", response_model=Dict[str, Any])
+async def get_event_detail(event_id: str, fields: str = ""):
+    """
+    Full details (description, address, box office, parking) for one event id
+    from a recent search.
+    """
+    event = await get_event(event_id)
+    if event is None:
+        raise HTTPException(404, f"Unknown or expired event id: {event_id}")
+    try:
+        selected = parse_fields(fields, "full")
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    return project_event(event, selected)
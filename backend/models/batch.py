@@ -0,0 +1,61 @@
+# backend/models/batch.py
+
+from pydantic import BaseModel, root_validator, validator
+from typing import List, Optional
+
+from backend.config.settings import MAX_BATCH_QUERIES, MAX_PAGE_SIZE
+from backend.utils.event_utils import parse_fields
+
+class BatchQuery(BaseModel):
+    """
+    One search inside a POST /events/batch call; same knobs as /events/all.
+    """
+    city: str
+    interest: str = ""
+    min_price: float = 0
+    max_price: float = 1500
+    radius: float = 45
+    sort_by: str = ""
+    date: str = ""
+    limit: Optional[int] = None
+    view: str = "summary"
+    fields: str = ""
+
+    @validator("interest", "sort_by", "view")
+    def _strip(cls, v: str) -> str:
+        return v.strip()
+
+    @validator("sort_by")
+    def _check_sort_by(cls, v: str) -> str:
+        v = v.lower()
+        if v not in {"", "price", "title"}:
+            raise ValueError(f"Unsupported sort_by: {v}")
+        return v
+
+    @validator("radius")
+    def _check_radius(cls, v: float) -> float:
+        if v < 0 or v > 1000:
+            raise ValueError("Radius must be between 0 and 1000 miles")
+        return v
+
+    @validator("limit")
+    def _check_limit(cls, v: Optional[int]) -> Optional[int]:
+        if v is not None and not (1 <= v <= MAX_PAGE_SIZE):
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        return v
+
+    @root_validator(skip_on_failure=True)
+    def _check_fields(cls, values):
+        parse_fields(values["fields"], values["view"].lower())
+        return values
+
+class BatchRequest(BaseModel):
+    queries: List[BatchQuery]
+
+    @validator("queries")
+    def _check_size(cls, v: List[BatchQuery]) -> List[BatchQuery]:
+        if not v:
+            raise ValueError("queries must not be empty")
+        if len(v) > MAX_BATCH_QUERIES:
+            raise ValueError(f"At most {MAX_BATCH_QUERIES} queries per batch")
+        return v
@@ -1,12 +1,13 @@
 # backend/models/event.py
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from typing import Optional
 
 class NormalizedEvent(BaseModel):
     """
     A standardized event model to normalize data across multiple sources (e.g., SeatGeek, Ticketmaster).
     """
+    id: Optional[str] = None  # stable "<source>:<upstream id>", e.g. "ticketmaster:G5vYZ9..."
     title: str
     description: str
     location: str             # e.g. "New York, NY"
@@ -36,3 +37,5 @@ class NormalizedEvent(BaseModel):
     accepted_payment: Optional[str] = None      # boxOfficeInfo.acceptedPaymentDetail
     parking_detail: Optional[str] = None        # parkingDetail
 
+    _digest: Optional[str] = PrivateAttr(default=None)  # content hash, see event_utils.event_digest
+
@@ -0,0 +1,29 @@
+# backend/tests/_factories.py
+
+from typing import Any
+
+from backend.models.event import NormalizedEvent
+
+
+def make_event(title: str = "Show", **fields: Any) -> NormalizedEvent:
+    """
+    A NormalizedEvent with sensible defaults; override any field by keyword.
+    """
+    date = fields.pop("date", "2026-11-01")
+    values = {
+        "title": title,
+        "description": "",
+        "location": "Austin, TX",
+        "price": "$20",
+        "ticket_url": "https://tickets.example/1",
+        "source": "SeatGeek",
+        "date": date,
+        "start_date": date,
+        "start_time": "7:30 PM",
+        "start_datetime": f"{date}T19:30:00",
+        "latitude": 30.2672,
+        "longitude": -97.7431,
+    }
+    values.update(fields)
+    return NormalizedEvent(**values)
+
@@ -0,0 +1,44 @@
+# backend/tests/conftest.py
+
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from backend.cache.memory import MemoryBackend
+from backend.config.settings import EVENT_CACHE_TTL, SNAPSHOT_TTL
+from backend.models.event import NormalizedEvent
+from backend.utils import planner
+
+
+class FakeUpstream:
+    """
+    Stands in for every planner source. `results[(source, keyword)]` is what
+    that fetch returns: a list of events, or an exception to raise. Anything
+    unset returns []. `calls` counts loader calls per (source, keyword).
+    """
+
+    def __init__(self):
+        self.results: Dict[Tuple[str, str], Any] = {}
+        self.calls: Counter = Counter()
+
+    def loader(self, source: str):
+        async def fetch(city: str, keyword: str) -> List[NormalizedEvent]:
+            self.calls[(source, keyword)] += 1
+            result = self.results.get((source, keyword), [])
+            if isinstance(result, Exception):
+                raise result
+            return [e.copy() for e in result]
+        return fetch
+
+
+@pytest.fixture
+def upstream(monkeypatch) -> FakeUpstream:
+    """
+    Fake loaders for every source, over empty result and event-id caches.
+    """
+    fake = FakeUpstream()
+    monkeypatch.setattr(planner, "_loaders", {s: fake.loader(s) for s in planner.SOURCES})
+    monkeypatch.setattr(planner, "_event_cache", MemoryBackend("events", EVENT_CACHE_TTL, 4096))
+    monkeypatch.setattr(planner, "_event_index", MemoryBackend("event_index", SNAPSHOT_TTL, 100_000))
+    return fake
@@ -0,0 +1,135 @@
+# backend/tests/test_api.py
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import main
+from backend.tests._factories import make_event
+from backend.utils import subscriptions
+from backend.utils.pagination import encode_cursor
+
+AUSTIN = (30.2672, -97.7431)
+
+
+@pytest.fixture
+def client(upstream, monkeypatch):
+    async def coordinates(city):
+        return AUSTIN if city == "Austin" else None
+
+    monkeypatch.setattr(main, "get_coordinates_for_city", coordinates)
+    # No `with`: startup (warm state, loop monitor) isn't needed here
+    return TestClient(main.app)
+
+
+def _shows(n: int):
+    return [make_event(f"Show {i}", id=f"seatgeek:{i}", date=f"2026-11-{i + 1:02d}") for i in range(n)]
+
+
+def test_repeat_search_with_its_etag_is_not_modified(client, upstream):
+    upstream.results[("SeatGeek", "")] = _shows(3)
+
+    first = client.get("/events/all", params={"city": "Austin"})
+    assert first.status_code == 200 and len(first.json()) == 3
+    etag = first.headers["ETag"]
+
+    again = client.get("/events/all", params={"city": "Austin"}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+
+    full = client.get("/events/all", params={"city": "Austin", "view": "full"}, headers={"If-None-Match": etag})
+    assert full.status_code == 200
+
+
+def test_cursor_pages_through_one_snapshot(client, upstream):
+    upstream.results[("SeatGeek", "")] = _shows(5)
+    params = {"city": "Austin", "limit": 2}
+
+    titles, cursor = [], None
+    while True:
+        page = client.get("/events/all", params={**params, "cursor": cursor} if cursor else params)
+        assert page.status_code == 200
+        assert page.headers["X-Total-Count"] == "5"
+        titles += [e["title"] for e in page.json()]
+        cursor = page.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert titles == [f"Show {i}" for i in range(5)]
+    # Later pages come from the snapshot, not the sources
+    assert upstream.calls[("SeatGeek", "")] == 1
+
+
+def test_unknown_or_malformed_cursor(client):
+    expired = client.get("/events/all", params={"city": "Austin", "limit": 2, "cursor": encode_cursor("gone", 2)})
+    assert expired.status_code == 410
+    malformed = client.get("/events/all", params={"city": "Austin", "limit": 2, "cursor": "!!"})
+    assert malformed.status_code == 400
+
+
+def test_event_detail_after_a_search(client, upstream):
+    upstream.results[("SeatGeek", "")] = [make_event("Jazz night", id="seatgeek:7", description="<b>Live</b>")]
+
+    summary = client.get("/events/all", params={"city": "Austin"}).json()
+    assert "description" not in summary[0]
+
+    detail = client.get("/events/seatgeek:7")
+    assert detail.status_code == 200
+    assert detail.json()["description"] == "Live"
+    assert client.get("/events/seatgeek:7", params={"fields": "title"}).json() == {
+        "id": "seatgeek:7", "title": "Jazz night",
+    }
+    assert client.get("/events/seatgeek:404").status_code == 404
+
+
+def test_clusters_endpoint(client, upstream):
+    upstream.results[("SeatGeek", "")] = _shows(3) + [make_event("Nowhere", latitude=None, longitude=None)]
+    params = {"city": "Austin", "zoom": 8}
+
+    response = client.get("/events/clusters", params=params)
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "4"
+    assert response.headers["X-Unlocated-Count"] == "1"
+    [cluster] = response.json()
+    assert cluster["count"] == 3
+    assert cluster["price_min"] == cluster["price_max"] == 20.0
+
+    outside = client.get("/events/clusters", params={**params, "bbox": "0,0,1,1"})
+    assert outside.json() == []
+    assert client.get("/events/clusters", params={**params, "zoom": 21}).status_code == 400
+    assert client.get("/events/clusters", params={**params, "bbox": "1,2,3"}).status_code == 400
+
+
+def test_subscribe_validates_before_streaming(client):
+    assert client.get("/events/subscribe", params={"city": "Nowhere"}).status_code == 400
+    assert client.get("/events/subscribe", params={"city": "Austin", "fields": "nope"}).status_code == 400
+
+
+def test_subscribe_streams_the_first_diff(upstream, monkeypatch):
+    upstream.results[("SeatGeek", "")] = [make_event("Jazz night", id="seatgeek:7")]
+    monkeypatch.setattr(subscriptions, "SUBSCRIPTION_REFRESH", 3600.0)
+
+    async def coordinates(city):
+        return AUSTIN
+
+    monkeypatch.setattr(main, "get_coordinates_for_city", coordinates)
+
+    async def scenario():
+        # The stream never ends, so read it from the endpoint instead of a client
+        response = await main.subscribe_events(city="Austin", fields="title")
+        assert response.media_type == "text/event-stream"
+        body = response.body_iterator
+        try:
+            assert await body.__anext__() == "retry: 5000\n\n"
+            frame = await asyncio.wait_for(body.__anext__(), 2)
+        finally:
+            await body.aclose()
+        return frame
+
+    event, data = asyncio.run(scenario()).strip().split("\n")
+    assert event == "event: diff"
+    diff = json.loads(data[len("data: "):])
+    assert diff["added"] == [{"id": "seatgeek:7", "title": "Jazz night"}]
@@ -0,0 +1,55 @@
+# backend/tests/test_batch.py
+
+import asyncio
+from collections import Counter
+from typing import Optional, Tuple
+
+from backend.models.batch import BatchQuery
+from backend.tests._factories import make_event
+from backend.utils import batch, planner
+from backend.utils.batch import run_batch
+
+
+def test_batch_shares_geocodes_and_fetches(upstream, monkeypatch):
+    for source in planner.SOURCES:
+        for kw in ("jazz", "comedy"):
+            upstream.results[(source, kw)] = [
+                make_event(f"{source} {kw} {i}", source=source, price=f"${10 * i}")
+                for i in range(1, 4)
+            ]
+    geocodes: Counter = Counter()
+
+    async def locate(city: str) -> Optional[Tuple[float, float]]:
+        geocodes[city] += 1
+        return None if city == "Nowhere" else (30.2672, -97.7431)
+
+    monkeypatch.setattr(batch, "get_coordinates_for_city", locate)
+    queries = [
+        BatchQuery(city="Austin", interest="jazz", sort_by="price", limit=2, fields="title,price"),
+        BatchQuery(city="AUSTIN ", interest="jazz comedy", max_price=20),
+        BatchQuery(city="Nowhere", interest="jazz"),
+    ]
+
+    async def scenario():
+        return [answer async for answer in run_batch(queries)]
+
+    answers = {a["index"]: a for a in asyncio.run(scenario())}
+    assert sorted(answers) == [0, 1, 2]
+
+    # Both queries in Austin share one geocode and the "jazz" fetches
+    assert sum(geocodes.values()) == 2
+    assert upstream.calls == {
+        ("SeatGeek", "jazz"): 1, ("Ticketmaster", "jazz"): 1,
+        ("SeatGeek", "comedy"): 1, ("Ticketmaster", "comedy"): 1,
+    }
+
+    first = answers[0]
+    assert first["total"] == 6
+    assert [e["price"] for e in first["events"]] == ["$10", "$10"]
+    assert set(first["events"][0]) == {"id", "title", "price"}
+
+    second = answers[1]
+    assert second["total"] == 8  # $10 and $20 from each of four fetches
+    assert all("snippet" in e for e in second["events"])
+
+    assert answers[2]["error"] == "Unable to resolve city to coordinates"
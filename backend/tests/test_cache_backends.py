@@ -0,0 +1,314 @@
+# backend/tests/test_cache_backends.py
+
+import asyncio
+import sqlite3
+from typing import Dict, List, Optional
+
+import pytest
+
+from backend.cache.memory import MemoryBackend
+from backend.cache.redis import RedisBackend, RedisConnection
+from backend.cache.sqlite import SQLiteBackend, SQLiteStore
+
+
+# ─── FAKE RESP SERVER ─────────────────────────────────────────────────────────
+class FakeRedis:
+    """
+    Just enough of a RESP2 server for RedisConnection: GET, SET (PX, NX), DEL,
+    SELECT and the lock-release EVAL. Keys listed in `slow` are answered after
+    `delay` seconds, to cancel commands mid-roundtrip.
+    """
+
+    def __init__(self):
+        self.data: Dict[bytes, bytes] = {}
+        self.commands: List[List[bytes]] = []
+        self.slow: Dict[bytes, float] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.port = 0
+
+    async def start(self) -> "FakeRedis":
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.port}/0"
+
+    async def _read_command(self, reader: asyncio.StreamReader) -> List[bytes]:
+        count = int((await reader.readline())[1:-2])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    def _answer(self, args: List[bytes]) -> bytes:
+        cmd = args[0].upper()
+        if cmd == b"GET":
+            value = self.data.get(args[1])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        if cmd == b"SET":
+            options = [a.upper() for a in args[3:]]
+            if b"NX" in options and args[1] in self.data:
+                return b"$-1\r\n"
+            self.data[args[1]] = args[2]
+            return b"+OK\r\n"
+        if cmd == b"DEL":
+            return b":%d\r\n" % sum(self.data.pop(k, None) is not None for k in args[1:])
+        if cmd == b"EVAL":
+            key, token = args[3], args[4]
+            if self.data.get(key) == token:
+                del self.data[key]
+                return b":1\r\n"
+            return b":0\r\n"
+        if cmd == b"SELECT":
+            return b"+OK\r\n"
+        return b"-ERR unknown command\r\n"
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                args = await self._read_command(reader)
+                self.commands.append(args)
+                delay = self.slow.get(args[1]) if len(args) > 1 else None
+                if delay:
+                    await asyncio.sleep(delay)
+                writer.write(self._answer(args))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+# ─── BACKENDS ───────────────────────────────────────────────────────────────────
+@pytest.fixture(params=["memory", "sqlite"])
+def make_backend(request, tmp_path):
+    stores = []
+
+    def make(namespace: str = "events", ttl: float = 60):
+        if request.param == "memory":
+            return MemoryBackend(namespace, ttl)
+        if not stores:
+            stores.append(SQLiteStore(str(tmp_path / "cache.db")))
+        return SQLiteBackend(stores[0], namespace, ttl)
+
+    yield make
+    for store in stores:
+        store.close()
+
+
+def test_set_get_delete(make_backend):
+    async def scenario():
+        cache = make_backend()
+        assert await cache.get("k") is None
+        await cache.set("k", {"events": [1, 2, 3]})
+        assert await cache.get("k") == {"events": [1, 2, 3]}
+        await cache.set_many({"a": "x" * 5000, "b": 2})
+        assert await cache.get("a") == "x" * 5000
+        assert await cache.get("b") == 2
+        await cache.delete("k")
+        assert await cache.get("k") is None
+
+    asyncio.run(scenario())
+
+
+def test_entries_expire(make_backend):
+    async def scenario():
+        cache = make_backend()
+        await cache.set("k", "v", ttl=0.05)
+        assert await cache.get("k") == "v"
+        await asyncio.sleep(0.1)
+        assert await cache.get("k") is None
+
+    asyncio.run(scenario())
+
+
+def test_namespaces_are_separate(make_backend):
+    async def scenario():
+        events, geocodes = make_backend("events"), make_backend("geocodes")
+        await events.set("austin", "events")
+        assert await geocodes.get("austin") is None
+
+    asyncio.run(scenario())
+
+
+def test_get_or_fetch_coalesces_and_skips_empty(make_backend):
+    async def scenario():
+        cache = make_backend()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return ["event"]
+
+        results = await asyncio.gather(*(cache.get_or_fetch("k", fetch) for _ in range(5)))
+        assert results == [["event"]] * 5
+        assert calls == 1
+        assert await cache.get_or_fetch("k", fetch) == ["event"]
+        assert calls == 1
+
+        async def empty():
+            return []
+
+        assert await cache.get_or_fetch("e", empty) == []
+        assert await cache.get("e") is None
+
+    asyncio.run(scenario())
+
+
+def test_sqlite_lock_is_exclusive_until_released_or_expired(tmp_path):
+    async def scenario():
+        store = SQLiteStore(str(tmp_path / "cache.db"))
+        a, b = SQLiteBackend(store, "events", 60), SQLiteBackend(store, "events", 60)
+        token = await a.acquire_lock("k", ttl=30)
+        assert token
+        assert await b.acquire_lock("k", ttl=30) is None
+        await b.release_lock("k", "not-the-token")
+        assert await b.acquire_lock("k", ttl=30) is None
+        await a.release_lock("k", token)
+        assert await b.acquire_lock("k", ttl=0.05)
+        await asyncio.sleep(0.1)
+        assert await a.acquire_lock("k", ttl=30)
+        store.close()
+
+    asyncio.run(scenario())
+
+
+def test_sqlite_is_shared_between_stores(tmp_path):
+    # Two stores on one file stand in for two worker processes
+    async def scenario():
+        path = str(tmp_path / "cache.db")
+        first, second = SQLiteStore(path), SQLiteStore(path)
+        await SQLiteBackend(first, "events", 60).set("k", [1, 2])
+        assert await SQLiteBackend(second, "events", 60).get("k") == [1, 2]
+        first.close()
+        second.close()
+
+    asyncio.run(scenario())
+
+
+def test_sqlite_recovers_from_a_failed_write(tmp_path):
+    path = str(tmp_path / "cache.db")
+    store = SQLiteStore(path)
+    store._conn.execute("PRAGMA busy_timeout = 0")
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")  # another worker holds the write lock
+
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        store.set_many({"k": b"v"}, ttl=60)
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        store.acquire_lock("k", "token", ttl=30)
+    assert not store._conn.in_transaction
+
+    other.execute("ROLLBACK")
+    store.set_many({"k": b"v"}, ttl=60)
+    assert store.get("k") == b"v"
+    assert store.acquire_lock("k", "token", ttl=30)
+    other.close()
+    store.close()
+
+
+def test_failed_cache_write_still_returns_the_fetched_value():
+    class BrokenWrites(MemoryBackend):
+        async def set(self, key, value, ttl=None):
+            raise sqlite3.OperationalError("database is locked")
+
+    async def scenario():
+        stored = []
+        cache = BrokenWrites("events", 60)
+
+        async def fetch():
+            return ["event"]
+
+        assert await cache.get_or_fetch("k", fetch, on_stored=stored.append) == ["event"]
+        assert stored == []
+
+    asyncio.run(scenario())
+
+
+# ─── RESP CLIENT ────────────────────────────────────────────────────────────────
+def test_redis_backend_roundtrip():
+    async def scenario():
+        server = await FakeRedis().start()
+        conn = RedisConnection(server.url)
+        cache = RedisBackend(conn, "events", 60)
+        await cache.set("k", {"a": 1})
+        assert await cache.get("k") == {"a": 1}
+        await cache.set_many({"x": 1, "y": "z" * 5000})
+        assert await cache.get("y") == "z" * 5000
+        await cache.delete("k")
+        assert await cache.get("k") is None
+        assert server.commands[0][:2] == [b"SET", b"events:k"]
+        await conn.close()
+        await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_redis_cancelled_command_does_not_leak_its_reply():
+    async def scenario():
+        server = await FakeRedis().start()
+        conn = RedisConnection(server.url)
+        cache = RedisBackend(conn, "events", 60)
+        await cache.set_many({"A": "value of A", "B": "value of B"})
+        server.slow[b"events:A"] = 0.1
+
+        task = asyncio.create_task(cache.get("A"))
+        await asyncio.sleep(0.02)  # GET A is written, its reply not yet read
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert await cache.get("B") == "value of B"
+        await asyncio.sleep(0.15)  # A's late reply must not surface either
+        assert await cache.get("B") == "value of B"
+        await conn.close()
+        await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_redis_reconnects_after_server_restart():
+    async def scenario():
+        server = await FakeRedis().start()
+        conn = RedisConnection(server.url)
+        cache = RedisBackend(conn, "events", 60)
+        await cache.set("k", 1)
+        conn._writer.transport.abort()  # the server side went away
+        assert await cache.get("k") == 1
+        await conn.close()
+        await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_redis_release_lock_only_deletes_own_token():
+    async def scenario():
+        server = await FakeRedis().start()
+        conn = RedisConnection(server.url)
+        a, b = RedisBackend(conn, "events", 60), RedisBackend(conn, "events", 60)
+        token = await a.acquire_lock("k", ttl=30)
+        assert token
+        assert await b.acquire_lock("k", ttl=30) is None
+
+        # a's lock expires and b takes it over; a's late release must not free b's
+        server.data.pop(b"lock:events:k")
+        other = await b.acquire_lock("k", ttl=30)
+        await a.release_lock("k", token)
+        assert server.data[b"lock:events:k"] == other.encode()
+        assert [c[0] for c in server.commands if c[0] in (b"GET", b"DEL", b"EVAL")] == [b"EVAL"]
+
+        await b.release_lock("k", other)
+        assert b"lock:events:k" not in server.data
+        await conn.close()
+        await server.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,85 @@
+# backend/tests/test_clusters.py
+
+import asyncio
+
+import pytest
+
+from backend.tests._factories import make_event
+from backend.utils.clusters import build_clusters, cell_size, get_clusters, in_bbox, parse_bbox
+
+
+def test_cells_halve_with_each_zoom_level():
+    assert cell_size(0) == 90.0
+    assert cell_size(10) == cell_size(9) / 2
+
+
+def test_parse_bbox():
+    assert parse_bbox("") is None
+    assert parse_bbox("-98, 30, -97, 31") == (-98.0, 30.0, -97.0, 31.0)
+    for bad in ("1,2,3", "a,b,c,d", "-98,31,-97,30", "-181,30,-97,31"):
+        with pytest.raises(ValueError):
+            parse_bbox(bad)
+
+
+def test_build_clusters_groups_counts_and_prices():
+    events = [
+        make_event("A", id="x:a", latitude=30.26, longitude=-97.74, price="$10", date="2026-11-03"),
+        make_event("B", id="x:b", latitude=30.27, longitude=-97.75, price="$40", date="2026-11-01"),
+        make_event("C", id="x:c", latitude=40.71, longitude=-74.00, price="$25"),
+        make_event("D", id="x:d", latitude=None, longitude=None),
+        make_event("E", id="x:e", latitude=95.0, longitude=0.0),
+    ]
+    clusters, unlocated = build_clusters(events, zoom=8)
+    assert unlocated == 2
+    assert [c["count"] for c in clusters] == [2, 1]
+    austin = clusters[0]
+    assert (austin["price_min"], austin["price_max"]) == (10.0, 40.0)
+    assert austin["sample_ids"] == ["x:b", "x:a"]  # soonest first
+    assert austin["lat"] == pytest.approx(30.265)
+    west, south, east, north = austin["bounds"]
+    assert west <= austin["lon"] <= east and south <= austin["lat"] <= north
+    assert sum(c["count"] for c in clusters) + unlocated == len(events)
+
+
+def test_structured_prices_win_over_the_price_string():
+    event = make_event(price="$5", price_min=12.0, price_max=30.0)
+    clusters, _ = build_clusters([event], zoom=3)
+    assert (clusters[0]["price_min"], clusters[0]["price_max"]) == (12.0, 30.0)
+
+
+def test_events_without_a_numeric_price_stay_out_of_the_range():
+    here = {"latitude": 30.26, "longitude": -97.74}
+    events = [
+        make_event("A", price="Varies by seating/ticket tier", **here),
+        make_event("B", price="$10–$20", **here),
+        make_event("C", price="$35", **here),
+        make_event("D", price="Free", latitude=40.71, longitude=-74.0),
+        make_event("E", price="TBA", latitude=47.6, longitude=-122.3),
+    ]
+    austin, new_york, seattle = sorted(build_clusters(events, zoom=8)[0], key=lambda c: c["lat"])
+    assert austin["count"] == 3
+    assert (austin["price_min"], austin["price_max"]) == (35.0, 35.0)
+    assert (new_york["price_min"], new_york["price_max"]) == (0.0, 0.0)
+    assert (seattle["price_min"], seattle["price_max"]) == (None, None)
+
+
+def test_grids_are_cached_per_result_set_and_zoom():
+    events = [make_event(latitude=30.26, longitude=-97.74)]
+
+    async def scenario():
+        first = await get_clusters("digest-x", events, 6)
+        assert await get_clusters("digest-x", [], 6) == first
+        assert first[0][0]["count"] == 1
+        assert await get_clusters("digest-x", [], 7) == ([], 0)
+
+    asyncio.run(scenario())
+
+
+def test_in_bbox_handles_the_antimeridian():
+    fiji = {"lat": -17.7, "lon": 178.0}
+    samoa = {"lat": -13.8, "lon": -172.1}
+    pacific = (170.0, -20.0, -170.0, -10.0)
+    assert in_bbox(fiji, pacific) and in_bbox(samoa, pacific)
+    assert not in_bbox({"lat": -15.0, "lon": 0.0}, pacific)
+    assert not in_bbox({"lat": 0.0, "lon": 178.0}, pacific)
+    assert in_bbox({"lat": 30.2, "lon": -97.7}, (-98.0, 30.0, -97.0, 31.0))
@@ -0,0 +1,103 @@
+# backend/tests/test_conditional.py
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from starlette.requests import Request
+
+from backend.loaders import seatgeek_loader
+from backend.utils import http
+from backend.utils.cache import TTLCache
+from backend.utils.encoding import etag_matches, make_etag
+from backend.utils.fingerprint import FingerprintIndex
+
+URL = "https://upstream.example/events"
+
+
+def _request(**headers: str) -> Request:
+    raw = [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+class Upstream:
+    """
+    A MockTransport server: 200 with an ETag, 304 when it's sent back.
+    `seen` records the If-None-Match header of every request.
+    """
+
+    def __init__(self, items):
+        self.body = json.dumps({"events": items}).encode()
+        self.etag = '"v1"'
+        self.seen = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        sent = request.headers.get("If-None-Match")
+        self.seen.append(sent)
+        if sent == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(200, headers={"ETag": self.etag}, content=self.body)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    upstream = Upstream([{"id": 1, "title": "Jazz Night", "stats": {"lowest_price": 15}}])
+    monkeypatch.setattr(http, "_stream_validators", TTLCache(ttl=60, maxsize=16))
+    monkeypatch.setattr(http, "get_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(upstream.handle)))
+    return upstream
+
+
+async def _read(revalidate: bool):
+    async with http.async_get_stream(URL, "events[]", {"q": "jazz"}, revalidate=revalidate) as stream:
+        return stream.modified, [item async for item in stream]
+
+
+def test_etag_depends_on_representation():
+    plain = make_etag(_request(), "digest")
+    assert plain == make_etag(_request(), "digest")
+    assert plain != make_etag(_request(), "other")
+    assert plain != make_etag(_request(accept_encoding="gzip"), "digest")
+    assert plain.startswith('"') and plain.endswith('"')
+
+
+def test_if_none_match():
+    etag = '"abc"'
+    assert not etag_matches(_request(), etag)
+    assert etag_matches(_request(if_none_match='"x", "abc"'), etag)
+    assert etag_matches(_request(if_none_match='W/"abc"'), etag)
+    assert etag_matches(_request(if_none_match="*"), etag)
+    assert not etag_matches(_request(if_none_match='"abcd"'), etag)
+
+
+def test_stream_stores_validators_and_revalidates(server):
+    modified, items = asyncio.run(_read(revalidate=True))
+    assert modified and [i["id"] for i in items] == [1]
+    assert http._stream_validators.get(http.request_key(URL, {"q": "jazz"})) == ('"v1"', None)
+
+    modified, items = asyncio.run(_read(revalidate=True))
+    assert not modified and items == []
+    assert server.seen == [None, '"v1"']
+
+
+def test_stream_without_revalidate_sends_no_validators(server):
+    asyncio.run(_read(revalidate=True))
+    modified, items = asyncio.run(_read(revalidate=False))
+    assert modified and len(items) == 1
+    assert server.seen == [None, None]
+
+
+def test_loader_reuses_its_normalized_events_on_304(server, monkeypatch):
+    async def coordinates(city):
+        return 30.2672, -97.7431
+
+    monkeypatch.setattr(seatgeek_loader, "get_coordinates_for_city", coordinates)
+    monkeypatch.setattr(seatgeek_loader, "_normalized_cache", TTLCache(ttl=60, maxsize=16))
+    monkeypatch.setattr(seatgeek_loader, "_fingerprints", FingerprintIndex("SeatGeek"))
+
+    first = asyncio.run(seatgeek_loader.fetch_seatgeek_events("Austin", "jazz"))
+    second = asyncio.run(seatgeek_loader.fetch_seatgeek_events("Austin", "jazz"))
+
+    assert [e.title for e in first] == ["Jazz Night"]
+    assert second is first
+    assert server.seen == [None, '"v1"']
@@ -0,0 +1,63 @@
+# backend/tests/test_encoding.py
+
+import asyncio
+import gzip
+import json
+
+import pytest
+from starlette.requests import Request
+
+from backend.utils import encoding
+from backend.utils.encoding import (
+    JSON, MSGPACK, encode_response, negotiate_encoding, negotiate_media_type,
+)
+
+
+def _request(**headers: str) -> Request:
+    raw = [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_msgpack_only_when_asked_for(monkeypatch):
+    monkeypatch.setattr(encoding, "_HAS_MSGPACK", True)
+    assert negotiate_media_type("") == JSON
+    assert negotiate_media_type("*/*") == JSON
+    assert negotiate_media_type("application/msgpack") == MSGPACK
+    assert negotiate_media_type("application/json;q=0.5, application/x-msgpack") == MSGPACK
+    assert negotiate_media_type("application/json, application/msgpack;q=0.8") == JSON
+    monkeypatch.setattr(encoding, "_HAS_MSGPACK", False)
+    assert negotiate_media_type("application/msgpack") == JSON
+
+
+def test_encoding_preference_and_fallback(monkeypatch):
+    monkeypatch.setattr(encoding, "_HAS_BROTLI", True)
+    assert negotiate_encoding("gzip, br") == "br"
+    assert negotiate_encoding("br;q=0, gzip") == "gzip"
+    assert negotiate_encoding("*") == "br"
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("") is None
+    monkeypatch.setattr(encoding, "_HAS_BROTLI", False)
+    assert negotiate_encoding("br, gzip") == "gzip"
+    assert negotiate_encoding("br") is None
+
+
+def test_large_bodies_are_compressed_small_ones_are_not():
+    payload = [{"title": f"Show {i}", "price": "$20"} for i in range(200)]
+
+    big = asyncio.run(encode_response(_request(accept_encoding="gzip"), payload, etag='"t"'))
+    assert big.headers["content-encoding"] == "gzip"
+    assert big.headers["etag"] == '"t"'
+    assert "Accept-Encoding" in big.headers["vary"]
+    assert json.loads(gzip.decompress(big.body)) == payload
+
+    small = asyncio.run(encode_response(_request(accept_encoding="gzip"), payload[:1]))
+    assert "content-encoding" not in small.headers
+    assert json.loads(small.body) == payload[:1]
+
+
+def test_msgpack_body_round_trips():
+    msgpack = pytest.importorskip("msgpack")
+    payload = [{"title": "Show", "price_min": 12.5}]
+    response = asyncio.run(encode_response(_request(accept="application/msgpack"), payload))
+    assert response.media_type == MSGPACK
+    assert msgpack.unpackb(response.body) == payload
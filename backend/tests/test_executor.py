@@ -0,0 +1,90 @@
+# backend/tests/test_executor.py
+
+import asyncio
+import threading
+
+import pytest
+
+from backend.tests._factories import make_event
+from backend.utils import executor, fingerprint
+from backend.utils.executor import choose_mode, normalize_items, shutdown_pool
+from backend.utils.fingerprint import FingerprintIndex
+
+
+@pytest.fixture
+def thresholds(monkeypatch):
+    monkeypatch.setattr(executor, "NORMALIZE_THREAD_BYTES", 1_000)
+    monkeypatch.setattr(executor, "NORMALIZE_PROCESS_BYTES", 100_000)
+    monkeypatch.setattr(executor, "NORMALIZE_PROCESSES", 2)
+
+
+def test_mode_follows_the_work_done_by_the_refresh(thresholds, monkeypatch):
+    assert choose_mode(0) == "inline"
+    assert choose_mode(999) == "inline"
+    assert choose_mode(1_000) == "thread"
+    assert choose_mode(100_000) == "process"
+    # One pool worker can't run beside the loop's own process
+    monkeypatch.setattr(executor, "NORMALIZE_PROCESSES", 1)
+    assert choose_mode(100_000) == "thread"
+
+
+def test_default_thresholds_offload_a_real_upstream_page():
+    # 10 Ticketmaster events of ~2 KB each
+    assert choose_mode(10 * 2_000) == "thread"
+    assert choose_mode(2 * 2_000) == "inline"
+
+
+@pytest.mark.parametrize("mode, on_loop_thread", [("inline", True), ("thread", False)])
+def test_normalize_items_keeps_order(mode, on_loop_thread):
+    threads = set()
+
+    def normalize(item):
+        threads.add(threading.get_ident())
+        return item * 2
+
+    async def scenario():
+        return await normalize_items(normalize, list(range(50)), mode), threading.get_ident()
+
+    out, loop_thread = asyncio.run(scenario())
+    assert out == [i * 2 for i in range(50)]
+    assert (threads == {loop_thread}) is on_loop_thread
+
+
+def test_process_pool_keeps_order(thresholds):
+    try:
+        out = asyncio.run(normalize_items(str, list(range(101)), "process"))
+    finally:
+        shutdown_pool()
+    assert out == [str(i) for i in range(101)]
+
+
+def test_empty_batch():
+    assert asyncio.run(normalize_items(str, [])) == []
+
+
+def test_refresh_normalizes_inline_until_its_work_grows(thresholds, monkeypatch):
+    modes = []
+
+    async def spy(normalize, items, mode="inline"):
+        modes.append((len(items), mode))
+        return await normalize_items(normalize, items, mode)
+
+    monkeypatch.setattr(fingerprint, "normalize_items", spy)
+
+    items = [{"id": str(i), "title": f"show {i}", "pad": "x" * 200} for i in range(12)]
+
+    async def scenario():
+        run = FingerprintIndex("test").start("scope", lambda i: i["id"], lambda i: make_event(i["title"]))
+        run.dispatch_bytes = 1_500
+        ready = [len(await run.feed(items[i:i + 2])) for i in range(0, 12, 2)]
+        ready.append(len(await run.finish()))
+        return ready
+
+    ready = asyncio.run(scenario())
+
+    # ~250 bytes per item: the first four are normalized inline as they
+    # arrive, the rest gathered and handed to a thread
+    assert modes[:2] == [(2, "inline"), (2, "inline")]
+    assert {mode for _, mode in modes[2:]} == {"thread"}
+    assert ready[:2] == [2, 2]
+    assert sum(ready) == 12
@@ -0,0 +1,104 @@
+# backend/tests/test_fingerprint.py
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from backend.models.event import NormalizedEvent
+from backend.tests._factories import make_event
+from backend.utils.fingerprint import FingerprintIndex, fingerprint
+
+normalized: List[str] = []
+
+
+def _id(item: Dict[str, Any]) -> Optional[str]:
+    return item.get("id")
+
+
+def _normalize(item: Dict[str, Any]) -> Optional[NormalizedEvent]:
+    if item.get("broken"):
+        return None
+    normalized.append(item["id"])
+    return make_event(item["title"])
+
+
+def _items(*ids: str, title: str = "show") -> List[Dict[str, Any]]:
+    return [{"id": i, "title": f"{title} {i}"} for i in ids]
+
+
+def _refresh(index: FingerprintIndex, scope: str, items: List[Dict[str, Any]]):
+    normalized.clear()
+    return asyncio.run(index.refresh(scope, items, _id, _normalize))
+
+
+def test_fingerprint_tracks_content():
+    assert fingerprint({"a": 1}) == fingerprint({"a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+def test_unchanged_items_are_reused():
+    index = FingerprintIndex("test")
+    events, stats = _refresh(index, "q", _items("a", "b", "c"))
+    assert [e.title for e in events] == ["show a", "show b", "show c"]
+    assert (stats.added, stats.changed, stats.unchanged, stats.removed, stats.reused) == (3, 0, 0, 0, 0)
+
+    again, stats = _refresh(index, "q", _items("a", "b", "c"))
+    assert normalized == []
+    assert [id(e) for e in again] == [id(e) for e in events]
+    assert (stats.added, stats.changed, stats.unchanged, stats.removed, stats.reused) == (0, 0, 3, 0, 3)
+
+
+def test_changed_added_and_removed():
+    index = FingerprintIndex("test")
+    _refresh(index, "q", _items("a", "b", "c"))
+    items = _items("a", "c", "d")
+    items[1]["title"] = "moved c"
+    events, stats = _refresh(index, "q", items)
+    assert normalized == ["c", "d"]
+    assert [e.title for e in events] == ["show a", "moved c", "show d"]
+    assert (stats.added, stats.changed, stats.unchanged, stats.removed) == (1, 1, 1, 1)
+
+
+def test_counts_balance_when_an_event_moves_between_scopes():
+    index = FingerprintIndex("test")
+    _refresh(index, "jazz", _items("a", "b"))
+    _refresh(index, "rock", _items("c"))
+
+    # "b" now only matches rock; its record is reused, but it is new to rock
+    _, rock = _refresh(index, "rock", _items("c", "b"))
+    _, jazz = _refresh(index, "jazz", _items("a"))
+    assert (rock.added, rock.removed, rock.reused) == (1, 0, 2)
+    assert (jazz.added, jazz.removed) == (0, 1)
+    assert rock.added - rock.removed + jazz.added - jazz.removed == 0
+
+
+def test_skipped_items_are_retried():
+    index = FingerprintIndex("test")
+    items = _items("a", "b")
+    items[1]["broken"] = True
+    events, stats = _refresh(index, "q", items)
+    assert [e.title for e in events] == ["show a"]
+    assert stats.added == 1
+
+    events, stats = _refresh(index, "q", _items("a", "b"))
+    assert normalized == ["b"]
+    assert stats.added == 1 and stats.unchanged == 1
+
+
+def test_streamed_feed_keeps_item_order():
+    index = FingerprintIndex("test")
+    _refresh(index, "q", _items(*"ace"))
+
+    async def stream():
+        run = index.start("q", _id, _normalize)
+        run.batch_size = 2
+        out = []
+        for chunk in (_items("a", "b"), _items("c", "d"), _items("e", "f")):
+            out.extend(await run.feed(chunk))
+        out.extend(await run.finish())
+        return out, run.stats
+
+    normalized.clear()
+    events, stats = asyncio.run(stream())
+    assert [e.title for e in events] == [f"show {i}" for i in "abcdef"]
+    assert sorted(normalized) == ["b", "d", "f"]
+    assert (stats.added, stats.unchanged, stats.reused) == (3, 3, 3)
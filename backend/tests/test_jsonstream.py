@@ -0,0 +1,81 @@
+# backend/tests/test_jsonstream.py
+
+import json
+
+import pytest
+
+from backend.utils.jsonstream import ItemParser, parse_path
+
+
+def _parse(chunks, path="events[]"):
+    parser = ItemParser(path)
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    parser.close()
+    return items
+
+
+def _every_split(doc: bytes, path: str = "events[]"):
+    """
+    Parse `doc` cut in two at every byte offset, and in one-byte chunks.
+    """
+    yield _parse([doc], path)
+    for i in range(len(doc) + 1):
+        yield _parse([doc[:i], doc[i:]], path)
+    yield _parse([doc[i:i + 1] for i in range(len(doc))], path)
+
+
+@pytest.mark.parametrize("items", [
+    [1.5, -2e10, 0, 12345, -0.25, 1E-3],
+    ["plain", 'say "hi"', "back\\slash", "tab\t", "ünïcødé ✓", "\\\"", ""],
+    [[1, [2, [3, []]]], [], [[]], {"a": [1, {"b": [2]}]}],
+    [True, False, None, {}, {"events": [1, 2]}],
+])
+def test_items_survive_any_split(items):
+    doc = json.dumps({"meta": {"events": "not these"}, "events": items, "total": len(items)}).encode()
+    for parsed in _every_split(doc):
+        assert parsed == items
+
+
+def test_number_split_at_decimal_point():
+    assert _parse([b'{"events":[1.', b'5]}']) == [1.5]
+    assert _parse([b'{"events":[1', b'e3, 2]}']) == [1000.0, 2]
+    assert _parse([b'{"events":[-', b'7]}']) == [-7]
+
+
+def test_nested_path_and_top_level_array():
+    doc = json.dumps({"_embedded": {"events": [{"id": i} for i in range(5)]}, "page": {"size": 5}}).encode()
+    for parsed in _every_split(doc, "_embedded.events[]"):
+        assert parsed == [{"id": i} for i in range(5)]
+    assert _parse([b"[1, ", b"2]"], "[]") == [1, 2]
+
+
+def test_items_are_returned_as_they_complete():
+    parser = ItemParser("events[]")
+    assert parser.feed(b'{"events":[{"id":1},{"id"') == [{"id": 1}]
+    assert parser.feed(b':2}]}') == [{"id": 2}]
+    parser.close()
+
+
+def test_missing_array_yields_nothing():
+    assert _parse([b'{"total": 0}']) == []
+
+
+@pytest.mark.parametrize("chunks", [
+    [b'{"events":[1x, 2]}'],
+    [b'{"events":[1 2]}'],
+    [b'{"events":[{"a":}]}'],
+    [b'{"events":[1,]}'],
+    [b'{"events":[1', b', 2'],
+    [b'{"events":[{"id": 1}, {"id"'],
+])
+def test_malformed_or_truncated_raises(chunks):
+    with pytest.raises(ValueError):
+        _parse(chunks)
+
+
+@pytest.mark.parametrize("path", ["events", "events[0][]", ".events[]"])
+def test_unsupported_paths(path):
+    with pytest.raises(ValueError):
+        parse_path(path)
@@ -0,0 +1,53 @@
+# backend/tests/test_loggy.py
+
+import logging
+
+from backend.utils import loggy
+from backend.utils.loggy import RateLimitFilter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _record(msg: str = "upstream timeout for %s", level: int = logging.WARNING, **extra) -> logging.LogRecord:
+    record = logging.makeLogRecord({"name": "test", "msg": msg, "levelno": level, "args": ("x",)})
+    record.__dict__.update(extra)
+    return record
+
+
+def _passed(limiter: RateLimitFilter, n: int, **kwargs) -> list:
+    return [r for r in (_record(**kwargs) for _ in range(n)) if limiter.filter(r)]
+
+
+def test_burst_then_sampled(monkeypatch):
+    monkeypatch.setattr(loggy.time, "monotonic", _Clock())
+    limiter = RateLimitFilter(burst=5, per_second=1, sample_every=10)
+    kept = _passed(limiter, 5 + 30)
+    assert len(kept) == 5 + 3
+    # Each sampled record reports what was dropped before it
+    assert [getattr(r, "suppressed", 0) for r in kept[5:]] == [9, 9, 9]
+
+
+def test_tokens_refill_over_time(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(loggy.time, "monotonic", clock)
+    limiter = RateLimitFilter(burst=2, per_second=1, sample_every=0)
+    assert len(_passed(limiter, 5)) == 2
+    clock.now += 1.5
+    kept = _passed(limiter, 5)
+    assert len(kept) == 1
+    assert kept[0].suppressed == 3
+
+
+def test_keys_are_limited_separately_and_critical_always_passes(monkeypatch):
+    monkeypatch.setattr(loggy.time, "monotonic", _Clock())
+    limiter = RateLimitFilter(burst=1, per_second=0, sample_every=0)
+    assert len(_passed(limiter, 3, msg="one %s")) == 1
+    assert len(_passed(limiter, 3, msg="two %s")) == 1
+    assert len(_passed(limiter, 3, msg="three %s", log_key="custom")) == 1
+    assert len(_passed(limiter, 3, msg="one %s", level=logging.CRITICAL)) == 3
@@ -0,0 +1,85 @@
+# backend/tests/test_pagination.py
+
+import asyncio
+import base64
+
+import pytest
+
+from backend.cache.sqlite import SQLiteBackend, SQLiteStore
+from backend.tests._factories import make_event
+from backend.utils import pagination
+from backend.utils.cache import TTLCache
+from backend.utils.event_utils import sort_events
+from backend.utils.pagination import (
+    ResultSnapshot, decode_cursor, encode_cursor, get_snapshot, paginate, save_snapshot,
+)
+
+
+def _events(n: int):
+    # Dates out of order so paging has to sort
+    return [make_event(f"Show {i}", date=f"2026-11-{(i * 7) % 28 + 1:02d}", price=f"${i}") for i in range(n)]
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("snap:shot", 40)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("snap:shot", 40)
+
+
+@pytest.mark.parametrize("raw", [b"", b"no-offset", b"snap:ten", b"snap:-10", b"\xff:1"])
+def test_malformed_cursors_are_rejected(raw):
+    with pytest.raises(ValueError):
+        decode_cursor(base64.urlsafe_b64encode(raw).decode())
+
+
+def test_pages_walk_the_sorted_result_set_once():
+    events = _events(23)
+    snapshot = ResultSnapshot(events, "price")
+    snapshot_id = asyncio.run(save_snapshot(snapshot))
+    assert asyncio.run(get_snapshot(snapshot_id)) is snapshot
+
+    seen, offset = [], 0
+    while True:
+        page, cursor = paginate(snapshot, snapshot_id, offset, 10)
+        seen.extend(page)
+        if cursor is None:
+            break
+        cursor_id, offset = decode_cursor(cursor)
+        assert cursor_id == snapshot_id
+    assert seen == sort_events(events, "price")
+
+
+def test_first_page_matches_a_full_sort():
+    events = _events(50)
+    assert ResultSnapshot(events, "").page(0, 5) == sort_events(events, "")[:5]
+    assert ResultSnapshot(events, "price desc").page(0, 5) == sort_events(events, "price desc")[:5]
+
+
+def test_content_derived_ids_share_a_snapshot():
+    async def scenario():
+        assert await save_snapshot(ResultSnapshot(_events(3), ""), "digest-1") == "digest-1"
+        assert len(await get_snapshot("digest-1")) == 3
+        assert await get_snapshot("missing") is None
+
+    asyncio.run(scenario())
+
+
+def test_any_worker_can_serve_a_cursor(tmp_path, monkeypatch):
+    # Two stores on one SQLite file stand in for two workers
+    path = str(tmp_path / "cache.db")
+    first, second = SQLiteStore(path), SQLiteStore(path)
+    events = _events(30)
+
+    async def scenario():
+        monkeypatch.setattr(pagination, "_snapshots", SQLiteBackend(first, "snapshots", 60))
+        await save_snapshot(ResultSnapshot(events, "price"), "digest-2")
+
+        monkeypatch.setattr(pagination, "_snapshots", SQLiteBackend(second, "snapshots", 60))
+        monkeypatch.setattr(pagination, "_local", TTLCache(ttl=60))
+        snapshot = await get_snapshot("digest-2")
+        assert snapshot.page(10, 10) == sort_events(events, "price")[10:20]
+        assert await get_snapshot("digest-2") is snapshot  # decoded once per worker
+
+    asyncio.run(scenario())
+    first.close()
+    second.close()
@@ -0,0 +1,50 @@
+# backend/tests/test_planner.py
+
+import asyncio
+
+from backend.tests._factories import make_event
+from backend.utils import planner
+from backend.utils.planner import fetch_for_interest, plan_keywords, plan_requests
+
+
+def test_plan_keywords_canonicalizes_and_dedupes():
+    assert plan_keywords("") == [""]
+    assert plan_keywords("  ") == [""]
+    assert plan_keywords("live music and jazz concerts") == ["concert", "jazz"]
+    assert plan_keywords("Jazz, comedies & jazz") == ["jazz", "comedy"]
+    assert plan_keywords("and or") == [""]
+
+
+def test_plan_keywords_is_capped():
+    assert len(plan_keywords("a b c d e f g h")) == planner.MAX_INTEREST_KEYWORDS
+
+
+def test_plan_requests_covers_every_source_per_keyword():
+    plan = plan_requests("  New   York ", "jazz comedy")
+    assert plan == [
+        (source, "new york", kw) for kw in ("jazz", "comedy") for source in planner.SOURCES
+    ]
+
+
+def test_overlapping_interests_share_keyword_fetches(upstream):
+    for source in planner.SOURCES:
+        for kw in ("jazz", "comedy"):
+            upstream.results[(source, kw)] = [make_event(f"{source} {kw}", source=source)]
+    upstream.results[("Ticketmaster", "comedy")] = RuntimeError("upstream down")
+
+    async def scenario():
+        jazz = await fetch_for_interest("Austin", "jazz")
+        both = await fetch_for_interest("Austin", "jazz comedy")
+        return jazz, both, await planner.get_event(both[0].id)
+
+    jazz, both, detail = asyncio.run(scenario())
+    assert [e.title for e in jazz] == ["SeatGeek jazz", "Ticketmaster jazz"]
+    # The failed fetch is skipped; "jazz" came from the cache
+    assert [e.title for e in both] == ["SeatGeek jazz", "Ticketmaster jazz", "SeatGeek comedy"]
+    assert upstream.calls == {
+        ("SeatGeek", "jazz"): 1, ("Ticketmaster", "jazz"): 1,
+        ("SeatGeek", "comedy"): 1, ("Ticketmaster", "comedy"): 1,
+    }
+    # Fetched events get stable ids and are resolvable for detail lookups
+    assert all(e.id for e in both)
+    assert detail.title == "SeatGeek jazz"
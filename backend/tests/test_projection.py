@@ -0,0 +1,44 @@
+# backend/tests/test_projection.py
+
+import pytest
+
+from backend.tests._factories import make_event
+from backend.utils.event_utils import (
+    ALL_FIELDS, SNIPPET_LENGTH, SUMMARY_FIELDS,
+    description_snippet, parse_fields, project_event,
+)
+
+
+def test_summary_view_is_the_default():
+    assert parse_fields("") == SUMMARY_FIELDS
+    assert parse_fields("", "full") == ALL_FIELDS
+    with pytest.raises(ValueError):
+        parse_fields("", "tiny")
+
+
+def test_explicit_fields_keep_model_order_and_always_include_id():
+    assert parse_fields("price, title") == ("id", "title", "price")
+    assert parse_fields("snippet,title") == ("id", "title", "snippet")
+    with pytest.raises(ValueError, match="nope"):
+        parse_fields("title,nope")
+
+
+def test_summary_ships_a_snippet_instead_of_the_description():
+    long_text = "<p>Doors &amp; music</p> " + "word " * 100
+    out = project_event(make_event(description=long_text), SUMMARY_FIELDS)
+    assert "description" not in out
+    assert out["snippet"].startswith("Doors & music word")
+    assert out["snippet"].endswith("…")
+    assert len(out["snippet"]) <= SNIPPET_LENGTH + 1
+    assert out["id"].startswith("seatgeek:")
+
+
+def test_full_view_cleans_the_description():
+    out = project_event(make_event(description="<b>Live</b> &amp; loud"), ALL_FIELDS)
+    assert out["description"] == "Live & loud"
+    assert "snippet" not in out
+
+
+def test_snippet_of_short_or_missing_description():
+    assert description_snippet("  Short <br/>and   sweet ") == "Short and sweet"
+    assert description_snippet("") == ""
@@ -0,0 +1,29 @@
+# backend/tests/test_seatgeek_loader.py
+
+import pytest
+
+from backend.loaders.seatgeek_loader import normalize_seatgeek_item
+
+
+def _item(**stats):
+    return {
+        "id": 42,
+        "title": "Jazz Night",
+        "datetime_local": "2026-11-01T19:30:00",
+        "url": "https://seatgeek.example/42",
+        "stats": stats,
+        "venue": {"display_location": "Austin, TX", "location": {"lat": 30.26, "lon": -97.74}},
+    }
+
+
+@pytest.mark.parametrize("stats, price, low, high", [
+    ({"lowest_price": 10, "highest_price": 20}, "$10–$20", 10.0, 20.0),
+    ({"lowest_price": 15}, "Starting at $15", 15.0, None),
+    ({"lowest_price": 0, "highest_price": 0}, "Free", 0.0, 0.0),
+    ({}, "Varies by seating/ticket tier", None, None),
+])
+def test_prices_are_kept_as_numbers(stats, price, low, high):
+    event = normalize_seatgeek_item(_item(**stats))
+    assert event.price == price
+    assert (event.price_min, event.price_max) == (low, high)
+    assert event.id == "seatgeek:42"
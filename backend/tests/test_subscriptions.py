@@ -0,0 +1,70 @@
+# backend/tests/test_subscriptions.py
+
+import asyncio
+
+from backend.tests._factories import make_event
+from backend.utils import planner, subscriptions
+from backend.utils.subscriptions import SearchSpec, _diff, subscribe
+
+AUSTIN = (30.2672, -97.7431)
+
+
+def test_diff_reports_added_changed_and_removed():
+    a, b, c = make_event("A", id="x:a"), make_event("B", id="x:b"), make_event("C", id="x:c")
+    snapshot = {"x:a": ("1", a), "x:b": ("2-new", b), "x:c": ("3", c)}
+    added, changed, removed = _diff({"x:a": "1", "x:b": "2", "x:gone": "9"}, snapshot)
+    assert added == [c]
+    assert changed == [b]
+    assert removed == ["x:gone"]
+
+
+def test_fresh_fetch_is_pushed_without_waiting_for_the_poll(upstream, monkeypatch):
+    upstream.results[("SeatGeek", "")] = [make_event("Jazz night", price="$20")]
+    monkeypatch.setattr(subscriptions, "SUBSCRIPTION_REFRESH", 3600.0)
+
+    async def scenario():
+        spec = SearchSpec("Austin", "", 0.0, 1000.0, 50.0, "")
+        stream = subscribe(spec, AUSTIN, ("id", "title", "price"))
+        try:
+            first = await asyncio.wait_for(stream.__anext__(), 2)
+            assert [e["price"] for e in first["added"]] == ["$20"]
+
+            # Another request refetches the source after its cache entry expired
+            upstream.results[("SeatGeek", "")] = [make_event("Jazz night", price="$25")]
+            await planner._event_cache.delete("SeatGeek|austin|")
+            await planner.fetch_source_keyword("SeatGeek", "Austin", "")
+
+            update = await asyncio.wait_for(stream.__anext__(), 2)
+            assert [e["price"] for e in update["changed"]] == ["$25"]
+            assert update["added"] == [] and update["removed"] == []
+        finally:
+            await stream.aclose()
+        assert planner._refresh_listeners == []
+
+    asyncio.run(scenario())
+
+
+def test_empty_sources_and_own_fetches_dont_retrigger_the_search(upstream, monkeypatch):
+    # Ticketmaster comes back empty (no API key, upstream error, no events)
+    upstream.results[("SeatGeek", "")] = [make_event("Jazz night")]
+    monkeypatch.setattr(subscriptions, "SUBSCRIPTION_REFRESH", 3600.0)
+    searches = []
+    search = subscriptions.SharedSearch._search
+
+    async def counted(self):
+        searches.append(1)
+        return await search(self)
+
+    monkeypatch.setattr(subscriptions.SharedSearch, "_search", counted)
+
+    async def scenario():
+        stream = subscribe(SearchSpec("Austin", "", 0.0, 1000.0, 50.0, ""), AUSTIN, ("id",))
+        try:
+            await asyncio.wait_for(stream.__anext__(), 2)
+            await asyncio.sleep(0.3)
+        finally:
+            await stream.aclose()
+
+    asyncio.run(scenario())
+    assert upstream.calls == {("SeatGeek", ""): 1, ("Ticketmaster", ""): 1}
+    assert len(searches) == 1
@@ -0,0 +1,92 @@
+# backend/tests/test_warm_state.py
+
+import asyncio
+import os
+
+import pytest
+
+from backend.utils import warm_state
+from backend.utils.cache import TTLCache
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    registered = {"geocodes": TTLCache(ttl=60), "events": TTLCache(ttl=60)}
+    monkeypatch.setattr(warm_state, "_caches", registered)
+    return registered
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    private = tmp_path / "state"
+    private.mkdir(mode=0o700)
+    return str(private / "warm_state.pkl")
+
+
+def test_round_trip(caches, snapshot_path):
+    caches["geocodes"].set("austin", (30.27, -97.74))
+    caches["events"].set("SeatGeek|austin|jazz", ["event"], ttl=30)
+    caches["events"].set("gone", ["event"], ttl=-1)
+    assert warm_state.save(snapshot_path) == 2
+    assert os.stat(snapshot_path).st_mode & 0o077 == 0
+
+    for cache in caches.values():
+        cache.clear()
+    assert warm_state.restore(warm_state.read(snapshot_path)) == {"geocodes": 1, "events": 1}
+    assert caches["geocodes"].get("austin") == (30.27, -97.74)
+    assert caches["events"].get("SeatGeek|austin|jazz") == ["event"]
+
+
+def test_restore_keeps_fresher_entries(caches, snapshot_path):
+    caches["geocodes"].set("austin", "stale")
+    caches["geocodes"].set("boston", "stale")
+    warm_state.save(snapshot_path)
+    snapshot = warm_state.read(snapshot_path)
+
+    caches["geocodes"].clear()
+    caches["geocodes"].set("austin", "fresh")
+    assert warm_state.restore(snapshot) == {"geocodes": 1, "events": 0}
+    assert caches["geocodes"].get("austin") == "fresh"
+    assert caches["geocodes"].get("boston") == "stale"
+
+
+def test_downtime_shortens_ttl(caches, snapshot_path, monkeypatch):
+    caches["geocodes"].set("austin", "x", ttl=30)
+    warm_state.save(snapshot_path)
+    real_time = warm_state.time.time
+    monkeypatch.setattr(warm_state.time, "time", lambda: real_time() + 60)
+    assert warm_state.read(snapshot_path)["geocodes"][0][1] < 0
+
+
+def test_missing_snapshot_is_a_cold_start(caches, tmp_path):
+    assert warm_state.read(str(tmp_path / "none.pkl")) == {}
+    assert warm_state.read("") == {}
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_refuses_snapshot_others_can_write(caches, snapshot_path):
+    warm_state.save(snapshot_path)
+    os.chmod(os.path.dirname(snapshot_path), 0o777)
+    with pytest.raises(PermissionError):
+        warm_state.read(snapshot_path)
+    os.chmod(os.path.dirname(snapshot_path), 0o700)
+    os.chmod(snapshot_path, 0o666)
+    with pytest.raises(PermissionError):
+        warm_state.read(snapshot_path)
+
+
+def test_reads_wait_for_warm_up(caches, snapshot_path, monkeypatch):
+    caches["geocodes"].set("austin", "from snapshot")
+    warm_state.save(snapshot_path)
+    caches["geocodes"].clear()
+    monkeypatch.setattr(warm_state, "_loaded", None)
+    monkeypatch.setattr(warm_state, "_status", {"ready": False, "restored": {}, "load_seconds": None})
+
+    async def scenario():
+        task = warm_state.start_warm_up(snapshot_path)
+        await warm_state.wait_loaded()
+        assert caches["geocodes"].get("austin") == "from snapshot"
+        await task
+
+    asyncio.run(scenario())
+    assert warm_state.readiness()["ready"]
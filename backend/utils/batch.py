@@ -0,0 +1,104 @@
+# backend/utils/batch.py
+
+"""
+Batch search planning for POST /events/batch.
+
+All queries are planned together: each unique city is geocoded once (through
+the geocoder's rate limit), each unique (source, city, keyword) is fetched
+once (under the planner's global upstream limit, over the shared HTTP client),
+and the shared results are fanned back out through each query's own filters.
+Answers are yielded as soon as a query's city and fetches land.
+"""
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from backend.models.batch import BatchQuery
+from backend.utils.env import get_coordinates_for_city
+from backend.utils.event_utils import filter_events, order_events, parse_fields, project_event
+from backend.utils.loggy import get_logger
+from backend.utils.metrics import metrics
+from backend.utils.planner import fetch_source_keyword, merge_results, normalize_city, plan_requests
+
+logger = get_logger("batch")
+
+Request = Tuple[str, str, str]  # (source, city key, keyword)
+
+
+def _answer(
+    index: int,
+    query: BatchQuery,
+    coords: Tuple[float, float],
+    plan: List[Request],
+    results: List[Any],
+) -> Dict[str, Any]:
+    filtered = filter_events(
+        merge_results(plan, results), coords, query.min_price, query.max_price, query.radius, query.date
+    )
+    ordered = order_events(filtered, query.sort_by, query.limit)
+    selected = parse_fields(query.fields, query.view.lower())
+    return {
+        "index": index,
+        "city": query.city,
+        "interest": query.interest,
+        "total": len(filtered),
+        "events": [project_event(e, selected) for e in ordered],
+    }
+
+
+async def _locate(city: str) -> Optional[Tuple[float, float]]:
+    try:
+        return await get_coordinates_for_city(city)
+    except Exception as e:
+        logger.warning("Geocoding failed for %r: %s", city, e)
+        return None
+
+
+async def run_batch(queries: List[BatchQuery]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield one answer per query, in completion order; each carries its `index`.
+    """
+    # 1) One geocode task per unique city; uncached ones are paced by the geocoder
+    cities: Dict[str, asyncio.Task] = {}
+    for q in queries:
+        city_key = normalize_city(q.city)
+        if city_key not in cities:
+            cities[city_key] = asyncio.create_task(_locate(q.city))
+
+    # 2) Plan every query; each unique (source, city, keyword) gets one fetch
+    #    task, started once its city resolves
+    plans = [plan_requests(q.city, q.interest) for q in queries]
+    fetches: Dict[Request, asyncio.Task] = {}
+
+    def fetch(req: Request, city: str) -> asyncio.Task:
+        task = fetches.get(req)
+        if task is None:
+            source, _, kw = req
+            task = fetches[req] = asyncio.create_task(fetch_source_keyword(source, city, kw))
+        return task
+
+    planned = sum(len(p) for p in plans)
+    unique = len({req for plan in plans for req in plan})
+    metrics.inc("batch.queries", len(queries))
+    metrics.inc("batch.fetches", unique)
+    metrics.inc("batch.fetches_shared", planned - unique)
+    logger.info(
+        "Batch ▶ %d queries, %d cities → %d unique fetches (%d shared)",
+        len(queries), len(cities), unique, planned - unique,
+    )
+
+    # 3) Fan the shared results back out, answering each query as it completes
+    async def answer(index: int, query: BatchQuery, plan: List[Request]) -> Dict[str, Any]:
+        coords = await cities[normalize_city(query.city)]
+        if not coords:
+            return {"index": index, "city": query.city, "error": "Unable to resolve city to coordinates"}
+        results = await asyncio.gather(*(fetch(req, query.city) for req in plan), return_exceptions=True)
+        return _answer(index, query, coords, plan, results)
+
+    answers = [asyncio.create_task(answer(i, q, p)) for i, (q, p) in enumerate(zip(queries, plans))]
+    try:
+        for done in asyncio.as_completed(answers):
+            yield await done
+    finally:
+        # Client went away (or we're done): don't leave work running for nobody
+        for task in [*answers, *cities.values(), *fetches.values()]:
+            task.cancel()
@@ -0,0 +1,69 @@
+# backend/utils/cache.py
+
+"""
+Small in-process TTL cache with LRU eviction. Fetch coalescing lives in
+backend.cache.base.CacheBackend.get_or_fetch.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, List, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Maps keys to values for `ttl` seconds, holding at most `maxsize` entries.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def dump(self) -> List[Tuple[Hashable, float, Any]]:
+        """
+        Live entries as (key, seconds left, value), least recently used first.
+        """
+        now = time.monotonic()
+        return [(k, expires - now, v) for k, (expires, v) in self._data.items() if expires > now]
+
+    def load(self, entries: Iterable[Tuple[Hashable, float, Any]]) -> int:
+        """
+        Restore entries produced by `dump`; returns how many were restored.
+        Expired entries and keys that already hold a live value are skipped,
+        so a restore never overwrites something fresher.
+        """
+        loaded = 0
+        for key, ttl_left, value in entries:
+            if ttl_left > 0 and self.get(key, _MISSING) is _MISSING:
+                self.set(key, value, ttl_left)
+                loaded += 1
+        return loaded
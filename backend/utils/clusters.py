@@ -0,0 +1,138 @@
+# backend/utils/clusters.py
+
+"""
+Server-side map clustering for GET /events/clusters.
+
+Events are bucketed into a lat/lon grid whose cells shrink by half with each
+zoom level (CELLS_PER_TILE cells across one web-map tile). Each cell reports
+its count, centroid, price range and a few sample ids. The full grid for a
+result set is computed once per zoom and cached on the configured
+CACHE_BACKEND, so panning at a given zoom only re-filters the cached cells
+against the new bounding box, whichever worker serves the request.
+"""
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.cache.factory import make_cache
+from backend.config.settings import SNAPSHOT_TTL
+from backend.models.event import NormalizedEvent
+from backend.utils.event_utils import sort_events
+
+MAX_ZOOM = 20
+CELLS_PER_TILE = 4  # a 256px tile holds a 4×4 block of cells, ~64px apart
+SAMPLE_IDS = 3
+
+BBox = Tuple[float, float, float, float]  # (west, south, east, north)
+
+# f"{result digest}|{zoom}" → (clusters, unlocated count)
+_grids = make_cache("clusters", ttl=SNAPSHOT_TTL, maxsize=1024)
+
+
+def cell_size(zoom: int) -> float:
+    """
+    Cell edge in degrees at `zoom`.
+    """
+    return 360.0 / (2 ** zoom) / CELLS_PER_TILE
+
+
+def parse_bbox(bbox: str) -> Optional[BBox]:
+    """
+    "west,south,east,north" in degrees → tuple, or None when empty. A box with
+    west > east crosses the antimeridian. Raises ValueError when malformed.
+    """
+    if not bbox.strip():
+        return None
+    try:
+        west, south, east, north = (float(p) for p in bbox.split(","))
+    except ValueError:
+        raise ValueError("bbox must be 'west,south,east,north'")
+    if not (-180 <= west <= 180 and -180 <= east <= 180 and -90 <= south <= north <= 90):
+        raise ValueError("bbox is out of range")
+    return west, south, east, north
+
+
+def _price_range(e: NormalizedEvent) -> Optional[Tuple[float, float]]:
+    # Structured prices when the loader has them, else a plain "$12" or "Free";
+    # None when the price isn't a number ("Varies by seating/ticket tier")
+    if e.price_min is not None:
+        return e.price_min, e.price_max if e.price_max is not None else e.price_min
+    text = (e.price or "").strip()
+    if text.lower() == "free":
+        return 0.0, 0.0
+    try:
+        value = float(text.replace("$", "").split(" - ")[0])
+    except ValueError:
+        return None
+    return value, value
+
+
+def build_clusters(events: List[NormalizedEvent], zoom: int) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Grid `events` at `zoom`. Returns (clusters, number of events without
+    usable coordinates). Sample ids are the soonest events in each cell; the
+    price range only covers events with a numeric price (None if none has).
+    """
+    size = cell_size(zoom)
+    cells: Dict[Tuple[int, int], List[Any]] = {}
+    unlocated = 0
+
+    for e in sort_events(events, ""):
+        lat, lon = e.latitude, e.longitude
+        if lat is None or lon is None or not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            unlocated += 1
+            continue
+        key = (math.floor(lat / size), math.floor(lon / size))
+        cell = cells.get(key)
+        if cell is None:
+            # [count, lat sum, lon sum, price min, price max, sample ids]
+            cell = cells[key] = [0, 0.0, 0.0, None, None, []]
+        cell[0] += 1
+        cell[1] += lat
+        cell[2] += lon
+        prices = _price_range(e)
+        if prices is not None:
+            low, high = prices
+            if cell[3] is None or low < cell[3]:
+                cell[3] = low
+            if cell[4] is None or high > cell[4]:
+                cell[4] = high
+        if e.id and len(cell[5]) < SAMPLE_IDS:
+            cell[5].append(e.id)
+
+    clusters = []
+    for (row, col), (count, lat_sum, lon_sum, low, high, sample) in cells.items():
+        clusters.append({
+            "cell": f"{zoom}/{row}/{col}",
+            "count": count,
+            "lat": round(lat_sum / count, 6),
+            "lon": round(lon_sum / count, 6),
+            "bounds": [col * size, row * size, (col + 1) * size, (row + 1) * size],
+            "price_min": low,
+            "price_max": high,
+            "sample_ids": sample,
+        })
+    clusters.sort(key=lambda c: -c["count"])
+    return clusters, unlocated
+
+
+async def get_clusters(digest: str, events: List[NormalizedEvent], zoom: int) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    build_clusters, cached per (result set, zoom).
+    """
+    async def build() -> Tuple[List[Dict[str, Any]], int]:
+        return build_clusters(events, zoom)
+
+    return await _grids.get_or_fetch(f"{digest}|{zoom}", build, cache_empty=True)
+
+
+def in_bbox(cluster: Dict[str, Any], bbox: BBox) -> bool:
+    """
+    Whether the cluster's centroid falls inside `bbox`.
+    """
+    west, south, east, north = bbox
+    lat, lon = cluster["lat"], cluster["lon"]
+    if not south <= lat <= north:
+        return False
+    if west <= east:
+        return west <= lon <= east
+    return lon >= west or lon <= east
@@ -0,0 +1,248 @@
+# backend/utils/encoding.py
+
+"""
+Response content negotiation: JSON or MessagePack bodies (`Accept`), optionally
+gzip- or brotli-compressed (`Accept-Encoding`) once they pass a size threshold.
+Large bodies are serialized and compressed in a worker thread so the event loop
+keeps serving other requests. Strong ETags let re-polling clients get a 304
+without the body being serialized at all.
+
+brotli and msgpack are optional; without them the negotiation falls back to
+gzip and JSON respectively. They are imported on first use, not at startup.
+"""
+import asyncio
+import gzip
+import hashlib
+import importlib.util
+import json
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+
+from backend.config.settings import (
+    BROTLI_QUALITY,
+    COMPRESS_MIN_BYTES,
+    GZIP_LEVEL,
+    OFFLOAD_MIN_BYTES,
+    OFFLOAD_MIN_ITEMS,
+)
+from backend.utils.metrics import metrics
+
+# Optional dependencies: looked up now, imported when first needed
+_HAS_BROTLI = importlib.util.find_spec("brotli") is not None
+_HAS_MSGPACK = importlib.util.find_spec("msgpack") is not None
+
+
+@lru_cache(maxsize=None)
+def _optional(module: str) -> Any:
+    return importlib.import_module(module)
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+_MSGPACK_TYPES = {"application/msgpack", "application/x-msgpack", "application/vnd.msgpack"}
+
+FORMAT_NAMES = {JSON: "json", MSGPACK: "msgpack"}
+
+
+# ─── NEGOTIATION ────────────────────────────────────────────────────────────────
+def _qvalues(header: str) -> Dict[str, float]:
+    """
+    Parse "a/b;q=0.5, c" style headers into {token: q}.
+    """
+    out: Dict[str, float] = {}
+    for part in header.split(","):
+        token, *params = [p.strip() for p in part.split(";")]
+        if not token:
+            continue
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        out[token.lower()] = q
+    return out
+
+
+def negotiate_media_type(accept: str) -> str:
+    """
+    MessagePack only for clients that explicitly ask for it (and rank it at
+    least as high as JSON); everyone else gets JSON.
+    """
+    if not _HAS_MSGPACK or not accept:
+        return JSON
+    q = _qvalues(accept)
+    mp = max((q[t] for t in _MSGPACK_TYPES if t in q), default=0.0)
+    js = max(q.get(JSON, 0.0), q.get("application/*", 0.0), q.get("*/*", 0.0))
+    return MSGPACK if mp > 0 and mp >= js else JSON
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick "br" or "gzip" (in that order of preference) if acceptable, else None.
+    """
+    q = _qvalues(accept_encoding)
+    star = q.get("*", 0.0)
+    for name in ("br", "gzip"):
+        if name == "br" and not _HAS_BROTLI:
+            continue
+        if q.get(name, star) > 0:
+            return name
+    return None
+
+
+# ─── ENCODING ───────────────────────────────────────────────────────────────────
+def serialize(payload: Any, media_type: str) -> bytes:
+    if media_type == MSGPACK:
+        return _optional("msgpack").packb(payload, use_bin_type=True)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return _optional("brotli").compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def _serialize_timed(payload: Any, media_type: str) -> Tuple[bytes, float]:
+    start = time.perf_counter()
+    body = serialize(payload, media_type)
+    return body, time.perf_counter() - start
+
+
+def _compress_timed(body: bytes, encoding: str) -> Tuple[bytes, float]:
+    start = time.perf_counter()
+    out = compress(body, encoding)
+    return out, time.perf_counter() - start
+
+
+# ─── METRICS ────────────────────────────────────────────────────────────────────
+class _JsonBaseline:
+    """
+    Running per-item JSON cost, used to estimate what a MessagePack response
+    saved over the JSON it replaced.
+    """
+    alpha = 0.1
+
+    def __init__(self):
+        self.bytes_per_item: Optional[float] = None
+        self.seconds_per_item: Optional[float] = None
+
+    def update(self, items: int, size: int, seconds: float) -> None:
+        if not items:
+            return
+        b, s = size / items, seconds / items
+        if self.bytes_per_item is None:
+            self.bytes_per_item, self.seconds_per_item = b, s
+        else:
+            self.bytes_per_item += self.alpha * (b - self.bytes_per_item)
+            self.seconds_per_item += self.alpha * (s - self.seconds_per_item)
+
+
+_json_baseline = _JsonBaseline()
+
+
+def _record(
+    media_type: str,
+    encoding: Optional[str],
+    items: int,
+    raw_size: int,
+    wire_size: int,
+    encode_s: float,
+    compress_s: float,
+) -> None:
+    fmt = FORMAT_NAMES[media_type]
+    enc = encoding or "identity"
+    metrics.inc("response.count", format=fmt, encoding=enc)
+    metrics.inc("response.bytes", wire_size, format=fmt, encoding=enc)
+    metrics.observe("response.encode_seconds", encode_s, format=fmt)
+    if encoding:
+        metrics.observe("response.compress_seconds", compress_s, encoding=enc)
+
+    # Savings are measured against plain, uncompressed JSON.
+    if media_type == JSON:
+        _json_baseline.update(items, raw_size, encode_s)
+        json_size, json_s = raw_size, encode_s
+    elif _json_baseline.bytes_per_item is not None:
+        json_size = int(_json_baseline.bytes_per_item * items)
+        json_s = _json_baseline.seconds_per_item * items
+    else:
+        return
+    metrics.inc("response.bytes_saved", json_size - wire_size, format=fmt, encoding=enc)
+    metrics.inc("response.encode_seconds_saved", json_s - encode_s - compress_s, format=fmt, encoding=enc)
+
+
+# ─── CONDITIONAL REQUESTS ───────────────────────────────────────────────────────
+def make_etag(request: Request, basis: str) -> str:
+    """
+    Strong ETag for the representation of `basis` (a content hash of the result
+    set plus whatever shapes it) in the format and encoding this request gets.
+    """
+    media_type = negotiate_media_type(request.headers.get("accept", ""))
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", "")) or "identity"
+    tag = hashlib.blake2b(f"{basis}|{media_type}|{encoding}".encode(), digest_size=16).hexdigest()
+    return f'"{tag}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    If-None-Match check (weak comparison, as RFC 9110 prescribes for it).
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return etag in candidates
+
+
+def not_modified_response(etag: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    metrics.inc("response.not_modified")
+    out_headers = dict(headers or {})
+    out_headers.update({"ETag": etag, "Vary": "Accept, Accept-Encoding"})
+    return Response(status_code=304, headers=out_headers)
+
+
+# ─── RESPONSE ───────────────────────────────────────────────────────────────────
+async def encode_response(
+    request: Request,
+    payload: Any,
+    headers: Optional[Dict[str, str]] = None,
+    status_code: int = 200,
+    etag: Optional[str] = None,
+) -> Response:
+    """
+    Serialize `payload` in the negotiated format and encoding.
+    """
+    media_type = negotiate_media_type(request.headers.get("accept", ""))
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    items = len(payload) if isinstance(payload, list) else 1
+
+    if items >= OFFLOAD_MIN_ITEMS:
+        body, encode_s = await asyncio.to_thread(_serialize_timed, payload, media_type)
+    else:
+        body, encode_s = _serialize_timed(payload, media_type)
+    raw_size = len(body)
+
+    compress_s = 0.0
+    if encoding and raw_size >= COMPRESS_MIN_BYTES:
+        if raw_size >= OFFLOAD_MIN_BYTES:
+            body, compress_s = await asyncio.to_thread(_compress_timed, body, encoding)
+        else:
+            body, compress_s = _compress_timed(body, encoding)
+    else:
+        encoding = None
+
+    _record(media_type, encoding, items, raw_size, len(body), encode_s, compress_s)
+
+    out_headers = dict(headers or {})
+    out_headers["Vary"] = "Accept, Accept-Encoding"
+    if encoding:
+        out_headers["Content-Encoding"] = encoding
+    if etag:
+        out_headers["ETag"] = etag
+    return Response(content=body, status_code=status_code, media_type=media_type, headers=out_headers)
@@ -1,10 +1,18 @@
 # backend/utils/env.py
 
+import asyncio
 import os
-from dotenv import load_dotenv
-import httpx
+import time
 
-load_dotenv()
+from backend.config.settings import GEOCODE_CACHE_TTL, GEOCODE_INTERVAL
+from backend.cache.factory import make_cache
+
+_geocode_cache = make_cache("geocodes", ttl=GEOCODE_CACHE_TTL, maxsize=2048)
+
+# Nominatim allows one request per second: cache misses queue up here, so a
+# batch of new cities is geocoded one by one instead of all at once.
+_geocode_slot = asyncio.Lock()
+_last_geocode = 0.0
 
 def get_env_variable(var_name: str) -> str:
     value = os.getenv(var_name)
@@ -15,7 +23,12 @@ def get_env_variable(var_name: str) -> str:
 async def get_coordinates_for_city(city: str):
     """
     Given a city name or address string, return (latitude, longitude) using OpenStreetMap.
+    Successful lookups are cached per normalized city string.
     """
+    key = " ".join(city.lower().split())
+    return await _geocode_cache.get_or_fetch(key, lambda: _geocode(city))
+
+async def _geocode(city: str):
     url = "https://nominatim.openstreetmap.org/search"
     params = {
         "q": city,
@@ -27,8 +40,15 @@ async def get_coordinates_for_city(city: str):
         "User-Agent": "EventScout/1.0 (eventscout@example.com)"  # required by Nominatim usage policy
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers)
+    from backend.utils.http import get_client  # deferred: httpx is slow to import
+
+    global _last_geocode
+    async with _geocode_slot:
+        await asyncio.sleep(max(0.0, _last_geocode + GEOCODE_INTERVAL - time.monotonic()))
+        try:
+            response = await get_client().get(url, params=params, headers=headers)
+        finally:
+            _last_geocode = time.monotonic()
 
     if response.status_code != 200:
         return None
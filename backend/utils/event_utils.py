@@ -3,9 +3,14 @@
 """
 Utilities for keyword extraction, deduplication, filtering, and sorting of normalized events.
 """
+import hashlib
+import heapq
+import html
+import math
+import re
 from datetime import datetime
-from typing import Tuple, List
-from geopy.distance import geodesic
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, List
 from backend.models.event import NormalizedEvent
 
 
@@ -28,13 +33,136 @@ SYNONYM_MAP = {
 }
 
 # ─── KEYWORD EXTRACTION ─────────────────────────────────────────────────────────
+# Connectives that carry no search meaning on their own ("jazz and comedy")
+KEYWORD_STOPWORDS = {"and", "or", "&", "+", "/"}
+
+_MAX_PHRASE_LEN = max(len(k.split()) for k in SYNONYM_MAP)
+
 def get_keywords(interest: str) -> List[str]:
     """
     Map raw user interest words to normalized keywords.
+    Multi-word synonyms ("live music") win over their single words, connectives
+    are dropped, and each keyword appears once, in first-seen order.
     """
     if not interest:
         return ["music", "concert", "show"]
-    return [SYNONYM_MAP.get(w.lower(), w.lower()) for w in interest.split()]
+    words = interest.lower().replace(",", " ").split()
+    keywords: List[str] = []
+    i = 0
+    while i < len(words):
+        for n in range(min(_MAX_PHRASE_LEN, len(words) - i), 0, -1):
+            phrase = " ".join(words[i:i + n])
+            if n == 1 or phrase in SYNONYM_MAP:
+                break
+        i += n
+        if phrase in KEYWORD_STOPWORDS:
+            continue
+        kw = SYNONYM_MAP.get(phrase, phrase)
+        if kw not in keywords:
+            keywords.append(kw)
+    return keywords
+
+# ─── STABLE IDS ────────────────────────────────────────────────────────────────
+def event_id(event: NormalizedEvent) -> str:
+    """
+    The event's stable id: the loader-assigned "<source>:<upstream id>" when
+    present, otherwise a digest of (source, title, date, location).
+    """
+    if event.id:
+        return event.id
+    raw = "|".join((event.source, event.title.strip().lower(), event.date, event.location.strip().lower()))
+    return f"{event.source.lower()}:{hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()}"
+
+# ─── CONTENT DIGESTS ───────────────────────────────────────────────────────────
+def event_digest(event: NormalizedEvent) -> str:
+    """
+    Hash of every field of the event, computed once and kept on the event.
+    """
+    if event._digest is None:
+        values = repr(tuple(getattr(event, f) for f in NormalizedEvent.__fields__))
+        event._digest = hashlib.blake2b(values.encode(), digest_size=12).hexdigest()
+    return event._digest
+
+def result_set_digest(events: List[NormalizedEvent], *extra: str) -> str:
+    """
+    Order-sensitive hash of a result set (plus any `extra` qualifiers), cheap
+    because it only combines the cached per-event digests.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in extra:
+        h.update(part.encode())
+        h.update(b"\0")
+    for e in events:
+        h.update(event_digest(e).encode())
+    return h.hexdigest()
+
+# ─── FIELD PROJECTION ──────────────────────────────────────────────────────────
+ALL_FIELDS: Tuple[str, ...] = tuple(NormalizedEvent.__fields__)
+
+# Computed at projection time; not stored on the model
+DERIVED_FIELDS: Tuple[str, ...] = ("snippet",)
+
+SNIPPET_LENGTH = 160
+
+# What the list screen needs: title, date, price, venue, coordinates and a
+# short description preview
+SUMMARY_FIELDS: Tuple[str, ...] = (
+    "id", "title", "source", "ticket_url",
+    "date", "start_date", "start_time", "start_datetime",
+    "price", "price_min", "price_max",
+    "venue_name", "location", "category",
+    "latitude", "longitude", "snippet",
+)
+
+VIEWS: Dict[str, Tuple[str, ...]] = {"summary": SUMMARY_FIELDS, "full": ALL_FIELDS}
+
+def parse_fields(fields: str, view: str = "summary") -> Tuple[str, ...]:
+    """
+    Resolve a `fields=` list (comma-separated) or a named view into the fields
+    to return. `id` is always included. Raises ValueError on unknown names.
+    """
+    if not fields:
+        if view not in VIEWS:
+            raise ValueError(f"Unsupported view: {view}")
+        return VIEWS[view]
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in NormalizedEvent.__fields__ and f not in DERIVED_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    wanted = set(requested) | {"id"}
+    return tuple(f for f in ALL_FIELDS + DERIVED_FIELDS if f in wanted)
+
+@lru_cache(maxsize=8192)
+def clean_description(raw: str) -> str:
+    """
+    Strip HTML tags and unescape entities. Loaders keep descriptions raw so
+    this only runs for views that actually ship the description.
+    """
+    return html.unescape(re.sub(r"<[^>]+>", "", raw)).strip() or "No description available."
+
+@lru_cache(maxsize=8192)
+def description_snippet(raw: str, length: int = SNIPPET_LENGTH) -> str:
+    """
+    The first `length` characters of the cleaned description, cut at a word
+    and whitespace collapsed; "" when there is no description.
+    """
+    text = " ".join(html.unescape(re.sub(r"<[^>]+>", " ", raw)).split())
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(" ", 1)[0].rstrip(",.;:") + "…"
+
+def project_event(event: NormalizedEvent, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Serialize only `fields` of an event, in model order, derived fields last.
+    """
+    out = {f: getattr(event, f) for f in fields if f not in DERIVED_FIELDS}
+    if "id" in out:
+        out["id"] = event_id(event)
+    if "description" in out:
+        out["description"] = clean_description(event.description)
+    if "snippet" in fields:
+        out["snippet"] = description_snippet(event.description or "")
+    return out
 
 # ─── DEDUPE ACROSS SAME SOURCE ONLY ────────────────────────────────────────────
 def dedupe(events: List[NormalizedEvent]) -> List[NormalizedEvent]:
@@ -65,6 +193,29 @@ def parse_price(price_str: str) -> float:
     except:
         return 0.0
 
+# ─── DISTANCE ──────────────────────────────────────────────────────────────────
+_EARTH_RADIUS_MI = 3958.7613
+_SPHERE_ERROR = 0.006  # great-circle vs. WGS-84 geodesic differ by < 0.6%
+
+def haversine_miles(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (a[0], a[1], b[0], b[1]))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * _EARTH_RADIUS_MI * math.asin(math.sqrt(h))
+
+def within_radius(a: Tuple[float, float], b: Tuple[float, float], radius: float) -> bool:
+    """
+    Same answer as geopy's geodesic distance check, but only pays for the
+    geodesic (and the geopy import) when the spherical estimate is too close
+    to the radius to call.
+    """
+    approx = haversine_miles(a, b)
+    if approx < radius * (1 - _SPHERE_ERROR):
+        return True
+    if approx > radius * (1 + _SPHERE_ERROR):
+        return False
+    from geopy.distance import geodesic  # deferred: geopy is slow to import
+    return geodesic(a, b).miles <= radius
+
 # ─── FILTER PREDICATE ────────────────────────────────────────────────────────────
 def event_matches(
     event: NormalizedEvent,
@@ -82,8 +233,7 @@ def event_matches(
     # Distance filter
     if event.latitude is not None and event.longitude is not None:
         try:
-            dist = geodesic(user_coords, (event.latitude, event.longitude)).miles
-            if dist > radius:
+            if not within_radius(user_coords, (event.latitude, event.longitude), radius):
                 return False
         except:
             return False
@@ -100,25 +250,68 @@ def event_matches(
 
     return True
 
+def filter_events(
+    events: List[NormalizedEvent],
+    user_coords: Tuple[float, float],
+    min_price: float,
+    max_price: float,
+    radius: float,
+    filter_date: str
+) -> List[NormalizedEvent]:
+    """
+    Deduplicate the merged results of a search and keep the events matching
+    its filters. Every search path (single, batched, clustered, subscribed)
+    goes through here.
+    """
+    return [
+        e for e in dedupe(events)
+        if event_matches(e, user_coords, min_price, max_price, radius, filter_date)
+    ]
+
 # ─── SORTING ───────────────────────────────────────────────────────────────────
-def sort_events(events: List[NormalizedEvent], sort_by: str) -> List[NormalizedEvent]:
+def _datetime_key(e: NormalizedEvent) -> Tuple[datetime, str]:
+    # event.date ISO string parsed into datetime, ties broken by start_datetime
+    iso = e.date or ""
+    try:
+        dt = datetime.fromisoformat(iso)
+    except:
+        # fallback to date-only
+        try:
+            dt = datetime.fromisoformat(iso.split('T')[0] + 'T00:00:00')
+        except:
+            dt = datetime.min
+    return dt, e.start_datetime or ""
+
+def sort_key(sort_by: str) -> Tuple[Callable[[NormalizedEvent], Any], bool]:
     """
-    Sort events by price or by datetime (default).  Price sorting honors 'desc'.
+    Return (key, reverse) for the requested ordering: price (honoring 'desc')
+    or datetime (default).
     """
     if "price" in sort_by.lower():
         reverse = "desc" in sort_by.lower()
-        return sorted(events, key=lambda e: parse_price(e.price or ""), reverse=reverse)
+        return (lambda e: parse_price(e.price or "")), reverse
+    return _datetime_key, False
 
-    # Default: sort by event.date ISO string or parse into datetime
-    def _key(e: NormalizedEvent):
-        iso = e.date or ""
-        try:
-            return datetime.fromisoformat(iso)
-        except:
-            # fallback to date-only
-            try:
-                return datetime.fromisoformat(iso.split('T')[0] + 'T00:00:00')
-            except:
-                return datetime.min
+def sort_events(events: List[NormalizedEvent], sort_by: str) -> List[NormalizedEvent]:
+    """
+    Sort events by price or by datetime (default).  Price sorting honors 'desc'.
+    """
+    key, reverse = sort_key(sort_by)
+    return sorted(events, key=key, reverse=reverse)
 
-    return sorted(events, key=_key)
+def top_events(events: List[NormalizedEvent], sort_by: str, k: int) -> List[NormalizedEvent]:
+    """
+    The first k events of sort_events(events, sort_by), selected with a heap
+    in O(n log k) instead of sorting the whole list.
+    """
+    key, reverse = sort_key(sort_by)
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    return select(k, events, key=key)
+
+def order_events(events: List[NormalizedEvent], sort_by: str, limit: Optional[int] = None) -> List[NormalizedEvent]:
+    """
+    sort_events, cut to `limit` (heap-selected when that skips most of the list).
+    """
+    if limit is not None and limit < len(events):
+        return top_events(events, sort_by, limit)
+    return sort_events(events, sort_by)
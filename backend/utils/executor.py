@@ -0,0 +1,109 @@
+# backend/utils/executor.py
+
+"""
+Where per-item normalization runs, chosen by how much raw JSON one refresh
+has had to normalize so far (the `work` bytes, see fingerprint.Refresh):
+
+  - under NORMALIZE_THREAD_BYTES: inline on the event loop, as items arrive;
+    a few small items cost less than a handoff;
+  - under NORMALIZE_PROCESS_BYTES: a worker thread, so the loop gets the GIL
+    back every switch interval instead of waiting out the batch. A single
+    10-20 event upstream page gets here;
+  - larger: split across a process pool, so the CPU work (date parsing,
+    string building, pydantic validation) leaves this interpreter. Only
+    payloads of thousands of events get here, and only with at least two
+    pool workers; on one core a pool only adds pickling.
+
+`normalize` must be a module-level function so worker processes can import it.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, TypeVar
+
+from backend.config.settings import (
+    NORMALIZE_PROCESS_BYTES,
+    NORMALIZE_PROCESSES,
+    NORMALIZE_THREAD_BYTES,
+)
+from backend.utils.loggy import get_logger
+from backend.utils.metrics import metrics
+
+logger = get_logger("executor")
+
+T = TypeVar("T")
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _pool_size() -> int:
+    return NORMALIZE_PROCESSES or min(4, os.cpu_count() or 1)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        import multiprocessing  # deferred: only hosts that reach the process tier need it
+        # spawn, not fork: the parent has an event loop and logging threads
+        _pool = ProcessPoolExecutor(max_workers=_pool_size(), mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def map_items(normalize: Callable[[Any], T], items: List[Any]) -> List[T]:
+    return [normalize(item) for item in items]
+
+
+def choose_mode(work: int) -> str:
+    """
+    "inline", "thread" or "process" for a refresh that has normalized `work`
+    bytes of raw JSON so far.
+    """
+    if work < NORMALIZE_THREAD_BYTES:
+        return "inline"
+    if work < NORMALIZE_PROCESS_BYTES or _pool_size() < 2:
+        return "thread"
+    return "process"
+
+
+async def _in_processes(normalize: Callable[[Any], T], items: List[Any]) -> List[T]:
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    size = -(-len(items) // _pool_size())
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    results = await asyncio.gather(*(loop.run_in_executor(pool, map_items, normalize, c) for c in chunks))
+    return [r for chunk in results for r in chunk]
+
+
+async def normalize_items(normalize: Callable[[Any], T], items: List[Any], mode: str = "inline") -> List[T]:
+    """
+    `[normalize(item) for item in items]`, run inline, in a thread or in the
+    process pool. Order is preserved.
+    """
+    if not items:
+        return []
+    start = time.perf_counter()
+    if mode == "process":
+        try:
+            out = await _in_processes(normalize, items)
+        except BrokenProcessPool as e:
+            # A worker died (OOM, killed): rebuild next time, finish this batch here
+            logger.warning("Normalization pool broke (%s); falling back to a thread", e)
+            shutdown_pool()
+            mode = "thread"
+            out = await asyncio.to_thread(map_items, normalize, items)
+    elif mode == "thread":
+        out = await asyncio.to_thread(map_items, normalize, items)
+    else:
+        out = map_items(normalize, items)
+    metrics.inc("normalize.items", len(items), mode=mode)
+    metrics.observe("normalize.batch_seconds", time.perf_counter() - start, mode=mode)
+    return out
@@ -0,0 +1,205 @@
+# backend/utils/fingerprint.py
+
+"""
+Incremental normalization: remember a fast hash of each raw upstream item,
+keyed by its upstream id, next to the event it normalized to. On the next
+refresh only new or changed items are normalized again (through
+backend.utils.executor); unchanged ones reuse the previous NormalizedEvent.
+"""
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from backend.config.settings import NORMALIZE_DISPATCH_BYTES
+from backend.models.event import NormalizedEvent
+from backend.utils.executor import choose_mode, normalize_items
+from backend.utils.loggy import get_logger
+from backend.utils.metrics import metrics
+
+logger = get_logger("fingerprint")
+
+_PENDING = object()
+
+
+def fingerprint(item: Any) -> str:
+    """
+    Hash of a raw JSON item. Upstreams serialize keys in a stable order, so
+    repr() is a fast, good-enough canonical form; a reordering only costs one
+    extra normalization.
+    """
+    return _digest(repr(item))
+
+
+def _digest(raw: str) -> str:
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class RefreshStats:
+    """
+    added / changed / unchanged / removed compare the ids a scope returned
+    this time with the ids it returned last time, so a scope's size moves by
+    exactly added - removed. `reused` counts items whose previous event was
+    reused instead of normalized again, whichever scope first produced it.
+    """
+    added: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    reused: int = 0
+
+
+class FingerprintIndex:
+    """
+    Per-source index: upstream id → (raw fingerprint, normalized event), plus
+    the {id: fingerprint} each request scope (e.g. one upstream query) returned
+    last time, to count what changed for it. Both are LRU-bounded.
+    """
+
+    def __init__(self, source: str, maxsize: int = 50_000, max_scopes: int = 2048):
+        self.source = source
+        self.maxsize = maxsize
+        self.max_scopes = max_scopes
+        self._records: "OrderedDict[str, Tuple[str, NormalizedEvent]]" = OrderedDict()
+        self._scopes: "OrderedDict[Hashable, Dict[str, str]]" = OrderedDict()
+
+    def start(
+        self,
+        scope: Hashable,
+        id_of: Callable[[Dict[str, Any]], Optional[str]],
+        normalize: Callable[[Dict[str, Any]], Optional[NormalizedEvent]],
+    ) -> "Refresh":
+        """
+        Begin a refresh whose items arrive in pieces (e.g. streamed).
+        """
+        return Refresh(self, scope, id_of, normalize)
+
+    async def refresh(
+        self,
+        scope: Hashable,
+        items: Iterable[Dict[str, Any]],
+        id_of: Callable[[Dict[str, Any]], Optional[str]],
+        normalize: Callable[[Dict[str, Any]], Optional[NormalizedEvent]],
+    ) -> Tuple[List[NormalizedEvent], RefreshStats]:
+        """
+        Normalize `items` in order, reusing unchanged records. `normalize` may
+        return None for items it skips; those are retried on the next refresh.
+        """
+        run = self.start(scope, id_of, normalize)
+        out = await run.feed(items)
+        out.extend(await run.finish())
+        return out, run.stats
+
+    def _finish(self, scope: Hashable, seen: Dict[str, str], stats: RefreshStats) -> None:
+        previous = self._scopes.pop(scope, {})
+        stats.added = sum(1 for uid in seen if uid not in previous)
+        stats.removed = sum(1 for uid in previous if uid not in seen)
+        stats.changed = sum(1 for uid, fp in seen.items() if uid in previous and previous[uid] != fp)
+        stats.unchanged = len(seen) - stats.added - stats.changed
+        self._scopes[scope] = seen
+        while len(self._scopes) > self.max_scopes:
+            self._scopes.popitem(last=False)
+        while len(self._records) > self.maxsize:
+            self._records.popitem(last=False)
+        self._report(stats)
+
+    def _report(self, stats: RefreshStats) -> None:
+        for name in ("added", "changed", "unchanged", "removed", "reused"):
+            metrics.inc(f"normalize.{name}", getattr(stats, name), source=self.source)
+        logger.info(
+            "%s refresh: %d added, %d changed, %d unchanged, %d removed (%d reused)",
+            self.source, stats.added, stats.changed, stats.unchanged, stats.removed, stats.reused,
+        )
+
+
+class Refresh:
+    """
+    One pass over a scope's items; see FingerprintIndex.start. `work` counts
+    the raw bytes (their repr) of the items that needed normalizing, and picks
+    the executor tier. While it is small, items are normalized inline by the
+    feed() call that supplied them; once offloaded they are gathered
+    `dispatch_bytes` at a time, so events come back in item order but possibly
+    later than their feed() call.
+    """
+
+    def __init__(
+        self,
+        index: FingerprintIndex,
+        scope: Hashable,
+        id_of: Callable[[Dict[str, Any]], Optional[str]],
+        normalize: Callable[[Dict[str, Any]], Optional[NormalizedEvent]],
+        dispatch_bytes: int = NORMALIZE_DISPATCH_BYTES,
+    ):
+        self.index = index
+        self.scope = scope
+        self.id_of = id_of
+        self.normalize = normalize
+        self.dispatch_bytes = dispatch_bytes
+        self.stats = RefreshStats()
+        self.work = 0
+        self._pending_bytes = 0
+        self._seen: Dict[str, str] = {}  # id → fingerprint of the items that produced an event
+        # Events in item order; _PENDING marks items awaiting normalization
+        self._out: List[Any] = []
+        self._base = 0  # item position of _out[0]
+        # (position, upstream id, fingerprint, item) awaiting normalization
+        self._pending: List[Tuple[int, Optional[str], Optional[str], Dict[str, Any]]] = []
+
+    async def feed(self, items: Iterable[Dict[str, Any]]) -> List[NormalizedEvent]:
+        """
+        Add items; returns the events that are now ready, in item order.
+        Unchanged items reuse their previous record.
+        """
+        records = self.index._records
+        for item in items:
+            raw = repr(item)
+            uid = self.id_of(item)
+            fp = None
+            if uid is not None:
+                fp = _digest(raw)
+                record = records.get(uid)
+                if record is not None and record[0] == fp:
+                    records.move_to_end(uid)
+                    self._seen[uid] = fp
+                    self.stats.reused += 1
+                    self._out.append(record[1])
+                    continue
+            self._pending.append((self._base + len(self._out), uid, fp, item))
+            self._out.append(_PENDING)
+            self._pending_bytes += len(raw)
+            self.work += len(raw)
+
+        if self._pending_bytes >= self.dispatch_bytes or choose_mode(self.work) == "inline":
+            await self._flush()
+        return self._drain()
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        self._pending_bytes = 0
+        events = await normalize_items(self.normalize, [p[3] for p in pending], choose_mode(self.work))
+        records = self.index._records
+        for (pos, uid, fp, _), event in zip(pending, events):
+            self._out[pos - self._base] = event
+            if event is None or uid is None:
+                continue
+            self._seen[uid] = fp
+            records[uid] = (fp, event)
+            records.move_to_end(uid)
+
+    def _drain(self) -> List[NormalizedEvent]:
+        ready = self._pending[0][0] - self._base if self._pending else len(self._out)
+        out = [e for e in self._out[:ready] if e is not None]
+        del self._out[:ready]
+        self._base += ready
+        return out
+
+    async def finish(self) -> List[NormalizedEvent]:
+        """
+        Normalize what is still pending and return the remaining events, then
+        record which ids the scope returned this time and report the counts.
+        """
+        await self._flush()
+        out = self._drain()
+        self.index._finish(self.scope, self._seen, self.stats)
+        return out
@@ -1,30 +1,141 @@
 # backend/utils/http.py
 
 import asyncio
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional
 
 import httpx
 
-async def async_get(
+from backend.config.settings import UPSTREAM_CONCURRENCY, UPSTREAM_VALIDATOR_TTL
+from backend.utils.cache import TTLCache
+from backend.utils.jsonstream import ItemParser
+from backend.utils.metrics import metrics
+
+# request key → (etag, last_modified) of the last complete 200; the body isn't kept
+_stream_validators = TTLCache(ttl=UPSTREAM_VALIDATOR_TTL, maxsize=2048)
+
+# One pooled client per event loop: upstream connections (and their TLS
+# handshakes) are reused across fetches, searches and batches instead of being
+# re-opened for every request.
+_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+def get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        for stale in [l for l in _clients if l.is_closed()]:
+            del _clients[stale]
+        limits = httpx.Limits(max_connections=UPSTREAM_CONCURRENCY * 2, max_keepalive_connections=UPSTREAM_CONCURRENCY)
+        client = _clients[loop] = httpx.AsyncClient(limits=limits)
+    return client
+
+async def close_client() -> None:
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+def request_key(url: str, params: Optional[Dict[str, Any]] = None) -> Hashable:
+    """
+    Identity of a GET for caching purposes: the URL plus its sorted params.
+    """
+    return url, tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+
+
+class ItemStream:
+    """
+    The items of a streamed response, parsed as the body arrives. `modified`
+    is False on a 304, in which case iterating yields nothing.
+    """
+
+    def __init__(self, response: httpx.Response, path: str, key: Hashable):
+        self.response = response
+        self.path = path
+        self.key = key
+        self.modified = response.status_code != 304
+
+    async def batches(self) -> AsyncIterator[List[Any]]:
+        """
+        The items completed by each chunk of the body, as lists.
+        """
+        if not self.modified:
+            return
+        parser = ItemParser(self.path)
+        size = 0
+        async for chunk in self.response.aiter_bytes():
+            size += len(chunk)
+            items = parser.feed(chunk)
+            if items:
+                yield items
+        parser.close()
+        metrics.observe("upstream.streamed_bytes", size)
+
+        # Only a body that was read to the end is worth revalidating against
+        etag = self.response.headers.get("ETag")
+        last_modified = self.response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _stream_validators.set(self.key, (etag, last_modified))
+        else:
+            _stream_validators.delete(self.key)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async for items in self.batches():
+            for item in items:
+                yield item
+
+
+@asynccontextmanager
+async def async_get_stream(
     url: str,
+    path: str,
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, str]] = None,
     retries: int = 3,
     timeout: float = 10.0,
-) -> Any:
+    revalidate: bool = False,
+) -> AsyncIterator[ItemStream]:
     """
-    Perform an HTTP GET with simple retry/back-off.
-    Returns parsed JSON or raises on final failure.
+    GET with retry/back-off that yields the items of the JSON array at
+    `path` (e.g. "events[]" or "_embedded.events[]") as they arrive, so the
+    caller can normalize each one without the whole body in memory.
+
+        async with async_get_stream(url, "events[]", params) as stream:
+            async for item in stream:  # or stream.batches() for lists
+                ...
+
+    Connecting is retried with back-off; a failure mid-body raises. Since the
+    body isn't kept, pass revalidate=True only when the caller still has its
+    own result for this request to reuse on a 304 (stream.modified is False).
     """
+    key = request_key(url, params)
+    req_headers = dict(headers or {})
+    cached = _stream_validators.get(key) if revalidate else None
+    if cached:
+        etag, last_modified = cached
+        if etag:
+            req_headers["If-None-Match"] = etag
+        if last_modified:
+            req_headers["If-Modified-Since"] = last_modified
+
+    client = get_client()
     for attempt in range(1, retries + 1):
+        response = None
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url, params=params, headers=headers)
+            request = client.build_request("GET", url, params=params, headers=req_headers, timeout=timeout)
+            response = await client.send(request, stream=True)
+            if response.status_code == 304 and cached:
+                metrics.inc("upstream.not_modified")
+            else:
                 response.raise_for_status()
-                return response.json()
         except httpx.HTTPError as exc:
+            if response is not None:
+                await response.aclose()  # hand the connection back to the pool
             if attempt == retries:
                 raise RuntimeError(f"GET {url} failed after {retries} attempts: {exc}")
-            backoff = 2 ** attempt
-            await asyncio.sleep(backoff)
+            await asyncio.sleep(2 ** attempt)
+            continue
 
+        try:
+            yield ItemStream(response, path, key)
+        finally:
+            await response.aclose()
+        return
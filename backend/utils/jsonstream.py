@@ -0,0 +1,197 @@
+# backend/utils/jsonstream.py
+
+"""
+Incremental JSON parsing: pull the items of one array out of a document as
+its bytes arrive, without ever building the rest of the tree.
+
+    parser = ItemParser("_embedded.events[]")
+    for chunk in chunks:
+        for item in parser.feed(chunk):
+            ...
+    parser.close()
+
+Outside the array only the structure (brackets, strings, keys) is scanned;
+inside it each item is decoded by json's C scanner as soon as its text is
+complete, so peak memory is about one item plus one chunk instead of the
+whole body and its parsed tree.
+"""
+import codecs
+import json
+import re
+from typing import Any, List, Optional
+
+_STRUCTURAL = re.compile(r'[{}\[\]:,"]')
+_STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = re.compile(r"[0-9.eE+-]+")
+
+_OBJECT, _ARRAY = "{", "["
+# what the target array expects next
+_FIRST, _ITEM, _SEPARATOR = "first", "item", "separator"
+
+
+def parse_path(path: str) -> List[str]:
+    """
+    "_embedded.events[]" → ["_embedded", "events"]. The path must end in "[]"
+    and may only go through object keys.
+    """
+    if not path.endswith("[]"):
+        raise ValueError(f"Item path must end with '[]': {path!r}")
+    keys = path[:-2].split(".") if path[:-2] else []
+    if any(not k or "[" in k for k in keys):
+        raise ValueError(f"Unsupported item path: {path!r}")
+    return keys
+
+
+class _Frame:
+    __slots__ = ("kind", "key", "expect_key")
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.key: Optional[str] = None
+        self.expect_key = kind == _OBJECT
+
+
+class ItemParser:
+    """
+    Push parser for the items of the array at `path` ("events[]",
+    "_embedded.events[]", or "[]" for a top-level array). Anything outside
+    that array is skipped. Raises ValueError on malformed or truncated input.
+    """
+
+    def __init__(self, path: str):
+        self._keys = parse_path(path)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buf = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._in_items = False
+        self._expect = _FIRST
+        self._done = False
+
+    def _is_target(self) -> bool:
+        if len(self._stack) != len(self._keys):
+            return False
+        return all(f.kind == _OBJECT and f.key == k for f, k in zip(self._stack, self._keys))
+
+    def _close_container(self, kind: str) -> None:
+        if not self._stack or self._stack[-1].kind != kind:
+            raise ValueError("Unbalanced brackets in JSON document")
+        self._stack.pop()
+        if not self._stack:
+            self._done = True
+
+    def _scan_items(self, buf: str, pos: int, out: List[Any]) -> Optional[int]:
+        """
+        Decode items of the target array starting at `pos`. Returns where
+        scanning should resume once the array is closed, or None when the
+        buffer runs out first (self._pos is left at the incomplete part).
+        """
+        end = len(buf)
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos >= end:
+                break
+            ch = buf[pos]
+            if self._expect == _SEPARATOR:
+                if ch == ",":
+                    self._expect = _ITEM
+                    pos += 1
+                    continue
+                if ch != "]":
+                    raise ValueError("Expected ',' or ']' between array items")
+            if ch == "]":
+                if self._expect == _ITEM:
+                    raise ValueError("Trailing ',' in JSON array")
+                self._in_items = False
+                self._close_container(_ARRAY)
+                return pos + 1
+            try:
+                item, item_end = self._raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break  # item continues in the next chunk (or is malformed; see close)
+            # Only a following ',' or ']' proves the item is over
+            after = _WHITESPACE.match(buf, item_end).end()
+            if after >= end:
+                break  # "12" of "123": digits may still be to come
+            if buf[after] not in ",]":
+                if after == item_end and _NUMBER_CHARS.fullmatch(buf, item_end, end):
+                    break  # "1." of "1.5": the decoder stopped short of the rest
+                raise ValueError("Expected ',' or ']' between array items")
+            out.append(item)
+            self._expect = _SEPARATOR
+            pos = item_end
+        self._pos = pos
+        return None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Consume the next chunk of the body; returns the items it completed.
+        """
+        buf = self._buf + self._decoder.decode(chunk)
+        pos = self._pos
+        out: List[Any] = []
+        stack = self._stack
+
+        while True:
+            if self._in_items:
+                resume = self._scan_items(buf, pos, out)
+                if resume is None:
+                    pos = self._pos
+                    break
+                pos = resume
+                continue
+
+            m = _STRUCTURAL.search(buf, pos)
+            if m is None:
+                pos = len(buf)
+                break
+            ch, at = m.group(), m.start()
+
+            if ch == '"':
+                tail = _STRING_TAIL.match(buf, at + 1)
+                if tail is None:
+                    pos = at  # string continues in the next chunk
+                    break
+                pos = tail.end()
+                top = stack[-1] if stack else None
+                if top is not None and top.kind == _OBJECT and top.expect_key:
+                    top.key = json.loads(buf[at:pos])
+                continue
+
+            pos = at + 1
+            top = stack[-1] if stack else None
+            if ch == "[" and self._is_target():
+                stack.append(_Frame(_ARRAY))
+                self._in_items, self._expect = True, _FIRST
+            elif ch in "{[":
+                stack.append(_Frame(ch))
+            elif ch == "}":
+                self._close_container(_OBJECT)
+            elif ch == "]":
+                self._close_container(_ARRAY)
+            elif ch == ",":
+                if top is None:
+                    raise ValueError("Unexpected ',' in JSON document")
+                if top.kind == _OBJECT:
+                    top.expect_key, top.key = True, None
+            elif ch == ":":
+                if top is None or top.kind != _OBJECT:
+                    raise ValueError("Unexpected ':' in JSON document")
+                top.expect_key = False
+
+        # Drop what has been consumed
+        self._buf = buf[pos:]
+        self._pos = 0
+        return out
+
+    def close(self) -> None:
+        """
+        Check that the document ended cleanly.
+        """
+        rest = self._buf + self._decoder.decode(b"", final=True)
+        if self._in_items and rest.strip():
+            self._raw_decode(rest.strip())  # surfaces the decode error, if any
+        if self._stack or not self._done:
+            raise ValueError("Truncated JSON document")
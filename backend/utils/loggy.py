@@ -1,12 +1,184 @@
 # backend/utils/loggy.py
+
+"""
+Logging that stays off the request path.
+
+Records are put on a bounded queue and written by a background thread
+(QueueListener), so a burst of upstream noise never blocks the event loop on
+stderr; if the writer falls behind, records are dropped and counted instead.
+Before queueing, each record is tagged with the current request id and run
+through a per-message-key rate limiter: every key (logger + message template,
+or `extra={"log_key": ...}`) gets LOG_RATE_BURST records up front and
+LOG_RATE_PER_SEC after that, and only 1 in LOG_SAMPLE_EVERY of the excess is
+kept. The next record that gets through reports how many were suppressed.
+
+LOG_FORMAT=json writes one JSON object per line; "text" keeps the classic
+single-line format.
+"""
+import atexit
+import copy
+import json
 import logging
+import queue
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple
 
-# ONE-TIME root configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)-8s %(name)s %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+from backend.config.settings import (
+    LOG_FORMAT,
+    LOG_LEVEL,
+    LOG_QUEUE_SIZE,
+    LOG_RATE_BURST,
+    LOG_RATE_PER_SEC,
+    LOG_SAMPLE_EVERY,
 )
+from backend.utils.metrics import metrics
+
+# Set per HTTP request by RequestIdMiddleware; tasks and threads spawned while
+# handling the request inherit it.
+request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+_MAX_KEYS = 10_000  # rate-limit buckets kept before they are reset
+
+# LogRecord attributes that aren't user-supplied `extra` fields
+_STANDARD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id", "suppressed", "log_key"}
+
+
+# ─── RATE LIMITING & SAMPLING ───────────────────────────────────────────────────
+class RateLimitFilter(logging.Filter):
+    """
+    Token bucket per message key, with 1-in-N sampling of what overflows.
+    CRITICAL records always pass.
+    """
+
+    def __init__(self, burst: int, per_second: float, sample_every: int):
+        super().__init__()
+        self.burst = burst
+        self.per_second = per_second
+        self.sample_every = sample_every
+        # key → [tokens, last refill, records suppressed since the last one let through, overflow seen]
+        self._buckets: Dict[Tuple[Any, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.CRITICAL:
+            return True
+        key = getattr(record, "log_key", None) or (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= _MAX_KEYS:
+                    self._buckets.clear()
+                bucket = self._buckets[key] = [float(self.burst), now, 0, 0]
+            else:
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.per_second)
+                bucket[1] = now
+
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                keep = True
+            else:
+                bucket[3] += 1
+                keep = self.sample_every > 0 and bucket[3] % self.sample_every == 0
+            if not keep:
+                bucket[2] += 1
+                suppressed = 0
+            else:
+                suppressed, bucket[2] = bucket[2], 0
+
+        if not keep:
+            metrics.inc("log.suppressed")
+            return False
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+# ─── QUEUE ──────────────────────────────────────────────────────────────────────
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    Tags records with the request id, flattens them so the writer thread needs
+    nothing from the caller, and drops them (counted) when the queue is full.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.request_id = request_id.get()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.inc("log.dropped")
+
+
+# ─── FORMATTERS ─────────────────────────────────────────────────────────────────
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        out: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            out["request_id"] = record.request_id
+        if getattr(record, "suppressed", 0):
+            out["suppressed"] = record.suppressed
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRS:
+                out[key] = value
+        if record.exc_text:
+            out["exc"] = record.exc_text
+        return json.dumps(out, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-8s %(name)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        line = super().formatMessage(record)
+        if getattr(record, "request_id", None):
+            line += f" [req={record.request_id}]"
+        if getattr(record, "suppressed", 0):
+            line += f" (+{record.suppressed} similar suppressed)"
+        return line
+
+
+# ─── SETUP ──────────────────────────────────────────────────────────────────────
+def _configure() -> QueueListener:
+    writer = logging.StreamHandler(sys.stderr)
+    writer.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else TextFormatter())
+
+    handler = _NonBlockingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+    handler.addFilter(RateLimitFilter(LOG_RATE_BURST, LOG_RATE_PER_SEC, LOG_SAMPLE_EVERY))
+
+    # ONE-TIME root configuration
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(LOG_LEVEL)
+
+    listener = QueueListener(handler.queue, writer, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # flush what's queued on exit
+    return listener
+
+_listener = _configure()
 
 # quiet httpx internals
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -14,3 +186,35 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
+
+# ─── REQUEST IDS ────────────────────────────────────────────────────────────────
+class RequestIdMiddleware:
+    """
+    ASGI middleware: takes the caller's X-Request-ID (or makes one), exposes it
+    to logging for the rest of the request, and echoes it on the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        rid = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                rid = value.decode("latin-1")[:64]
+                break
+        rid = rid or uuid.uuid4().hex[:16]
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), (b"x-request-id", rid.encode("latin-1"))]
+            await send(message)
+
+        token = request_id.set(rid)
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            request_id.reset(token)
@@ -0,0 +1,28 @@
+# backend/utils/loop_monitor.py
+
+"""
+Event-loop lag: a probe sleeps LOOP_LAG_INTERVAL and measures how late it
+wakes up. Anything blocking the loop (CPU-heavy work, sync I/O) shows up as
+lag, which is reported to /metrics as `loop.lag_seconds` (avg/max/p50/p99).
+"""
+import asyncio
+
+from backend.config.settings import LOOP_LAG_INTERVAL, LOOP_LAG_WARN
+from backend.utils.loggy import get_logger
+from backend.utils.metrics import metrics
+
+logger = get_logger("loop_monitor")
+
+
+async def monitor_loop_lag(interval: float = LOOP_LAG_INTERVAL, warn: float = LOOP_LAG_WARN) -> None:
+    """
+    Run until cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - start - interval)
+        metrics.observe("loop.lag_seconds", lag)
+        if lag >= warn:
+            logger.warning("Event loop blocked for %.0f ms", lag * 1000)
@@ -0,0 +1,93 @@
+# backend/utils/metrics.py
+
+"""
+Minimal in-process metrics: labelled counters plus observations summarized as
+count / sum / max and recent-window percentiles. Exposed at GET /metrics.
+"""
+from collections import deque
+from threading import Lock
+from typing import Any, Deque, Dict, Tuple
+
+_WINDOW = 1024  # observations kept per series for percentiles
+
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, Any]) -> SeriesKey:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _label(key: SeriesKey) -> str:
+    name, labels = key
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+
+
+class _Summary:
+    __slots__ = ("count", "total", "max", "recent")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: Deque[float] = deque(maxlen=_WINDOW)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+    def snapshot(self) -> Dict[str, float]:
+        ordered = sorted(self.recent)
+
+        def pct(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0.0
+
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "avg": round(self.total / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "p50": round(pct(0.50), 6),
+            "p99": round(pct(0.99), 6),
+        }
+
+
+class Metrics:
+    """
+    Thread-safe, since encoders and normalizers may report from worker threads.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._counters: Dict[SeriesKey, float] = {}
+        self._summaries: Dict[SeriesKey, _Summary] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is None:
+                summary = self._summaries[key] = _Summary()
+            summary.add(value)
+
+    def counter(self, name: str, **labels: Any) -> float:
+        with self._lock:
+            return self._counters.get(_key(name, labels), 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "counters": {_label(k): v for k, v in sorted(self._counters.items())},
+                "summaries": {_label(k): s.snapshot() for k, s in sorted(self._summaries.items())},
+            }
+
+
+metrics = Metrics()
@@ -0,0 +1,106 @@
+# backend/utils/pagination.py
+
+"""
+Cursor pagination over cached result snapshots.
+
+The first page of a search is selected with a heap (top-k) and the filtered
+result set is parked as a snapshot. Later pages are sliced from that snapshot,
+which is sorted at most once per worker, so paging never re-fetches or re-sorts.
+
+Snapshots live in the "snapshots" namespace of the configured CACHE_BACKEND,
+so a cursor one worker issued can be served by any other. Each worker also
+keeps the snapshots it has decoded, so paging doesn't decode one again per page.
+"""
+import base64
+import secrets
+from typing import List, Optional, Tuple
+
+from backend.cache.factory import make_cache
+from backend.config.settings import SNAPSHOT_TTL
+from backend.models.event import NormalizedEvent
+from backend.utils.cache import TTLCache
+from backend.utils.event_utils import sort_events, top_events
+
+
+class ResultSnapshot:
+    """
+    A filtered (not yet sorted) result set plus the ordering it is paged in.
+    """
+
+    def __init__(self, events: List[NormalizedEvent], sort_by: str):
+        self.events = events
+        self.sort_by = sort_by
+        self._sorted: Optional[List[NormalizedEvent]] = None
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def page(self, offset: int, limit: int) -> List[NormalizedEvent]:
+        if self._sorted is None:
+            if offset == 0 and limit < len(self.events):
+                return top_events(self.events, self.sort_by, limit)
+            self._sorted = sort_events(self.events, self.sort_by)
+        return self._sorted[offset:offset + limit]
+
+
+_snapshots = make_cache("snapshots", ttl=SNAPSHOT_TTL, maxsize=1024)
+
+# This worker's decoded (and, once paged past the first page, sorted) copies
+_local = TTLCache(ttl=SNAPSHOT_TTL, maxsize=64)
+
+
+async def save_snapshot(snapshot: ResultSnapshot, snapshot_id: Optional[str] = None) -> str:
+    """
+    Park a snapshot and return its id. Pass a content-derived `snapshot_id` to
+    make identical result sets share one snapshot (and one set of cursors).
+    """
+    snapshot_id = snapshot_id or secrets.token_urlsafe(9)
+    await _snapshots.set(snapshot_id, snapshot)
+    _local.set(snapshot_id, snapshot)
+    return snapshot_id
+
+
+async def get_snapshot(snapshot_id: str) -> Optional[ResultSnapshot]:
+    snapshot = _local.get(snapshot_id)
+    if snapshot is None:
+        snapshot = await _snapshots.get(snapshot_id)
+        if snapshot is not None:
+            _local.set(snapshot_id, snapshot)
+    return snapshot
+
+
+def encode_cursor(snapshot_id: str, offset: int) -> str:
+    raw = f"{snapshot_id}:{offset}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Inverse of encode_cursor. Raises ValueError on a malformed cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        snapshot_id, offset = base64.urlsafe_b64decode(padded).decode().rsplit(":", 1)
+        offset_val = int(offset)
+    except Exception as exc:
+        raise ValueError(f"Malformed cursor: {cursor!r}") from exc
+    if offset_val < 0:
+        raise ValueError(f"Malformed cursor: {cursor!r}")
+    return snapshot_id, offset_val
+
+
+def paginate(
+    snapshot: ResultSnapshot,
+    snapshot_id: str,
+    offset: int,
+    limit: int,
+) -> Tuple[List[NormalizedEvent], Optional[str]]:
+    """
+    Return one page and the cursor for the next one (None on the last page).
+    """
+    return snapshot.page(offset, limit), next_page_cursor(snapshot, snapshot_id, offset, limit)
+
+
+def next_page_cursor(snapshot: ResultSnapshot, snapshot_id: str, offset: int, limit: int) -> Optional[str]:
+    next_offset = offset + limit
+    return encode_cursor(snapshot_id, next_offset) if next_offset < len(snapshot) else None
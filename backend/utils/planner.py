@@ -0,0 +1,165 @@
+# backend/utils/planner.py
+
+"""
+Interest planning: split a raw interest string into canonical keywords, fetch
+every (source, keyword) pair independently and concurrently, and merge the results.
+
+Each (source, city, keyword) result is cached on its own, so "jazz" and
+"jazz comedy" share the upstream "jazz" fetch instead of each going upstream.
+"""
+import asyncio
+import importlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from backend.config.settings import (
+    EVENT_CACHE_TTL,
+    MAX_INTEREST_KEYWORDS,
+    SNAPSHOT_TTL,
+    UPSTREAM_CONCURRENCY,
+)
+from backend.cache.factory import make_cache
+from backend.models.event import NormalizedEvent
+from backend.utils.event_utils import event_id, get_keywords
+from backend.utils.loggy import get_logger
+
+logger = get_logger("planner")
+
+Loader = Callable[[str, str], Awaitable[List[NormalizedEvent]]]
+
+# Source name → (module, loader(city, keyword)); loaders are imported on first use
+SOURCES: Dict[str, Tuple[str, str]] = {
+    "SeatGeek": ("backend.loaders.seatgeek_loader", "fetch_seatgeek_events"),
+    "Ticketmaster": ("backend.loaders.ticketmaster_loader", "fetch_ticketmaster_events"),
+}
+
+_loaders: Dict[str, Loader] = {}
+
+# Called with (source, city key, keyword) each time fresh upstream results
+# land in the cache; see add_refresh_listener
+RefreshListener = Callable[[str, str, str], None]
+_refresh_listeners: List[RefreshListener] = []
+
+# Caps loader calls in flight across every search and batch in this process
+_upstream_slots = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+
+# On a shared CACHE_BACKEND, workers also share these, and only one worker
+# refreshes a given (source, city, keyword) at a time.
+_event_cache = make_cache("events", ttl=EVENT_CACHE_TTL, maxsize=4096)
+
+# Event id → event, for detail lookups; outlives the result cache so that
+# ids handed out in a paginated snapshot stay resolvable.
+_event_index = make_cache("event_index", ttl=max(EVENT_CACHE_TTL, SNAPSHOT_TTL), maxsize=100_000)
+
+
+def get_loader(source: str) -> Loader:
+    loader = _loaders.get(source)
+    if loader is None:
+        module, attr = SOURCES[source]
+        loader = _loaders[source] = getattr(importlib.import_module(module), attr)
+    return loader
+
+
+def normalize_city(city: str) -> str:
+    return " ".join(city.lower().split())
+
+
+def plan_keywords(interest: str) -> List[str]:
+    """
+    Turn a raw interest string into the canonical keywords to search for.
+    An empty interest plans a single unfiltered search ("").
+    """
+    interest = interest.strip()
+    if not interest:
+        return [""]
+    return get_keywords(interest)[:MAX_INTEREST_KEYWORDS] or [""]
+
+
+def plan_requests(city: str, interest: str) -> List[Tuple[str, str, str]]:
+    """
+    Every (source, city, keyword) fetch needed to answer one search.
+    """
+    city_key = normalize_city(city)
+    return [(source, city_key, kw) for kw in plan_keywords(interest) for source in SOURCES]
+
+
+async def fetch_source_keyword(source: str, city: str, keyword: str) -> List[NormalizedEvent]:
+    """
+    Fetch one source for one keyword, served from cache when possible.
+    """
+    loader = get_loader(source)
+    city_key = normalize_city(city)
+    key = f"{source}|{city_key}|{keyword}"
+
+    async def fetch() -> List[NormalizedEvent]:
+        async with _upstream_slots:
+            events = await loader(city, keyword)
+        await index_events(events)
+        return events
+
+    # Empty results aren't cached, so they are not news to anyone
+    return await _event_cache.get_or_fetch(
+        key, fetch, on_stored=lambda _: _notify_refresh(source, city_key, keyword)
+    )
+
+
+def add_refresh_listener(listener: RefreshListener) -> None:
+    """
+    Have `listener(source, city key, keyword)` called whenever this worker
+    caches fresh, non-empty results for that triple. It runs on the event
+    loop, in the task that fetched them, and must not block.
+    """
+    _refresh_listeners.append(listener)
+
+
+def remove_refresh_listener(listener: RefreshListener) -> None:
+    if listener in _refresh_listeners:
+        _refresh_listeners.remove(listener)
+
+
+def _notify_refresh(source: str, city_key: str, keyword: str) -> None:
+    for listener in list(_refresh_listeners):
+        try:
+            listener(source, city_key, keyword)
+        except Exception as e:
+            logger.warning("Refresh listener failed: %s", e)
+
+
+async def index_events(events: List[NormalizedEvent]) -> None:
+    """
+    Give every event its stable id and make it resolvable via get_event.
+    """
+    for e in events:
+        e.id = event_id(e)
+    await _event_index.set_many({e.id: e for e in events})
+
+
+async def get_event(eid: str) -> Optional[NormalizedEvent]:
+    return await _event_index.get(eid)
+
+
+async def fetch_for_interest(city: str, interest: str) -> List[NormalizedEvent]:
+    """
+    Fan out over every planned (source, keyword) pair and return the union of
+    their results, in keyword then source order. Failed fetches are logged and
+    skipped; callers dedupe the union.
+    """
+    plan = plan_requests(city, interest)
+    logger.info("Planner ▶ city=%r interest=%r → %d fetches", city, interest, len(plan))
+    results = await asyncio.gather(
+        *(fetch_source_keyword(source, city, kw) for source, _, kw in plan),
+        return_exceptions=True,
+    )
+    return merge_results(plan, results)
+
+
+def merge_results(plan: List[Tuple[str, str, str]], results: List[Any]) -> List[NormalizedEvent]:
+    """
+    Flatten gathered fetch results in plan order, logging and skipping failures.
+    """
+    combined: List[NormalizedEvent] = []
+    for (source, _, kw), r in zip(plan, results):
+        if isinstance(r, Exception):
+            logger.warning("%s error for keyword %r: %s", source, kw, r)
+        else:
+            combined.extend(r)
+    return combined
@@ -0,0 +1,210 @@
+# backend/utils/subscriptions.py
+
+"""
+Live saved-search subscriptions for GET /events/subscribe.
+
+Subscribers to the same search (city, interest and filters) share one
+SharedSearch: a single background task re-runs the search through the
+planner's cache and publishes the result when it changed. It re-runs as soon
+as another request caches fresh upstream results for one of the search's
+(city, keyword) pairs, and otherwise every SUBSCRIPTION_REFRESH seconds,
+which is what brings in new data once the cached source data is due (or when
+another worker refreshed a shared cache).
+
+Each subscriber remembers the {event id: digest} it was last sent and
+receives only what was added, changed or removed since. A slow subscriber
+simply skips intermediate versions and is diffed against the latest one.
+
+The task stops when its last subscriber leaves.
+"""
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from backend.config.settings import SUBSCRIPTION_HEARTBEAT, SUBSCRIPTION_REFRESH
+from backend.models.event import NormalizedEvent
+from backend.utils.event_utils import (
+    event_digest, filter_events, project_event, result_set_digest, sort_events,
+)
+from backend.utils.loggy import get_logger, request_id
+from backend.utils.metrics import metrics
+from backend.utils.planner import (
+    add_refresh_listener, fetch_for_interest, normalize_city, plan_keywords,
+    plan_requests, remove_refresh_listener,
+)
+
+logger = get_logger("subscriptions")
+
+Snapshot = Dict[str, Tuple[str, NormalizedEvent]]  # event id → (digest, event)
+
+# The SharedSearch whose refresh task (and its fetches) is running, so a
+# search isn't woken by the results it fetched itself
+_refreshing: ContextVar[Optional["SharedSearch"]] = ContextVar("refreshing", default=None)
+
+
+@dataclass(frozen=True)
+class SearchSpec:
+    city: str
+    interest: str
+    min_price: float
+    max_price: float
+    radius: float
+    date: str
+
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        # Searches that plan the same keywords share a refresh
+        return (
+            normalize_city(self.city), tuple(plan_keywords(self.interest)),
+            self.min_price, self.max_price, self.radius, self.date,
+        )
+
+
+class SharedSearch:
+    """
+    One search, refreshed once for all of its subscribers.
+    """
+
+    def __init__(self, spec: SearchSpec, coords: Tuple[float, float]):
+        self.spec = spec
+        self.coords = coords
+        self.subscribers = 0
+        self.version = 0
+        self.snapshot: Snapshot = {}
+        self._digest: Optional[str] = None
+        self._updated = asyncio.Event()
+        self._due = asyncio.Event()  # set when the planner refreshed one of our fetches
+        self._scopes = {(city, kw) for _, city, kw in plan_requests(spec.city, spec.interest)}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        add_refresh_listener(self._on_refresh)
+        self._task = asyncio.create_task(self._refresh_loop())
+
+    def stop(self) -> None:
+        remove_refresh_listener(self._on_refresh)
+        if self._task is not None:
+            self._task.cancel()
+
+    def _on_refresh(self, source: str, city: str, keyword: str) -> None:
+        if (city, keyword) in self._scopes and _refreshing.get() is not self:
+            self._due.set()
+
+    async def _search(self) -> List[NormalizedEvent]:
+        s = self.spec
+        combined = await fetch_for_interest(s.city, s.interest)
+        return filter_events(combined, self.coords, s.min_price, s.max_price, s.radius, s.date)
+
+    def _publish(self, events: List[NormalizedEvent]) -> None:
+        digest = result_set_digest(events)
+        if digest == self._digest:
+            return
+        self._digest = digest
+        self.snapshot = {e.id: (event_digest(e), e) for e in events}
+        self.version += 1
+        # Wake everyone waiting on this version; later waiters get a fresh event
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    async def _refresh_loop(self) -> None:
+        request_id.set(None)  # not tied to the request that happened to start it
+        _refreshing.set(self)
+        while True:
+            self._due.clear()
+            try:
+                events = await self._search()
+            except Exception as e:
+                logger.warning("Subscription refresh failed for %r: %s", self.spec.city, e)
+            else:
+                metrics.inc("subscriptions.refreshes")
+                self._publish(events)
+            try:
+                await asyncio.wait_for(self._due.wait(), SUBSCRIPTION_REFRESH)
+            except asyncio.TimeoutError:
+                pass
+
+    async def wait(self, seen_version: int, timeout: float) -> bool:
+        """
+        Wait up to `timeout` for a version newer than `seen_version`.
+        """
+        if self.version != seen_version:
+            return True
+        try:
+            await asyncio.wait_for(self._updated.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+_searches: Dict[Tuple[Any, ...], SharedSearch] = {}
+
+
+def _diff(sent: Dict[str, str], snapshot: Snapshot) -> Tuple[List[NormalizedEvent], List[NormalizedEvent], List[str]]:
+    added, changed = [], []
+    for eid, (digest, event) in snapshot.items():
+        previous = sent.get(eid)
+        if previous is None:
+            added.append(event)
+        elif previous != digest:
+            changed.append(event)
+    removed = [eid for eid in sent if eid not in snapshot]
+    return added, changed, removed
+
+
+async def subscribe(
+    spec: SearchSpec,
+    coords: Tuple[float, float],
+    fields: Tuple[str, ...],
+) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """
+    Yield a diff message each time the shared search's result set changes:
+    {"added": [...], "changed": [...], "removed": [ids], "total": n}, events
+    projected to `fields`. The first message has everything under "added".
+    Yields None every SUBSCRIPTION_HEARTBEAT seconds without a change, so the
+    caller can keep the connection alive.
+    """
+    key = spec.key
+    search = _searches.get(key)
+    if search is None:
+        search = _searches[key] = SharedSearch(spec, coords)
+        search.start()
+    search.subscribers += 1
+    metrics.inc("subscriptions.opened")
+    logger.info("Subscribe ▶ %r (%d subscribers)", spec.city, search.subscribers)
+
+    sent: Optional[Dict[str, str]] = None  # None until the first message
+    seen_version = 0
+    try:
+        while True:
+            if not await search.wait(seen_version, SUBSCRIPTION_HEARTBEAT):
+                yield None
+                continue
+            seen_version, snapshot = search.version, search.snapshot
+            added, changed, removed = _diff(sent or {}, snapshot)
+            if sent is not None and not (added or changed or removed):
+                continue
+            sent = {eid: digest for eid, (digest, _) in snapshot.items()}
+            metrics.inc("subscriptions.pushes")
+            metrics.observe("subscriptions.diff_events", len(added) + len(changed) + len(removed))
+            yield {
+                "added": [project_event(e, fields) for e in sort_events(added, "")],
+                "changed": [project_event(e, fields) for e in sort_events(changed, "")],
+                "removed": removed,
+                "total": len(snapshot),
+            }
+    finally:
+        search.subscribers -= 1
+        if search.subscribers == 0:
+            search.stop()
+            if _searches.get(key) is search:
+                del _searches[key]
+
+
+def close_subscriptions() -> None:
+    """
+    Stop every shared refresh (on shutdown).
+    """
+    for search in _searches.values():
+        search.stop()
+    _searches.clear()
@@ -0,0 +1,156 @@
+# backend/utils/warm_state.py
+
+"""
+Warm restarts: registered in-memory caches (geocodes, recent result sets) are
+pickled to WARM_STATE_PATH on shutdown and reloaded at boot, with each entry's
+remaining TTL shortened by the downtime. Readiness flips once the reload is done.
+
+The snapshot is read and unpickled in a worker thread, then applied to the
+caches on the event loop, skipping keys that were filled in the meantime.
+Requests that need those caches wait for the reload instead of going upstream.
+Since unpickling runs code, a snapshot is only read from a file owned by this
+user in a directory no one else can write to.
+"""
+import asyncio
+import os
+import pickle
+import stat
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config.settings import WARM_STATE_PATH
+from backend.utils.cache import TTLCache
+from backend.utils.loggy import get_logger
+
+logger = get_logger("warm_state")
+
+Entries = List[Tuple[Any, float, Any]]  # (key, seconds left, value)
+
+_caches: Dict[str, TTLCache] = {}
+
+_status: Dict[str, Any] = {"ready": False, "restored": {}, "load_seconds": None}
+
+_loaded: Optional[asyncio.Event] = None  # set once warm_up has finished
+
+
+def register_cache(name: str, cache: TTLCache) -> None:
+    _caches[name] = cache
+
+
+def _private(path: str) -> bool:
+    """
+    True if `path` and its directory belong to this user and nobody else can
+    write to them.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    uid = os.getuid()
+    for st in (os.stat(path), os.stat(os.path.dirname(path))):
+        if st.st_uid != uid or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return False
+    return True
+
+
+def save(path: str = WARM_STATE_PATH) -> int:
+    """
+    Write every registered cache to `path` atomically; returns the entry count.
+    """
+    if not path:
+        return 0
+    state = {
+        "saved_at": time.time(),
+        "caches": {name: cache.dump() for name, cache in _caches.items()},
+    }
+    os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as fh:
+        pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    return sum(len(entries) for entries in state["caches"].values())
+
+
+def read(path: str = WARM_STATE_PATH) -> Dict[str, Entries]:
+    """
+    The snapshot at `path` as {cache name: entries}, TTLs shortened by the
+    downtime. Touches no cache, so it is safe to run in a thread.
+    """
+    path = os.path.abspath(path) if path else path
+    if not path or not os.path.exists(path):
+        return {}
+    if not _private(path):
+        raise PermissionError(f"{path} is writable by other users; not loading it")
+    with open(path, "rb") as fh:
+        state = pickle.load(fh)
+    downtime = max(0.0, time.time() - state.get("saved_at", 0.0))
+    return {
+        name: [(k, ttl - downtime, v) for k, ttl, v in entries]
+        for name, entries in state.get("caches", {}).items()
+    }
+
+
+def restore(snapshot: Dict[str, Entries]) -> Dict[str, int]:
+    """
+    Apply what `read` returned to the registered caches (on the event loop);
+    returns the entries restored per cache.
+    """
+    return {
+        name: _caches[name].load(entries)
+        for name, entries in snapshot.items() if name in _caches
+    }
+
+
+def _loaded_event() -> asyncio.Event:
+    global _loaded
+    if _loaded is None:
+        _loaded = asyncio.Event()
+    return _loaded
+
+
+def start_warm_up(path: str = WARM_STATE_PATH) -> asyncio.Task:
+    """
+    Begin warm_up in the background; from here on, wait_loaded waits for it.
+    """
+    _loaded_event()
+    return asyncio.create_task(warm_up(path))
+
+
+async def warm_up(path: str = WARM_STATE_PATH) -> None:
+    """
+    Reload the snapshot off the event loop, then mark the worker ready. A
+    missing or unreadable snapshot just means a cold start.
+    """
+    loaded = _loaded_event()
+    start = time.perf_counter()
+    try:
+        _status["restored"] = restore(await asyncio.to_thread(read, path))
+    except Exception as e:
+        logger.warning("Could not restore warm state from %s: %s", path, e)
+    finally:
+        loaded.set()
+    _status["load_seconds"] = round(time.perf_counter() - start, 4)
+    _status["ready"] = True
+    logger.info("Warm state restored in %.3fs: %s", _status["load_seconds"], _status["restored"])
+
+
+async def wait_loaded() -> None:
+    """
+    Wait for a warm_up in progress, so a request doesn't refetch what the
+    snapshot is about to restore. Returns at once if none was started.
+    """
+    if _loaded is not None and not _loaded.is_set():
+        await _loaded.wait()
+
+
+def shutdown(path: str = WARM_STATE_PATH) -> None:
+    try:
+        count = save(path)
+        logger.info("Warm state saved to %s (%d entries)", path, count)
+    except Exception as e:
+        logger.warning("Could not save warm state to %s: %s", path, e)
+
+
+def readiness() -> Dict[str, Any]:
+    return {
+        **_status,
+        "cached": {name: len(cache) for name, cache in _caches.items()},
+    }
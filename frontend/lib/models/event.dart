@@ -1,8 +1,10 @@
 // lib/models/event.dart
 
 class Event {
+  final String? id;           // stable "<source>:<upstream id>"
   final String title;
   final String description;
+  final String snippet;       // short preview shipped with the summary view
   final String location;
   final String price;
   final String date;          // YYYY-MM-DD
@@ -27,8 +29,10 @@ class Event {
   final String? parkingDetail;
 
   Event({
+    this.id,
     required this.title,
     required this.description,
+    this.snippet = '',
     required this.location,
     required this.price,
     required this.date,
@@ -52,8 +56,10 @@ class Event {
   });
 
   factory Event.fromJson(Map<String, dynamic> j) => Event(
+        id: j['id'] as String?,
         title: j['title'] as String? ?? 'No Title',
         description: j['description'] as String? ?? '',
+        snippet: j['snippet'] as String? ?? '',
         location: j['location'] as String? ?? '',
         price: j['price'] as String? ?? '',
         date: j['date'] as String? ?? '',
@@ -77,8 +83,10 @@ class Event {
       );
 
   Map<String, dynamic> toJson() => {
+        'id': id,
         'title': title,
         'description': description,
+        'snippet': snippet,
         'location': location,
         'price': price,
         'date': date,
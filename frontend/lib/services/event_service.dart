@@ -25,6 +25,17 @@ class EventService {
     return data.map((j) => Event.fromJson(j)).toList();
   }
 
+  /// Fetches the full record (description, box office, parking) for one
+  /// event from the compact `/events/all` list.
+  static Future<Event> fetchEventDetail(String id) async {
+    final uri = Uri.parse('$kApiBaseUrl/events/${Uri.encodeComponent(id)}');
+    final res = await http.get(uri);
+    if (res.statusCode != 200) {
+      throw Exception('Failed to load event details (${res.statusCode})');
+    }
+    return Event.fromJson(json.decode(res.body) as Map<String, dynamic>);
+  }
+
   /// Fetch only SeatGeek events
   static Future<List<Event>> fetchSeatGeekEvents({
     required String city,
@@ -6,6 +6,7 @@ import 'package:url_launcher/url_launcher.dart';
 import 'package:html_unescape/html_unescape.dart';
 import 'package:intl/intl.dart';
 import '../models/event.dart';
+import '../services/event_service.dart';
 import '../widgets/widgets_helpers.dart';
 
 class EventCard extends StatefulWidget {
@@ -19,6 +20,21 @@ class EventCard extends StatefulWidget {
 class _EventCardState extends State<EventCard> {
   final _unescaper = HtmlUnescape();
   bool _showBack = false;
+  Event? _detail; // full record, fetched on first flip
+
+  Event get _event => _detail ?? widget.event;
+
+  Future<void> _toggle() async {
+    setState(() => _showBack = !_showBack);
+    final id = widget.event.id;
+    if (!_showBack || _detail != null || id == null) return;
+    try {
+      final detail = await EventService.fetchEventDetail(id);
+      if (mounted) setState(() => _detail = detail);
+    } catch (_) {
+      // keep showing the summary fields
+    }
+  }
 
   Future<void> _launchUrl() async {
     final url = widget.event.ticketUrl;
@@ -78,7 +94,7 @@ class _EventCardState extends State<EventCard> {
   @override
   Widget build(BuildContext context) {
     return InkWell(
-      onTap: () => setState(() => _showBack = !_showBack),
+      onTap: _toggle,
       borderRadius: BorderRadius.circular(16),
       child: Card(
         elevation: 6,
@@ -101,7 +117,7 @@ class _EventCardState extends State<EventCard> {
   }
 
   Widget _buildFront() {
-    final e = widget.event;
+    final e = _event;
     String? dateTimeLabel;
     if (e.startDatetime.isNotEmpty) {
       dateTimeLabel = _formatDateWithTime(e.startDatetime);
@@ -112,7 +128,8 @@ class _EventCardState extends State<EventCard> {
         dateTimeLabel = e.date;
       }
     }
-    final hasDescription = e.description.isNotEmpty;
+    // The list view ships only a snippet; the full description arrives with the details
+    final preview = e.description.isNotEmpty ? e.description : e.snippet;
 
     return Column(
       crossAxisAlignment: CrossAxisAlignment.start,
@@ -183,10 +200,10 @@ class _EventCardState extends State<EventCard> {
         ),
 
         // Description
-        if (hasDescription) ...[
+        if (preview.isNotEmpty) ...[
           const SizedBox(height: 12),
           Text(
-            _cleanDescription(e.description),
+            _cleanDescription(preview),
             style: GoogleFonts.poppins(fontSize: 14, color: Colors.black87),
             maxLines: 3,
             overflow: TextOverflow.ellipsis,
@@ -231,7 +248,7 @@ class _EventCardState extends State<EventCard> {
   }
 
   Widget _buildBack() {
-    final e = widget.event;
+    final e = _event;
     final tiles = <Widget>[];
     final seen = <String>{};
 